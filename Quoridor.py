@@ -13,10 +13,46 @@
 # is on the edge of the board, and whether there is a fence on that side, and also tracks whether a pawn is present in
 # the cell.
 #
+# The FlatBoard class is an alternate board with the same methods as Board. It packs the fences into a flat bytearray
+# with a horizontal and a vertical fence plane, and the pawns into a second bytearray, and is selected with
+# QuoridorGame(FlatBoard). The CompactBoard class is a Board whose cells are CompactCell objects, which use __slots__
+# and pack the four sides and the pawn of a cell into the bits of one integer; it is selected with
+# QuoridorGame(CompactBoard) and uses about half the memory per game of Board.
+#
+# Every position has a 64-bit Zobrist hash, returned by get_hash, that covers the pawns, the fences, the fences each
+# player has left, and whose turn it is. It is updated with a few XORs on every move. A position can be saved as a few
+# bytes with to_bytes and restored with QuoridorGame.from_bytes, and moves can be written in move notation (e.g., e2 for
+# a pawn move, e3h for a fence) with to_notation and from_notation.
+#
+# A position can also be taken out of a game as a GameState with get_state: an immutable, hashable tuple that is cheap
+# to pickle and can be used as a dictionary key, so it can be shared between threads or sent to worker processes. The
+# pure functions legal_moves and apply_move play moves on GameStates without a QuoridorGame, using the same pawn move
+# rules (pawn_targets), fence slots and goal lines as the game, and from_state turns a GameState back into a game.
+#
+# Each player also has a DistanceMap, which holds the number of steps from every cell to that player's goal row. The
+# maps are updated incrementally whenever a fence is placed, and are used to enforce the fair-play rule: a fence may not
+# cut off every path from a pawn to its goal row.
+#
+# Results of legality checks are cached for the current position, so a bot or UI that tries the same move again, or
+# asks for the legal fences twice in one turn, gets the earlier result. The cache is tied to an epoch counter that every
+# move bumps, and is cleared the next time it is used in a new position.
+#
+# The board is 9x9 with two players by default, but QuoridorGame also takes a smaller board size and a player count of
+# 4. The neighbor table, fence slots and goal lines of each size are built once and shared by every game of that size.
+#
 # See the following link for game rules:
 # https://en.gigamic.com/files/media/fiche_pedagogique/educative-sheet_quoridor-english.pdf
 #
 
+# import modules
+from collections import namedtuple
+import contextlib
+import functools
+import heapq
+import math
+import random
+
+
 class Cell:
     """Represents a cell on a Quoridor game board. Holds a dictionary of the four borders of the cell for board edges
     and placement of fences. When the Cell object is created, the initial values for the fences must be passed: None is
@@ -41,6 +77,11 @@ class Cell:
         that key to True. Returns nothing."""
         self._fence[side] = True
 
+    def remove_fence(self, side):
+        """Takes a string that corresponds with one of the keys in the self._fence dictionary and sets the value for
+        that key back to False. Returns nothing."""
+        self._fence[side] = False
+
     def set_pawn(self, value):
         """Takes a Boolean and sets self._pawn to that value. Returns nothing."""
         self._pawn = value
@@ -50,34 +91,89 @@ class Cell:
         return self._pawn
 
 
+SIDES = ("top", "right", "bot", "left")  # sides of a cell, in the order the Cell class takes them
+SIDE_BITS = {"top": 1, "right": 2, "bot": 4, "left": 8}  # bit of each side in the flags of a CompactCell
+EDGE_SHIFT = 4  # the edge bit of a side is its side bit shifted left this many places
+PAWN_BIT = 256  # bit set in the flags of a CompactCell with a pawn present
+
+
+class CompactCell:
+    """Represents a cell on a Quoridor game board like the Cell class, but holds its four borders and its pawn as bits
+    of a single integer instead of a dictionary and a Boolean: bits 0 to 3 are the fences of the sides (see SIDE_BITS),
+    bits 4 to 7 mark the sides on the edge of the board, and bit 8 is the pawn. Uses __slots__, so a cell has no
+    instance dictionary. Takes the same initial fence values as the Cell class."""
+    __slots__ = ("_flags",)
+
+    # initialize data members
+    def __init__(self, top, right, bot, left):
+        self._flags = 0  # fence, edge and pawn bits of the cell
+
+        for side, value in zip(SIDES, (top, right, bot, left)):
+            if value is None:  # edge of board
+                self._flags |= SIDE_BITS[side] << EDGE_SHIFT
+            elif value:
+                self._flags |= SIDE_BITS[side]
+
+    def get_fence(self, side):
+        """Takes a string for the side of the cell ("top", "right", "bot" or "left") and returns the fence value for
+        that side: None for the edge of the board, otherwise True or False."""
+        bit = SIDE_BITS[side]
+        if self._flags & bit << EDGE_SHIFT:
+            return None
+
+        return self._flags & bit != 0
+
+    def set_fence(self, side):
+        """Takes a string for the side of the cell and sets a fence on that side. Returns nothing."""
+        self._flags |= SIDE_BITS[side]
+
+    def remove_fence(self, side):
+        """Takes a string for the side of the cell and removes the fence from that side. Returns nothing."""
+        self._flags &= ~SIDE_BITS[side]
+
+    def set_pawn(self, value):
+        """Takes a Boolean and sets the pawn bit of the cell to that value. Returns nothing."""
+        if value:
+            self._flags |= PAWN_BIT
+        else:
+            self._flags &= ~PAWN_BIT
+
+    def get_pawn(self):
+        """Takes no parameters and returns True if a pawn is present in the cell. Otherwise returns False."""
+        return self._flags & PAWN_BIT != 0
+
+
 class Board:
     """Represents a board for a Quoridor game. Has a compositional relationship with the Cell class; upon creation,
     generates and holds a nested dictionary containing Cell objects for each cell of the board. The board and its
-    cells are used by the QuoridorGame class to make moves and place fences."""
+    cells are used by the QuoridorGame class to make moves and place fences. The number of cells on each side can be
+    passed as an optional parameter; it defaults to 9."""
+    cell_class = Cell  # class of the cells generated for the board
+
     # initialize data members
-    def __init__(self):
+    def __init__(self, size=9):
         self._cells = {}  # create empty cells dictionary
-        self.__generate_cells()  # call generate cells to create the cell dictionary
+        self.__generate_cells(size)  # call generate cells to create the cell dictionary
 
-    def __generate_cells(self):
+    def __generate_cells(self, size):
         """Contains a nested loop: 1 outer loop that iterates through each column and 1 inner loop that iterates
         through each row. Adds a nested dictionary entry to self._cells for each column (key is column number, value is
         a dictionary). The nested dictionary in turn contains the row number as key and a cell object is generated as
         the value. Cell object's fence will be set to None where the edge of the board lies and False for all other cell
-        borders."""
+        borders. Takes the number of cells on each side of the board."""
         # iterate through columns
-        for col in range(9):
+        for col in range(size):
             self._cells[col] = {}  # nested empty dictionary with col as key
 
             # iterate through rows
-            for row in range(9):
+            for row in range(size):
                 # initialize cell borders
                 if col == 0:  # set left side of cell
                     left = None  # edge of board
                 else:
                     left = False  # no fence, inside of board
 
-                if col == 8:  # set right side of cell
+                if col == size - 1:  # set right side of cell
                     right = None
                 else:
                     right = False
@@ -87,28 +183,223 @@ class Board:
                 else:
                     top = False
 
-                if row == 8:  # set bottom of cell
+                if row == size - 1:  # set bottom of cell
                     bot = None
                 else:
                     bot = False
                 # create Cell object as the value with row as key
-                self._cells[col][row] = Cell(top, right, bot, left)
+                self._cells[col][row] = self.cell_class(top, right, bot, left)
 
     def get_cell(self, coord):
         """Takes a tuple with integer values for column and row as the parameter and returns a Cell object at the
         dictionary location corresponding with those coordinates."""
         return self._cells[coord[0]][coord[1]]  # return cell object at coord
 
+    def get_fence(self, coord, side):
+        """Takes a tuple with integer values for column and row and a string for the side of the cell, and returns the
+        fence value of that side of the Cell object at those coordinates."""
+        return self._cells[coord[0]][coord[1]].get_fence(side)
+
+    def get_pawn(self, coord):
+        """Takes a tuple with integer values for column and row and returns True if a pawn is present in the Cell
+        object at those coordinates. Otherwise returns False."""
+        return self._cells[coord[0]][coord[1]].get_pawn()
+
+    def set_pawn(self, coord, value):
+        """Takes a tuple with integer values for column and row and a Boolean, and sets the pawn value of the Cell
+        object at those coordinates. Returns nothing."""
+        self._cells[coord[0]][coord[1]].set_pawn(value)
+
+    def move_pawn(self, start, end):
+        """Takes two tuples with integer values for column and row, and moves the pawn in the cell at the start
+        coordinates to the cell at the end coordinates. Returns nothing."""
+        self._cells[start[0]][start[1]].set_pawn(False)  # remove pawn from last cell
+        self._cells[end[0]][end[1]].set_pawn(True)  # move pawn to new cell
+
+    def place_fence(self, orient, coord):
+        """Takes a character (v or h) that represents orientation and a tuple with integer values for column and row,
+        and sets the fence on both of the cells that share that border. Returns nothing."""
+        # check if orientation horizontal
+        if orient == 'h':
+            self._cells[coord[0]][coord[1]].set_fence("top")  # place fence at top of target cell
+            # place another fence at bottom of cell above target cell
+            self._cells[coord[0]][coord[1] - 1].set_fence("bot")
+
+        # check if orientation vertical
+        if orient == 'v':
+            self._cells[coord[0]][coord[1]].set_fence("left")  # place fence on left side of target cell
+            # place another fence on the right side of cell to the left of target cell
+            self._cells[coord[0] - 1][coord[1]].set_fence("right")
+
+    def remove_fence(self, orient, coord):
+        """Takes a character (v or h) that represents orientation and a tuple with integer values for column and row,
+        and removes the fence from both of the cells that share that border. Returns nothing."""
+        if orient == 'h':
+            self._cells[coord[0]][coord[1]].remove_fence("top")
+            self._cells[coord[0]][coord[1] - 1].remove_fence("bot")
+
+        if orient == 'v':
+            self._cells[coord[0]][coord[1]].remove_fence("left")
+            self._cells[coord[0] - 1][coord[1]].remove_fence("right")
+
+
+class CompactBoard(Board):
+    """Represents a Board whose cells are CompactCell objects, for a smaller memory footprint per game. Has the same
+    methods as the Board class, so it can be passed to QuoridorGame in place of Board."""
+    cell_class = CompactCell  # class of the cells generated for the board
+
+
+class FlatCell:
+    """Represents a single cell of a FlatBoard. Holds no data of its own; it only stores the board and its coordinates
+    and forwards the Cell methods to the board, so that code written against the Cell class also works with a
+    FlatBoard."""
+    # initialize data members
+    def __init__(self, board, coord):
+        self._board = board  # FlatBoard object that holds the cell's data
+        self._coord = coord  # cell coordinates on the board
+
+    def get_fence(self, side):
+        """Takes a string for the side of the cell ("top", "right", "bot" or "left") and returns the fence value for
+        that side: None for the edge of the board, otherwise True or False."""
+        return self._board.get_fence(self._coord, side)
+
+    def set_fence(self, side):
+        """Takes a string for the side of the cell and sets a fence on that side. Returns nothing."""
+        self._board.set_side_fence(self._coord, side)
+
+    def remove_fence(self, side):
+        """Takes a string for the side of the cell and removes the fence from that side. Returns nothing."""
+        self._board.remove_side_fence(self._coord, side)
+
+    def set_pawn(self, value):
+        """Takes a Boolean and sets the pawn value of the cell to it. Returns nothing."""
+        self._board.set_pawn(self._coord, value)
+
+    def get_pawn(self):
+        """Takes no parameters and returns True if a pawn is present in the cell. Otherwise returns False."""
+        return self._board.get_pawn(self._coord)
+
+
+# layout of the FlatBoard fence array. Cell n is the cell at column n % 9 and row n // 9. The horizontal plane holds the
+# top border of cell n at index n, plus a 10th row for the bottom border of the last row. The vertical plane holds the
+# left border of cell n at index H_PLANE + n, plus one extra index for the right border of the last cell; the right
+# border of every other cell is the left border of the next index, which is on the edge for the last column. Boards of
+# other sizes use the same layout with their own plane sizes (see side_offsets).
+H_PLANE = 90  # size of the horizontal plane
+V_PLANE = 82  # size of the vertical plane
+
+
+SIDE_OFFSET_TABLES = {}  # side offsets for each board size, built the first time they are needed
+
+
+def side_offsets(size):
+    """Given the number of cells on each side of the board, returns a dictionary of the offset into the FlatBoard fence
+    array of each side of cell 0. The dictionary is only built once per size."""
+    if size not in SIDE_OFFSET_TABLES:
+        h_plane = size * (size + 1)
+        SIDE_OFFSET_TABLES[size] = {"top": 0,  # top of a cell is its own horizontal border
+                                    "right": h_plane + 1,  # right of a cell is the vertical border of the next cell
+                                    "bot": size,  # bottom of a cell is the horizontal border of the cell below it
+                                    "left": h_plane}  # left of a cell is its own vertical border
+
+    return SIDE_OFFSET_TABLES[size]
+
+
+SIDE_OFFSETS = side_offsets(9)  # offsets of the standard board
+
+FENCE_VALUES = (False, True, None)  # fence value for each byte value in the fence array. 2 = edge of board
+
+
+class FlatBoard:
+    """Represents a board for a Quoridor game stored as flat byte arrays instead of Cell objects. The fences are held in
+    one bytearray split into a horizontal plane and a vertical plane (see SIDE_OFFSETS), so every side of every cell is
+    a single index into the same array, and the pawns are held in a second bytearray with one byte per cell. Has the
+    same methods as the Board class, so it can be passed to QuoridorGame in place of Board. The number of cells on each
+    side can be passed as an optional parameter; it defaults to 9."""
+    # initialize data members
+    def __init__(self, size=9):
+        self._size = size  # cells on each side of the board
+        self._offsets = side_offsets(size)  # offset of each side of cell 0
+        self._h_plane = h_plane = self._offsets["left"]  # start of the vertical plane
+        self._fences = fences = bytearray(h_plane + size * size + 1)  # 0 = no fence, 1 = fence, 2 = edge of board
+        self._pawns = bytearray(size * size)  # 1 for each cell with a pawn present
+
+        # mark the edges of the board
+        for n in range(size):
+            fences[n] = 2  # top of the first row
+            fences[size * size + n] = 2  # bottom of the last row
+            fences[h_plane + n * size] = 2  # left of the first column (and right of the last column)
+        fences[h_plane + size * size] = 2  # right of the last cell
+
+    def get_cell(self, coord):
+        """Takes a tuple with integer values for column and row and returns a FlatCell object for those
+        coordinates."""
+        return FlatCell(self, coord)
+
+    def get_fence(self, coord, side):
+        """Takes a tuple with integer values for column and row and a string for the side of the cell, and returns the
+        fence value of that side: None for the edge of the board, otherwise True or False."""
+        return FENCE_VALUES[self._fences[self._offsets[side] + coord[0] + coord[1] * self._size]]
+
+    def set_side_fence(self, coord, side):
+        """Takes a tuple with integer values for column and row and a string for the side of the cell, and sets a fence
+        on that side. The neighboring cell shares the same index, so its opposite side is set as well. Returns
+        nothing."""
+        self._fences[self._offsets[side] + coord[0] + coord[1] * self._size] = 1
+
+    def remove_side_fence(self, coord, side):
+        """Takes a tuple with integer values for column and row and a string for the side of the cell, and removes the
+        fence from that side. Returns nothing."""
+        self._fences[self._offsets[side] + coord[0] + coord[1] * self._size] = 0
+
+    def get_pawn(self, coord):
+        """Takes a tuple with integer values for column and row and returns True if a pawn is present in that cell.
+        Otherwise returns False."""
+        return self._pawns[coord[0] + coord[1] * self._size] == 1
+
+    def set_pawn(self, coord, value):
+        """Takes a tuple with integer values for column and row and a Boolean, and sets the pawn value of that cell.
+        Returns nothing."""
+        self._pawns[coord[0] + coord[1] * self._size] = 1 if value else 0
+
+    def move_pawn(self, start, end):
+        """Takes two tuples with integer values for column and row, and moves the pawn in the cell at the start
+        coordinates to the cell at the end coordinates. Returns nothing."""
+        size = self._size
+        self._pawns[start[0] + start[1] * size] = 0  # remove pawn from last cell
+        self._pawns[end[0] + end[1] * size] = 1  # move pawn to new cell
+
+    def place_fence(self, orient, coord):
+        """Takes a character (v or h) that represents orientation and a tuple with integer values for column and row,
+        and sets the index for that fence in the horizontal or vertical plane. Returns nothing."""
+        if orient == 'h':
+            self._fences[coord[0] + coord[1] * self._size] = 1  # top border of target cell
+
+        if orient == 'v':
+            self._fences[self._h_plane + coord[0] + coord[1] * self._size] = 1  # left border of target cell
+
+    def remove_fence(self, orient, coord):
+        """Takes a character (v or h) that represents orientation and a tuple with integer values for column and row,
+        and clears the index for that fence in the horizontal or vertical plane. Returns nothing."""
+        if orient == 'h':
+            self._fences[coord[0] + coord[1] * self._size] = 0
+
+        if orient == 'v':
+            self._fences[self._h_plane + coord[0] + coord[1] * self._size] = 0
+
 
 class Player:
     """Represents a player for the Quoridor game, with an initial ID and pawn location as specified by the initial
-    parameters passed. The player also has an initial fences value of 10. The Player class is used by the QuoridorGame
-    class to hold and manipulate these values in a single object."""
+    parameters passed. The player also has an initial fences value, which defaults to 10. The Player class is used by
+    the QuoridorGame class to hold and manipulate these values in a single object. Uses __slots__, so a player has no
+    instance dictionary."""
+    __slots__ = ("_player_id", "_pawn_loc", "_fences")
+
     # initialize data members
-    def __init__(self, player_id, pawn_loc):
+    def __init__(self, player_id, pawn_loc, fences=10):
         self._player_id = player_id  # player number (e.g., 1, 2)
         self._pawn_loc = pawn_loc  # cell coordinates of current pawn location
-        self._fences = 10  # starting fences
+        self._fences = fences  # starting fences
 
     def set_pawn_loc(self, coord):
         """Takes a tuple with integer values for column and row as the parameter and sets the self._pawn_loc data member
@@ -123,30 +414,656 @@ class Player:
         """Takes no parameters and returns self._fences."""
         return self._fences
 
+    def set_fences(self, count):
+        """Takes an integer as the parameter and sets the self._fences data member to it. Returns nothing."""
+        self._fences = count
+
     def use_fence(self):
         """Takes no parameters. Reduces self._fences count by 1. Returns nothing."""
         self._fences -= 1
 
+    def return_fence(self):
+        """Takes no parameters. Increases self._fences count by 1. Used to undo a fence placement. Returns nothing."""
+        self._fences += 1
+
+
+UNREACHABLE = 999  # distance value for cells that have no path to the goal row
+
+# directions from a cell to its neighbors, used as indexes into the rows of a neighbor table
+TOP = 0
+RIGHT = 1
+BOT = 2
+LEFT = 3
+
+NEIGHBOR_TABLES = {}  # neighbor table for each board size, built the first time it is needed
+
+
+def neighbor_table(size):
+    """Given the number of cells on each side of the board, returns a tuple with a row for each cell number (cell n is
+    the cell at column n % size and row n // size). Each row holds the number of the neighboring cell in the TOP, RIGHT,
+    BOT and LEFT directions, or None where the edge of the board lies. The table is only built once per size."""
+    if size not in NEIGHBOR_TABLES:
+        table = []
+        for n in range(size * size):
+            col, row = n % size, n // size
+            table.append((n - size if row > 0 else None,  # top
+                          n + 1 if col < size - 1 else None,  # right
+                          n + size if row < size - 1 else None,  # bot
+                          n - 1 if col > 0 else None))  # left
+        NEIGHBOR_TABLES[size] = tuple(table)
+
+    return NEIGHBOR_TABLES[size]
+
+
+def pawn_targets(adjacent, pawn, occupied, size=9):
+    """Given an adjacency list shaped like a neighbor table (None where a border is closed), the cell number of a pawn,
+    a set of the cell numbers with pawns, and the number of cells on each side of the board (optional; default is 9),
+    returns a list of the cell numbers the pawn can move to under the rules of QuoridorGame.move_pawn."""
+    moves = []
+
+    # check each direction from the pawn
+    for direction in (TOP, RIGHT, BOT, LEFT):
+        neighbor = adjacent[pawn][direction]
+        if neighbor is None:
+            continue  # fence or edge of board in the way
+
+        if neighbor not in occupied:
+            moves.append(neighbor)  # standard orthogonal move
+        else:
+            moves.extend(face_off_targets(adjacent, neighbor, direction, occupied, size))  # pawns face each other
+
+    return moves
+
+
+def face_off_targets(adjacent, enemy, direction, occupied, size=9):
+    """Given an adjacency list, the cell number of an opposing pawn next to the player's pawn, the direction from the
+    player's pawn to it, a set of the cell numbers with pawns, and the number of cells on each side of the board
+    (optional; default is 9), returns a list of the cell numbers the player can reach around it: the cell behind it if
+    the way is open, otherwise the cells diagonal to the player's pawn if a fence is behind it. An edge of the board
+    behind the opposing pawn allows neither move, as in QuoridorGame.__check_move_legality, and neither does another
+    pawn behind it."""
+    behind = adjacent[enemy][direction]
+    if behind is not None:  # jump over opposing pawn
+        return [behind] if behind not in occupied else []
+
+    if neighbor_table(size)[enemy][direction] is None:
+        return []  # edge of board behind opposing pawn
+
+    # fence behind opposing pawn: move to either side of it
+    sides = (adjacent[enemy][(direction + 1) % 4], adjacent[enemy][(direction + 3) % 4])
+    return [side for side in sides if side is not None and side not in occupied]
+
+
+FACE_OFF_TABLES = {}  # face-off move table for each board size, built the first time it is needed
+FACE_OFF_MASKS = 8  # local fence masks of a face-off: bit 0 behind the opposing pawn, bits 1 and 2 beside it
+
+
+def face_off_table(size):
+    """Given the number of cells on each side of the board, returns a list with a tuple of the cell numbers a pawn can
+    jump or step diagonally to for every face-off, indexed (pawn cell * 4 + direction) * FACE_OFF_MASKS + fence mask,
+    where direction is the side of the pawn the opposing pawn is on and the fence mask has bit 0 set if the border
+    behind the opposing pawn is closed, and bits 1 and 2 set if its borders in direction + 1 and direction + 3 are
+    closed. The border between the pawns must be open. Entries are built with face_off_targets, so they follow the same
+    rules. The table is only built once per size."""
+    if size not in FACE_OFF_TABLES:
+        neighbors = neighbor_table(size)
+        table = []
+        for pawn in range(size * size):
+            for direction in (TOP, RIGHT, BOT, LEFT):
+                enemy = neighbors[pawn][direction]
+                for mask in range(FACE_OFF_MASKS):
+                    if enemy is None:
+                        table.append(())  # no cell on that side of the pawn
+                        continue
+
+                    # borders of the opposing pawn's cell with the closed ones in the mask removed
+                    row = list(neighbors[enemy])
+                    for bit, side in enumerate((direction, (direction + 1) % 4, (direction + 3) % 4)):
+                        if mask >> bit & 1:
+                            row[side] = None
+                    table.append(tuple(face_off_targets({enemy: row}, enemy, direction, {pawn, enemy}, size)))
+        FACE_OFF_TABLES[size] = table
+
+    return FACE_OFF_TABLES[size]
+
+
+FENCE_SLOT_TABLES = {}  # fence slots for each board size, built the first time they are needed
+
+
+def fence_slots(size):
+    """Given the number of cells on each side of the board, returns a list of every place a fence can go as
+    (orientation, coordinates) tuples. Horizontal fences can't go on row 0 and vertical fences can't go on column 0,
+    since those are the edges of the board. The list is only built once per size."""
+    if size not in FENCE_SLOT_TABLES:
+        FENCE_SLOT_TABLES[size] = [('h', (col, row)) for col in range(size) for row in range(1, size)] + \
+                                  [('v', (col, row)) for col in range(1, size) for row in range(size)]
+
+    return FENCE_SLOT_TABLES[size]
+
+
+FENCE_SLOTS = fence_slots(9)  # fence slots of the standard board
+
+# two-cell fences, used by QuoridorGame(long_fences=True). A horizontal fence at (col, row) covers the top borders of
+# (col, row) and (col + 1, row), and a vertical fence covers the left borders of (col, row) and (col, row + 1), so each
+# fence is named by the coordinates of its left or top corner. The point where the two halves of a fence meet is its
+# center; the centers of a board form a (size - 1) x (size - 1) grid, one point for every corner shared by four cells
+LONG_FENCE_SLOT_TABLES = {}  # two-cell fence slots for each board size, built the first time they are needed
+CENTER_VALUES = {'h': 1, 'v': 2}  # value of a center point in the occupancy grid for each orientation. 0 = empty
+
+
+def long_fence_slots(size):
+    """Given the number of cells on each side of the board, returns a list of every place a two-cell fence can go as
+    (orientation, coordinates) tuples. The list is only built once per size."""
+    if size not in LONG_FENCE_SLOT_TABLES:
+        LONG_FENCE_SLOT_TABLES[size] = [('h', (col, row)) for col in range(size - 1) for row in range(1, size)] + \
+                                       [('v', (col, row)) for col in range(1, size) for row in range(size - 1)]
+
+    return LONG_FENCE_SLOT_TABLES[size]
+
+
+def long_fence_borders(orient, coord):
+    """Given a character (v or h) that represents orientation and a tuple of the coordinate location of a two-cell
+    fence, returns a tuple of the two one-cell fences it is made of."""
+    if orient == 'h':
+        return (orient, coord), (orient, (coord[0] + 1, coord[1]))
+
+    return (orient, coord), (orient, (coord[0], coord[1] + 1))
+
+
+def long_fence_conflicts(orient, coord):
+    """Given a character (v or h) that represents orientation and a tuple of the coordinate location of a two-cell
+    fence, returns a list of the fences that can't be on the board at the same time: the fence itself, the fence that
+    crosses it at its center, and the two fences of the same orientation that would overlap one of its halves. Some of
+    them may be off the board."""
+    col, row = coord
+    if orient == 'h':
+        return [('h', coord), ('v', (col + 1, row - 1)), ('h', (col - 1, row)), ('h', (col + 1, row))]
+
+    return [('v', coord), ('h', (col - 1, row + 1)), ('v', (col, row - 1)), ('v', (col, row + 1))]
+
+
+BOARD_SIZES = (3, 5, 7, 9)  # cells on each side of the boards a QuoridorGame can be played on
+PLAYER_COUNTS = (2, 4)  # numbers of players a QuoridorGame can be played with
+
+
+def start_loc(size, player):
+    """Given the number of cells on each side of the board and an integer that represents the player, returns the
+    coordinates of the cell the player's pawn starts on: the middle of the top row for player 1, the bottom row for
+    player 2, the left column for player 3 and the right column for player 4."""
+    middle = size // 2
+    return ((middle, 0), (middle, size - 1), (0, middle), (size - 1, middle))[player - 1]
+
+
+def goal_line(size, player):
+    """Given the number of cells on each side of the board and an integer that represents the player, returns a tuple
+    of the index into a coordinate tuple (0 for columns, 1 for rows) and the value of that index on the player's goal
+    line, which is the line on the opposite side of the board from the player's start."""
+    return (1 if player < 3 else 0), (size - 1 if player % 2 == 1 else 0)
+
+
+def goal_cells(size, player):
+    """Given the number of cells on each side of the board and an integer that represents the player, returns a list of
+    the cell numbers on the player's goal line."""
+    axis, line = goal_line(size, player)
+    if axis == 1:
+        return [col + line * size for col in range(size)]
+
+    return [line + row * size for row in range(size)]
+
+
+def fence_count(size, players):
+    """Given the number of cells on each side of the board and the number of players, returns the number of fences each
+    player starts with: 20 fences shared between the players on a 9x9 board, scaled down with the board's side."""
+    return 20 * (size - 1) // 8 // players
+
+
+MOVE_COUNT = 243  # 81 pawn moves, 81 horizontal fences and 81 vertical fences
+FENCE_OFFSETS = {'h': 81, 'v': 162}  # index of the first fence of each orientation
+
+
+def move_index(move):
+    """Given a move as a tuple of orientation and coordinates, as for push_move, returns its index among the MOVE_COUNT
+    moves of a standard 9x9 board: cell numbers 0-80 move the pawn to that cell, 81-161 place a horizontal fence and
+    162-242 place a vertical fence on the cell number minus 81 or 162."""
+    orient, coord = move
+    return FENCE_OFFSETS.get(orient, 0) + coord[0] + coord[1] * 9
+
+
+def index_move(index):
+    """Given the index of a move, returns the move as a tuple of orientation and coordinates."""
+    orient = None if index < 81 else 'h' if index < 162 else 'v'
+    n = index % 81
+    return orient, (n % 9, n // 9)
+
+
+STATE_SIZE = 22  # bytes returned by QuoridorGame.to_bytes
+FENCE_BYTES = (len(FENCE_SLOTS) + 7) // 8  # bytes of the fence bitmap, one bit per fence slot
+COLUMNS = "abcdefghi"  # column letters used in move notation
+
+
+def to_notation(move):
+    """Given a move as a tuple of orientation and coordinates, as for push_move, returns it in move notation: the column
+    letter (a-i) and row number (1-9) of the cell, followed by h or v for a fence on the top or left border of that
+    cell. For example, (None, (4, 1)) is e2 and ('h', (4, 2)) is e3h."""
+    orient, coord = move
+    return COLUMNS[coord[0]] + str(coord[1] + 1) + (orient or "")
+
+
+def from_notation(text):
+    """Given a move in move notation, returns the move as a tuple of orientation and coordinates. Returns None if the
+    text isn't a move on the board."""
+    orient = text[2:] or None
+    if len(text) < 2 or text[0] not in COLUMNS or text[1] not in "123456789" or orient not in (None, 'h', 'v'):
+        return None
+
+    return orient, (COLUMNS.index(text[0]), int(text[1]) - 1)
+
+
+class GameState(namedtuple("GameState", ("size", "turn", "winner", "pawns", "stock", "h_fences", "v_fences"))):
+    """Represents a Quoridor position as an immutable, hashable value: the number of cells on each side of the board,
+    the player to move, the winner (0 if none), a tuple of the cell number of each player's pawn, a tuple of the fences
+    each player has left, and the horizontal and vertical fences as integers with bit n set for a fence on the top or
+    left border of cell n. Equal positions give equal states, so a state can be used as a dictionary key, and it
+    pickles to a few dozen bytes. Made by initial_state, apply_move and QuoridorGame.get_state."""
+    __slots__ = ()
+
+
+def initial_state(size=9, players=2):
+    """Given the number of cells on each side of the board and the number of players (optional; defaults are 9 and 2),
+    returns the GameState of a new game, as for QuoridorGame. Raises ValueError for an unsupported size or player
+    count."""
+    if size not in BOARD_SIZES or players not in PLAYER_COUNTS:
+        raise ValueError("unsupported board size %r or player count %r" % (size, players))
+
+    pawns = tuple(loc[0] + loc[1] * size for loc in (start_loc(size, player) for player in range(1, players + 1)))
+    return GameState(size, 1, 0, pawns, (fence_count(size, players),) * players, 0, 0)
+
+
+def check_standard_game(game):
+    """Given a QuoridorGame object, raises ValueError unless it is a two-player game on the standard 9x9 board, the
+    only kind the tablebase, the evaluation, the search and the playouts are written for. Returns nothing."""
+    if game.get_size() != 9 or game.get_player_count() != 2:
+        raise ValueError("only two-player 9x9 games are supported, not a %d-player %dx%d game" %
+                         (game.get_player_count(), game.get_size(), game.get_size()))
+
+
+def set_bits(bits):
+    """Given a non-negative integer, returns a list of the positions of its set bits, lowest first."""
+    positions = []
+    while bits:
+        positions.append((bits & -bits).bit_length() - 1)
+        bits &= bits - 1  # clear the lowest set bit
+
+    return positions
+
+
+@functools.lru_cache(maxsize=4096)
+def state_adjacency(size, h_fences, v_fences):
+    """Given the number of cells on each side of the board and the fence bits of a GameState, returns an adjacency list
+    shaped like a neighbor table with None for every border closed by a fence. The lists of recently used layouts are
+    kept, so states that share their fences share the list; it is a tuple of tuples and must not be changed."""
+    adjacent = [list(row) for row in neighbor_table(size)]
+    for n in set_bits(h_fences):
+        adjacent[n][TOP] = adjacent[n - size][BOT] = None
+    for n in set_bits(v_fences):
+        adjacent[n][LEFT] = adjacent[n - 1][RIGHT] = None
+
+    return tuple(tuple(row) for row in adjacent)
+
+
+def goal_path(adjacent, cell, goal, size):
+    """Given an adjacency list, a cell number, a goal line as returned by goal_line and the number of cells on each side
+    of the board, returns a set of the (cell, cell) borders on one shortest path from the cell to the goal line, each
+    with the lower cell number first, or None if fences block every path."""
+    axis, line = goal
+    parents = {cell: None}  # cell each visited cell was reached from
+    queue = [cell]
+
+    for n in queue:  # queue grows while it is being read, in order of distance
+        if (n % size, n // size)[axis] == line:
+            path = set()
+            while parents[n] is not None:
+                path.add((min(n, parents[n]), max(n, parents[n])))
+                n = parents[n]
+            return path
+
+        for neighbor in adjacent[n]:
+            if neighbor is not None and neighbor not in parents:
+                parents[neighbor] = n
+                queue.append(neighbor)
+
+    return None
+
+
+def state_pawn_moves(state):
+    """Given a GameState, returns a list of the coordinates of every cell the player to move can move their pawn to,
+    using the same rules as QuoridorGame.legal_pawn_moves. Returns an empty list if the game has been won."""
+    if state.winner:
+        return []
+
+    size = state.size
+    adjacent = state_adjacency(size, state.h_fences, state.v_fences)
+    moves = pawn_targets(adjacent, state.pawns[state.turn - 1], set(state.pawns), size)
+    return [(n % size, n // size) for n in moves]
+
+
+def state_fences(state):
+    """Given a GameState, returns a list of every fence the player to move can place, as (orientation, coordinates)
+    tuples in the order of fence_slots, with the fair-play rule enforced. Only fences across one shortest path of some
+    pawn need a path search; any other fence leaves that path open for every pawn."""
+    if state.winner or not state.stock[state.turn - 1]:
+        return []
+
+    size = state.size
+    adjacent = state_adjacency(size, state.h_fences, state.v_fences)
+    paths = set()
+    for player, cell in enumerate(state.pawns, 1):
+        paths |= goal_path(adjacent, cell, goal_line(size, player), size) or set()
+
+    fences = []
+    for orient, coord in fence_slots(size):
+        second = coord[0] + coord[1] * size
+        first = second - size if orient == 'h' else second - 1
+        if (state.h_fences if orient == 'h' else state.v_fences) >> second & 1:
+            continue  # fence already there
+        if (first, second) not in paths or fence_keeps_paths(state, orient, second):
+            fences.append((orient, coord))
+
+    return fences
+
+
+def fence_keeps_paths(state, orient, cell):
+    """Given a GameState, a character (v or h) that represents orientation and the cell number of a fence, returns True
+    if every pawn still has a path to its goal line with the fence added. Otherwise returns False."""
+    bit = 1 << cell
+    adjacent = state_adjacency(state.size, state.h_fences | (bit if orient == 'h' else 0),
+                               state.v_fences | (bit if orient == 'v' else 0))
+    return all(goal_path(adjacent, pawn, goal_line(state.size, player), state.size) is not None
+               for player, pawn in enumerate(state.pawns, 1))
+
+
+def legal_moves(state):
+    """Given a GameState, returns a list of every legal move of the player to move as tuples of orientation and
+    coordinates, pawn moves first, then fences, as for QuoridorGame.legal_moves."""
+    return [(None, coord) for coord in state_pawn_moves(state)] + state_fences(state)
+
+
+def state_fence_allowed(state, orient, cell):
+    """Given a GameState, a character (v or h) that represents orientation and the cell number of a fence slot, returns
+    True if the player to move can place that fence: the game hasn't been won, they have a fence left, the slot is
+    empty, and the fair-play rule is kept. Otherwise returns False."""
+    if state.winner or not state.stock[state.turn - 1]:
+        return False
+
+    return not (state.h_fences if orient == 'h' else state.v_fences) >> cell & 1 and \
+        fence_keeps_paths(state, orient, cell)
+
+
+def apply_move(state, move):
+    """Given a GameState and a move of the player to move as a tuple of orientation and coordinates, returns the
+    GameState after the move: the pawn moved, or the fence placed and one of the player's fences used, then the turn
+    passed to the next player unless the move won the game. The state passed is not changed. Raises ValueError if the
+    move isn't legal."""
+    orient, coord = move
+    size, player = state.size, state.turn
+    cell = coord[0] + coord[1] * size
+
+    if orient is None:
+        if coord not in state_pawn_moves(state):
+            raise ValueError("illegal pawn move %r" % (coord,))
+        pawns = state.pawns[:player - 1] + (cell,) + state.pawns[player:]
+        axis, line = goal_line(size, player)
+        if coord[axis] == line:
+            return state._replace(winner=player, pawns=pawns)
+        return state._replace(turn=player % len(pawns) + 1, pawns=pawns)
+
+    if orient not in ('h', 'v') or (orient, coord) not in fence_slots(size) or \
+            not state_fence_allowed(state, orient, cell):
+        raise ValueError("illegal fence %r" % (move,))
+
+    stock = state.stock[:player - 1] + (state.stock[player - 1] - 1,) + state.stock[player:]
+    if orient == 'h':
+        return state._replace(turn=player % len(stock) + 1, stock=stock, h_fences=state.h_fences | 1 << cell)
+    return state._replace(turn=player % len(stock) + 1, stock=stock, v_fences=state.v_fences | 1 << cell)
+
+
+class DistanceMap:
+    """Represents the distance from every cell of a board to a player's goal line, counted in pawn steps and ignoring
+    pawns. The map is built once with a breadth-first search from the goal line, then kept up to date with remove_edge
+    each time a fence closes the border between two cells. Only the cells whose shortest path used that border are
+    searched again, so most fences cost a few lookups. Cell n is the cell at column n % size and row n // size. The map
+    reads the open borders from an adjacency list shaped like a neighbor table, with None where a border is closed; the
+    QuoridorGame that owns the list patches it as fences are placed. The goal line is given as a list of cell numbers
+    (see goal_cells)."""
+    # initialize data members
+    def __init__(self, adjacent, goal):
+        self._adjacent = adjacent  # open neighbors of each cell in the TOP, RIGHT, BOT and LEFT directions
+        self._size = math.isqrt(len(adjacent))  # cells on each side of the board
+        self._dist = [UNREACHABLE] * len(adjacent)  # distance to the goal line for each cell
+        self.__build(goal)
+
+    def __build(self, goal):
+        """Given a list of the cell numbers on the goal line, fills self._dist with a breadth-first search that starts
+        from every one of them. Returns nothing."""
+        queue = list(goal)  # goal line cells are 0 steps away
+        for n in queue:
+            self._dist[n] = 0
+
+        # visit cells in order of distance; queue grows while it is being read
+        for n in queue:
+            for neighbor in self.__neighbors(n):
+                if self._dist[neighbor] == UNREACHABLE:
+                    self._dist[neighbor] = self._dist[n] + 1
+                    queue.append(neighbor)
+
+    def __neighbors(self, n):
+        """Given a cell number, returns a list of the cell numbers next to it that are not behind a fence or off the
+        board."""
+        return [neighbor for neighbor in self._adjacent[n] if neighbor is not None]
+
+    def get_distance(self, coord):
+        """Takes a tuple with integer values for column and row and returns the number of steps from that cell to the
+        goal line, or UNREACHABLE if fences block every path."""
+        return self._dist[coord[0] + coord[1] * self._size]
+
+    def remove_edge(self, first, second):
+        """Given the numbers of two neighboring cells whose border has just been closed by a fence on the board, updates
+        the distances of every cell that depended on that border. Returns a list of (cell number, old distance) tuples
+        that can be passed to restore to undo the update."""
+        dist = self._dist
+
+        # make first the cell further from the goal
+        if dist[first] < dist[second]:
+            first, second = second, first
+
+        # nothing changes if the border was not on a shortest path, or if first has another way to the goal
+        if dist[first] != dist[second] + 1 or self.__has_parent(first, ()):
+            return []
+
+        return self.__recompute(self.__find_affected(first))
+
+    def __has_parent(self, n, affected):
+        """Given a cell number and a collection of cell numbers that are losing their distance, returns True if the cell
+        has a neighbor one step closer to the goal that is not in the collection. Otherwise returns False."""
+        for neighbor in self.__neighbors(n):
+            if self._dist[neighbor] == self._dist[n] - 1 and neighbor not in affected:
+                return True
+
+        return False
+
+    def __find_affected(self, start):
+        """Given the number of a cell that has lost its only shortest path, returns a list of that cell and every cell
+        whose shortest paths all run through it. Cells are visited in order of distance, so a cell's parents have
+        all been checked before the cell itself."""
+        affected = {start}
+        order = [start]
+
+        for n in order:
+            for neighbor in self.__neighbors(n):
+                if self._dist[neighbor] == self._dist[n] + 1 and neighbor not in affected:
+                    if not self.__has_parent(neighbor, affected):
+                        affected.add(neighbor)
+                        order.append(neighbor)
+
+        return order
+
+    def __recompute(self, affected):
+        """Given a list of cell numbers that have lost their distance, finds their new distances from the neighboring
+        cells that kept theirs, then spreads them through the list shortest first. Returns a list of (cell number, old
+        distance) tuples."""
+        changes = [(n, self._dist[n]) for n in affected]
+        for n in affected:
+            self._dist[n] = UNREACHABLE
+
+        # start from the best unaffected neighbor of each affected cell
+        heap = []
+        for n in affected:
+            best = min([self._dist[neighbor] for neighbor in self.__neighbors(n)], default=UNREACHABLE)
+            if best < UNREACHABLE:
+                heapq.heappush(heap, (best + 1, n))
+
+        # settle cells shortest first, then offer each neighbor a path through them
+        while heap:
+            distance, n = heapq.heappop(heap)
+            if distance < self._dist[n]:
+                self._dist[n] = distance
+                for neighbor in self.__neighbors(n):
+                    if distance + 1 < self._dist[neighbor]:
+                        heapq.heappush(heap, (distance + 1, neighbor))
+
+        return changes
+
+    def restore(self, changes):
+        """Given a list of (cell number, old distance) tuples returned by remove_edge, puts the old distances back.
+        Returns nothing."""
+        for n, distance in changes:
+            self._dist[n] = distance
+
+
+def zobrist_keys(count, seed):
+    """Given a number of keys and a seed, returns a list of that many random 64-bit integers. The seeds are fixed, so
+    the same position has the same hash every time the program runs and hashes can be stored on disk."""
+    rand = random.Random(seed)
+    return [rand.getrandbits(64) for n in range(count)]
+
+
+# Zobrist keys XORed into the game hash: one for each player's pawn in each cell, one for each fence slot of each
+# orientation (by the number of the cell it is placed on), one for each number of fences a player can have left, and
+# one for each player's turn. Smaller boards use the keys of their own cell numbers; players 3 and 4 have later seeds,
+# so the keys of a two-player game are the same as before they were added
+ZOBRIST_PAWNS = {1: zobrist_keys(81, 1), 2: zobrist_keys(81, 2), 3: zobrist_keys(81, 9), 4: zobrist_keys(81, 10)}
+ZOBRIST_FENCES = {'h': zobrist_keys(81, 3), 'v': zobrist_keys(81, 4)}
+ZOBRIST_STOCK = {1: zobrist_keys(11, 5), 2: zobrist_keys(11, 6), 3: zobrist_keys(11, 11), 4: zobrist_keys(11, 12)}
+ZOBRIST_TURN = {1: zobrist_keys(1, 7)[0], 2: zobrist_keys(1, 8)[0], 3: zobrist_keys(1, 13)[0],
+                4: zobrist_keys(1, 14)[0]}
+
+LEGALITY_CACHE_SIZE = 512  # most legality results a QuoridorGame keeps for one position
+
 
 class QuoridorGame:
     """Represents a Quoridor game. Has a compositional relationship with the Player and Board classes; these classes are
     used to store much of the necessary data to play the game. The QuoridorGame calls these classes when it is
     initialized to create a board and two player objects. The game is played through the use of the QuoridorGame methods
-    move_pawn and place_fence. Game status can be checked with the is_winner method."""
+    move_pawn and place_fence. Game status can be checked with the is_winner method. The board class can be passed as
+    an optional parameter (e.g., FlatBoard); it defaults to Board. The fair-play rule is enforced unless fair_play is
+    passed as False. The number of cells on each side of the board (one of BOARD_SIZES) and the number of players (2
+    or 4) can also be passed; they default to the standard 9x9 board and two players, and a ValueError is raised for
+    any other values. Players 3 and 4 start on the left and right columns and race to the opposite column. Fences are 1
+    cell long, as the README asks, unless long_fences is passed as True for the standard two-cell fences of the
+    published rules (see long_fence_slots)."""
     # initialize data members
-    def __init__(self):
-        self._board = Board()  # generate game board object with Game class
+    def __init__(self, board_class=Board, fair_play=True, size=9, players=2, long_fences=False):
+        if size not in BOARD_SIZES or players not in PLAYER_COUNTS:
+            raise ValueError("unsupported board size %r or player count %r" % (size, players))
 
-        # generate dictionary of player objects. pass initial pawn locations
-        self._players = {1: Player(1, (4, 0)),
-                         2: Player(2, (4, 8))}
+        self._board = board_class(size)  # generate game board object with Game class
+        self.__set_layout(size, players, long_fences)
 
-        # initialize pawn locations
-        self._board.get_cell((4, 0)).set_pawn(True)
-        self._board.get_cell((4, 8)).set_pawn(True)
+        # generate dictionary of player objects. pass initial pawn locations and fences
+        self._players = {}
+        for player in range(1, players + 1):
+            self._players[player] = Player(player, start_loc(size, player), fence_count(size, players))
+            self._board.set_pawn(self._players[player].get_pawn_loc(), True)  # initialize pawn location
 
-        self._winner = None  # track winner of the game. can be None, 1, or 2
+        self._winner = None  # track winner of the game. can be None or a player
         self._player_turn = 1  # track turn. player 1 goes first
+        self._fair_play = fair_play  # reject fences that cut off every path to a goal line
+        self._undo = []  # record of each move made, used by pop_move to take it back
+        self.__new_cache()
+
+        # generate dictionary of distance maps to each player's goal line
+        self._distances = {player: DistanceMap(self._adjacent, goal_cells(size, player)) for player in self._players}
+
+        self._hash = self.__full_hash()  # Zobrist hash of the position
+
+    def __set_layout(self, size, players, long_fences=False):
+        """Given the number of cells on each side of the board, the number of players, and whether fences are two cells
+        long (optional; default is False), sets the data members that depend only on them. Tables shared by every game
+        of a size, such as the fence slots, are looked up by size instead of being held by the game, so copying a game
+        doesn't copy them. Returns nothing."""
+        self._size = size  # cells on each side of the board
+        self._player_count = players  # players in the game
+        self._bounds = range(size)  # valid column and row numbers, built once instead of on every move
+        self._goals = [goal_line(size, player) for player in range(1, players + 1)]  # (axis, line) of each player
+
+        # open neighbors of each cell, copied from the neighbor table and patched as fences are placed
+        self._adjacent = [list(row) for row in neighbor_table(size)]
+        face_off_table(size)  # jump and diagonal moves, read by __check_move_legality from FACE_OFF_TABLES
+
+        # for two-cell fences, the occupancy grid of fence centers (see CENTER_VALUES) and the set of slots that no
+        # placed fence crosses or overlaps, which are updated with each fence placed or taken back
+        self._long_fences = long_fences
+        self._centers = bytearray((size - 1) * (size - 1)) if long_fences else None
+        self._open_slots = set(long_fence_slots(size)) if long_fences else None
+
+    def __new_cache(self):
+        """Takes no parameters. Sets up an empty legality cache. The cache holds results of legality checks for the
+        current position only: self._epoch is bumped by every move and pop_move, and entries from an older epoch are
+        dropped the next time the cache is used. Returns nothing."""
+        self._epoch = 0  # number of the current position, bumped whenever the position changes
+        self._cache_epoch = 0  # epoch of the entries in the cache
+        self._legality_cache = {}  # legality result by (player, coord), (orient, coord) or "fences"
+        self._cache_size = LEGALITY_CACHE_SIZE  # most entries kept
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+    def __cached(self, key):
+        """Given a cache key, returns the result cached for it in the current position, or None if there isn't one.
+        Counts the lookup as a hit or a miss."""
+        if self._cache_epoch == self._epoch:
+            result = self._legality_cache.get(key)
+            if result is not None:
+                self._cache_hits += 1
+                return result
+
+        self._cache_misses += 1
+        return None
+
+    def __cache(self, key, result):
+        """Given a cache key and a result, stores the result for the current position, first dropping the entries of
+        an older position, or the oldest entry if the cache is full. Returns nothing."""
+        if self._cache_epoch != self._epoch:
+            self._legality_cache.clear()
+            self._cache_epoch = self._epoch
+        elif len(self._legality_cache) >= self._cache_size:
+            del self._legality_cache[next(iter(self._legality_cache))]  # dictionaries keep insertion order
+
+        self._legality_cache[key] = result
+
+    def get_cache_stats(self):
+        """Takes no parameters and returns a dictionary of the number of legality cache hits and misses, the hit rate
+        and the number of entries held."""
+        lookups = self._cache_hits + self._cache_misses
+        return {"hits": self._cache_hits, "misses": self._cache_misses,
+                "hit_rate": self._cache_hits / lookups if lookups else 0.0, "entries": len(self._legality_cache)}
+
+    def get_size(self):
+        """Takes no parameters and returns the number of cells on each side of the board."""
+        return self._size
+
+    def get_player_count(self):
+        """Takes no parameters and returns the number of players in the game."""
+        return self._player_count
 
     def is_winner(self, player):
         """Given an integer that represents the player, checks if self._winner is equal to that integer. If it is,
@@ -158,6 +1075,35 @@ class QuoridorGame:
         else:
             return False
 
+    def get_turn(self):
+        """Takes no parameters and returns the integer that represents the player whose turn it is. After a winning
+        move, returns the winner."""
+        return self._player_turn
+
+    def get_pawn_loc(self, player):
+        """Given an integer that represents the player, returns the coordinates of that player's pawn."""
+        return self._players[player].get_pawn_loc()
+
+    def get_fences(self, player):
+        """Given an integer that represents the player, returns the number of fences that player has left."""
+        return self._players[player].get_fences()
+
+    def get_path_length(self, player):
+        """Given an integer that represents the player, returns the number of steps on the shortest path from that
+        player's pawn to their goal row, ignoring pawns. Returns None if fences block every path."""
+        return self.get_distance(player, self._players[player].get_pawn_loc())
+
+    def get_distance(self, player, coord):
+        """Given an integer that represents the player and a tuple with integer values for column and row, returns the
+        number of steps on the shortest path from that cell to the player's goal row, ignoring pawns. Returns None if
+        fences block every path."""
+        distance = self._distances[player].get_distance(coord)
+
+        if distance == UNREACHABLE:
+            return None
+
+        return distance
+
     def move_pawn(self, player, coord):
         """Given an integer that represents the player and a tuple of the coordinate location of the attempted
         attempted move, calls the check_initial_parameters and check_move_legality methods to determine if values
@@ -167,32 +1113,51 @@ class QuoridorGame:
         if not self.__check_initial_parameters(player, coord):
             return False  # failed basic checks!
 
-        # check if move is illegal with check_move_legality method
+        # check if move is illegal with check_move_legality method, unless it was already found illegal in this
+        # position. a legal move changes the position, so only illegal moves are cached. the lookup is written out
+        # here instead of calling __cached, since it runs on every move
+        if self._cache_epoch == self._epoch and (player, coord) in self._legality_cache:
+            self._cache_hits += 1
+            return False  # illegal move
+
+        self._cache_misses += 1
         if not self.__check_move_legality(player, coord):
+            self.__cache((player, coord), False)
             return False  # illegal move
 
         else:
-            # move pawn to new cell
-            self._board.get_cell(coord).set_pawn(True)
-            # remove pawn from last cell
-            self._board.get_cell(self._players[player].get_pawn_loc()).set_pawn(False)
-            # update player's pawn location
-            self._players[player].set_pawn_loc(coord)
-
-            # check if this move resulted in a win
-            if self.__check_win_condition(player):
-                return True  # turn is not changed
-
-            # change the turn
-            self.__change_turn()
-
+            self.__make_pawn_move(player, coord)
             return True
 
+    def __make_pawn_move(self, player, coord):
+        """Given an integer that represents the player and a tuple of the coordinate location of a legal move, moves the
+        pawn to the target cell, checks the win conditions, and changes the turn unless the player won. Returns
+        nothing."""
+        # record move so it can be undone
+        last = self._players[player].get_pawn_loc()
+        self._undo.append((player, None, last, None, self._hash))
+        self._epoch += 1
+
+        # move pawn from last cell to new cell
+        self._board.move_pawn(last, coord)
+        keys, size = ZOBRIST_PAWNS[player], self._size
+        self._hash ^= keys[last[0] + last[1] * size] ^ keys[coord[0] + coord[1] * size]
+        # update player's pawn location
+        self._players[player].set_pawn_loc(coord)
+
+        # check if this move resulted in a win
+        if self.__check_win_condition(player):
+            return  # turn is not changed
+
+        # change the turn
+        self.__change_turn()
+
     def place_fence(self, player, orient, coord):
         """Given an integer that represents the player, a character (v or h) that represents orientation, and a tuple of
         the coordinate location of the attempted fence placement, calls the check_initial_parameters and
         check_fence_legality methods to determine if values passed and fence placement are valid. If they aren't returns
-        False. Otherwise, places the fence in the target cell, reduces the player's fences by 1, changes the turn, and
+        False. If the fence would cut off every path from a pawn to its goal row, returns "breaks the fair play rule".
+        Otherwise, places the fence in the target cell, reduces the player's fences by 1, changes the turn, and
         returns True."""
         # check initial parameters
         if not self.__check_initial_parameters(player, coord, orient):
@@ -202,25 +1167,455 @@ class QuoridorGame:
         if not self.__check_fence_legality(orient, coord):
             return False
 
-        # check if orientation horizontal
-        if orient == 'h':
-            self._board.get_cell(coord).set_fence("top")  # place fence at top of target cell
-            # place another fence at bottom of cell above target cell
-            self._board.get_cell((coord[0], coord[1] - 1)).set_fence("bot")
+        # a fence already found to break the fair play rule in this position is rejected without checking again
+        if self._fair_play and self.__cached((orient, coord)) is not None:
+            return "breaks the fair play rule"
 
-        # check if orientation vertical
-        if orient == 'v':
-            self._board.get_cell(coord).set_fence("left")  # place fence on left side of target cell
-            # place another fence on the right side of cell to the left of target cell
-            self._board.get_cell((coord[0] - 1, coord[1])).set_fence("right")
+        # close the border and update distance maps, then check that every pawn can still reach its goal row
+        changes = self.__close_fence(orient, coord)
+        if self._fair_play and self.__pawn_cut_off():
+            self.__open_fence(orient, coord, changes)  # undo the updates
+            self.__cache((orient, coord), True)
+            return "breaks the fair play rule"
+
+        self.__make_fence_move(player, orient, coord, changes)
+        return True  # fence placed successfully!
+
+    def __make_fence_move(self, player, orient, coord, changes):
+        """Given an integer that represents the player, a character (v or h) that represents orientation, a tuple of the
+        coordinate location of a legal fence whose border has been closed, and the changes returned by __close_fence,
+        places the fence on the board, reduces the player's fences by 1, and changes the turn. Returns nothing."""
+        # place fence on the board and record it so it can be undone
+        if self._long_fences:
+            self.__fill_center(orient, coord)
+        else:
+            self._board.place_fence(orient, coord)
+        self._undo.append((player, orient, coord, changes, self._hash))
+        self._epoch += 1
 
         # use player's fence
+        stock = self._players[player].get_fences()
         self._players[player].use_fence()
+        self._hash ^= ZOBRIST_FENCES[orient][coord[0] + coord[1] * self._size] ^ ZOBRIST_STOCK[player][stock] ^ \
+            ZOBRIST_STOCK[player][stock - 1]
 
         # change turns
         self.__change_turn()
 
-        return True  # fence placed successfully!
+    def get_hash(self):
+        """Takes no parameters and returns the 64-bit Zobrist hash of the current position. Positions reached by
+        different move orders have the same hash."""
+        return self._hash
+
+    def __full_hash(self):
+        """Takes no parameters and returns the Zobrist hash of the current position computed from scratch. Used when
+        the game is created and when pawns are moved by change_pawn_loc."""
+        result = ZOBRIST_TURN[self._player_turn]
+
+        for player in self._players:
+            loc = self._players[player].get_pawn_loc()
+            result ^= ZOBRIST_PAWNS[player][loc[0] + loc[1] * self._size]
+            result ^= ZOBRIST_STOCK[player][self._players[player].get_fences()]
+
+        for orient, coord in self.get_placed_fences():
+            result ^= ZOBRIST_FENCES[orient][coord[0] + coord[1] * self._size]
+
+        return result
+
+    def get_placed_fences(self):
+        """Takes no parameters and returns a list of (orientation, coordinates) tuples for every fence on the board."""
+        # two-cell fences are found from the occupancy grid: the center at (col, row) of the grid is the bottom right
+        # corner of cell (col, row)
+        if self._long_fences:
+            side = self._size - 1
+            centers = [(n % side, n // side, value) for n, value in enumerate(self._centers) if value]
+            return [('h', (col, row + 1)) if value == CENTER_VALUES['h'] else ('v', (col + 1, row))
+                    for col, row, value in centers]
+
+        fences = []
+
+        # fences are found from the adjacency list: a closed border that isn't an edge of the board
+        for orient, coord in fence_slots(self._size):
+            first, second, direction = self.__fence_cells(orient, coord)
+            if self._adjacent[first][direction] is None:
+                fences.append((orient, coord))
+
+        return fences
+
+    def to_bytes(self):
+        """Takes no parameters and returns the position as STATE_SIZE bytes: the cell number of each pawn, the fences
+        each player has left (player 1 in the high four bits), the turn and the winner (winner in the high bits, 0 if
+        none), then a bitmap with a bit for each slot in FENCE_SLOTS that holds a fence. Moves that can be undone are
+        not included. Raises ValueError unless the game is a two-player game on the standard 9x9 board with one-cell
+        fences."""
+        if self._size != 9 or self._player_count != 2 or self._long_fences:
+            raise ValueError("only two-player 9x9 games can be encoded")
+
+        header = [loc[0] + loc[1] * 9 for loc in (self._players[1].get_pawn_loc(), self._players[2].get_pawn_loc())]
+        header.append(self._players[1].get_fences() << 4 | self._players[2].get_fences())
+        header.append((self._winner or 0) << 2 | self._player_turn)
+
+        bitmap = 0
+        for index, (orient, coord) in enumerate(FENCE_SLOTS):
+            first, second, direction = self.__fence_cells(orient, coord)
+            if self._adjacent[first][direction] is None:
+                bitmap |= 1 << index
+
+        return bytes(header) + bitmap.to_bytes(FENCE_BYTES, "little")
+
+    @classmethod
+    def from_bytes(cls, data, board_class=Board, fair_play=True):
+        """Given bytes returned by to_bytes, and optionally a board class and fair_play as for QuoridorGame, returns a
+        new QuoridorGame object with that position. Raises ValueError if data isn't STATE_SIZE bytes long, or if its
+        turn, winner, pawn cells or fences left can't be those of a game."""
+        if len(data) != STATE_SIZE:
+            raise ValueError("expected %d bytes, got %d" % (STATE_SIZE, len(data)))
+
+        # pawns on two different cells of the board, at most a full stock of fences each, and a player to move
+        turn, winner, stock = data[3] & 3, data[3] >> 2, (data[2] >> 4, data[2] & 15)
+        if turn not in (1, 2) or winner not in (0, 1, 2) or max(data[0], data[1]) >= 81 or data[0] == data[1] or \
+                max(stock) > fence_count(9, 2):
+            raise ValueError("not a position: %s" % data[:4].hex())
+
+        # unpack the fence bitmap into the fence bits of a GameState
+        fences = {'h': 0, 'v': 0}
+        for index in set_bits(int.from_bytes(data[4:], "little")):
+            orient, coord = FENCE_SLOTS[index]
+            fences[orient] |= 1 << coord[0] + coord[1] * 9
+
+        state = GameState(9, turn, winner, (data[0], data[1]), stock, fences['h'], fences['v'])
+        return cls.from_state(state, board_class, fair_play)
+
+    def get_state(self):
+        """Takes no parameters and returns the position as a GameState, which can be passed to the functions
+        legal_moves and apply_move, or back to from_state. Moves that can be undone are not included. Raises ValueError
+        if the game uses two-cell fences."""
+        if self._long_fences:
+            raise ValueError("games with two-cell fences have no GameState")
+
+        size = self._size
+        fences = {'h': 0, 'v': 0}
+        for orient, coord in self.get_placed_fences():
+            fences[orient] |= 1 << coord[0] + coord[1] * size
+
+        players = [self._players[player] for player in range(1, self._player_count + 1)]
+        return GameState(size, self._player_turn, self._winner or 0,
+                         tuple(loc[0] + loc[1] * size for loc in (player.get_pawn_loc() for player in players)),
+                         tuple(player.get_fences() for player in players), fences['h'], fences['v'])
+
+    @classmethod
+    def from_state(cls, state, board_class=Board, fair_play=True):
+        """Given a GameState, and optionally a board class and fair_play as for QuoridorGame, returns a new QuoridorGame
+        object with that position."""
+        game = cls.__new__(cls)  # data members are set by __load
+        game.__load(state, board_class, fair_play)
+        return game
+
+    def __load(self, state, board_class, fair_play):
+        """Given a GameState, a board class and fair_play, sets up the data members of a game created by from_state
+        with that position, as __init__ does for a new game, building the distance maps and the hash once all the
+        fences are placed. Returns nothing."""
+        size = state.size
+        self._board = board_class(size)
+        self.__set_layout(size, len(state.pawns))
+        self._players = {}
+        for player, (cell, fences) in enumerate(zip(state.pawns, state.stock), 1):
+            self._players[player] = Player(player, (cell % size, cell // size), fences)
+            self._board.set_pawn(self._players[player].get_pawn_loc(), True)
+
+        self._winner = state.winner or None
+        self._player_turn = state.turn
+        self._fair_play = fair_play
+        self._undo = []
+        self.__new_cache()
+
+        for orient, bits in (('h', state.h_fences), ('v', state.v_fences)):
+            for n in set_bits(bits):
+                self.__close_adjacent(orient, (n % size, n // size))
+                self._board.place_fence(orient, (n % size, n // size))
+
+        self._distances = {player: DistanceMap(self._adjacent, goal_cells(size, player)) for player in self._players}
+        self._hash = self.__full_hash()
+
+    def push_move(self, player, move):
+        """Given an integer that represents the player and a move as a tuple of orientation and coordinates (orientation
+        is None for a pawn move, or v or h for a fence), makes the move with move_pawn or place_fence and returns the
+        result. A successful move can be taken back with pop_move."""
+        if move[0] is None:
+            return self.move_pawn(player, move[1])
+
+        return self.place_fence(player, move[0], move[1])
+
+    def push_trusted(self, player, move):
+        """Given an integer that represents the player and a move as for push_move that is known to be legal (e.g., from
+        a game record that has already been checked), makes the move without checking the parameters, the turn, the
+        rules or the fair-play rule. Returns nothing. The move can be taken back with pop_move. Passing a move that
+        isn't legal leaves the game in a broken state."""
+        if move[0] is None:
+            self.__make_pawn_move(player, move[1])
+        else:
+            self.__make_fence_move(player, move[0], move[1], self.__close_fence(move[0], move[1]))
+
+    def pop_move(self):
+        """Takes no parameters. Undoes the last successful move made with move_pawn, place_fence or push_move, putting
+        back the pawn or fence, the player's fences, the turn and the winner. Returns the undone move as a tuple of
+        player, orientation and coordinates."""
+        player, orient, coord, changes, self._hash = self._undo.pop()
+        self._epoch += 1
+
+        if orient is None:  # pawn move. coord is the cell the pawn came from
+            move = (player, None, self._players[player].get_pawn_loc())
+            self._board.move_pawn(move[2], coord)
+            self._players[player].set_pawn_loc(coord)
+        else:  # fence placement
+            move = (player, orient, coord)
+            if self._long_fences:
+                self.__clear_center(orient, coord)
+            else:
+                self._board.remove_fence(orient, coord)
+            self.__open_fence(orient, coord, changes)
+            self._players[player].return_fence()
+
+        # a move can only be made on the player's turn, before the game is won
+        self._player_turn = player
+        self._winner = None
+
+        return move
+
+    @contextlib.contextmanager
+    def trial(self, player, move):
+        """Given an integer that represents the player and a move as for push_move, returns a context manager that makes
+        the move on entry and gives the result of push_move to the with statement, then undoes the move on exit if it
+        was successful."""
+        result = self.push_move(player, move)
+        try:
+            yield result
+        finally:
+            if result is True:
+                self.pop_move()
+
+    def legal_moves(self, player):
+        """Given an integer that represents the player, returns a list of every legal move for that player as tuples
+        of orientation and coordinates that can be passed to push_move: pawn moves first, then fences."""
+        return [(None, coord) for coord in self.legal_pawn_moves(player)] + self.legal_fences(player)
+
+    def legal_pawn_moves(self, player):
+        """Given an integer that represents the player, returns a list of the coordinates of every cell that player's
+        pawn can legally move to, whether or not it is their turn. Returns an empty list if the game has been won.
+        Gives the same results as calling move_pawn on every cell, without changing the game."""
+        if self._winner is not None:
+            return []  # game is over!
+
+        pawn_coord = self._players[player].get_pawn_loc()
+        size = self._size
+        occupied = {loc[0] + loc[1] * size for loc in (p.get_pawn_loc() for p in self._players.values())}
+        moves = pawn_targets(self._adjacent, pawn_coord[0] + pawn_coord[1] * size, occupied, size)
+
+        return [(n % size, n // size) for n in moves]
+
+    def legal_fences(self, player):
+        """Given an integer that represents the player, returns a list of (orientation, coordinates) tuples for every
+        fence that player could legally place, whether or not it is their turn. Returns an empty list if the game has
+        been won or the player is out of fences. Gives the same results as calling place_fence on every slot, without
+        changing the game. The list is cached, so calling it again in the same position costs a copy."""
+        if self._winner is not None or self._players[player].get_fences() < 1:
+            return []
+
+        # fair play doesn't depend on who places the fence, so every player with fences has the same list
+        fences = self.__cached("fences")
+        if fences is None:
+            fences = self.__legal_long_fences() if self._long_fences else self.__legal_short_fences()
+            self.__cache("fences", fences)
+
+        return list(fences)
+
+    def is_legal_fence(self, player, orient, coord):
+        """Given an integer that represents the player, a character (v or h) that represents orientation, and a tuple of
+        the coordinate location of a fence, returns True if the fence is one of legal_fences for that player, without
+        finding every legal fence. Otherwise returns False. The game is left as it was found."""
+        if self._winner is not None or self._players[player].get_fences() < 1:
+            return False
+
+        fences = self.__cached("fences")
+        if fences is not None:
+            return (orient, coord) in fences
+        if self._long_fences:
+            return self.__long_fence_legal(orient, coord)
+
+        # one-cell fence slots have both coordinates on the board and aren't on the top or left edge
+        if orient not in ('h', 'v') or coord[0] not in self._bounds or coord[1] not in self._bounds or \
+                coord[1 if orient == 'h' else 0] == 0:
+            return False
+
+        return self.__short_fence_legal(orient, coord)
+
+    def __legal_short_fences(self):
+        """Takes no parameters and returns a list of (orientation, coordinates) tuples for every one-cell fence that
+        isn't on the board and, if the fair-play rule is enforced, cuts off no pawn. Used by legal_fences."""
+        return [(orient, coord) for orient, coord in fence_slots(self._size) if self.__short_fence_legal(orient, coord)]
+
+    def __short_fence_legal(self, orient, coord):
+        """Given a character (v or h) that represents orientation and a tuple of the coordinates of a one-cell fence
+        slot, returns True if the slot is empty and, if the fair-play rule is enforced, a fence there cuts off no pawn.
+        Otherwise returns False."""
+        first, second, direction = self.__fence_cells(orient, coord)
+        if self._adjacent[first][direction] is None:
+            return False  # fence already there
+
+        # check the fair-play rule by closing the border and opening it again. a border on an open square of four
+        # cells can't cut anything off, since the other three borders go around it
+        if self._fair_play and not self.__on_open_square(first, second, direction):
+            changes = self.__close_border(orient, coord)
+            cut_off = self.__pawn_cut_off()
+            self.__open_border(orient, coord, changes)
+            return not cut_off
+
+        return True
+
+    def __legal_long_fences(self):
+        """Takes no parameters and returns a list of (orientation, coordinates) tuples for every two-cell fence that
+        crosses and overlaps no placed fence and, if the fair-play rule is enforced, cuts off no pawn. Used by
+        legal_fences."""
+        return [(orient, coord) for orient, coord in long_fence_slots(self._size)
+                if self.__long_fence_legal(orient, coord)]
+
+    def __long_fence_legal(self, orient, coord):
+        """Given a character (v or h) that represents orientation and a tuple of the coordinates of a two-cell fence
+        slot, returns True if the fence crosses and overlaps no placed fence and, if the fair-play rule is enforced,
+        cuts off no pawn. Otherwise returns False."""
+        if (orient, coord) not in self._open_slots:
+            return False  # crosses or overlaps a placed fence
+
+        if self._fair_play:
+            changes = self.__close_fence(orient, coord)
+            cut_off = self.__pawn_cut_off()
+            self.__open_fence(orient, coord, changes)
+            return not cut_off
+
+        return True
+
+    def __on_open_square(self, first, second, direction):
+        """Given the numbers of two neighboring cells and the direction from the first to the second, returns True if
+        their border is one side of a square of four cells whose other three borders are open. Otherwise returns
+        False."""
+        for side in ((direction + 1) % 4, (direction + 3) % 4):
+            beside_first = self._adjacent[first][side]
+            beside_second = self._adjacent[second][side]
+            if beside_first is not None and beside_second is not None and \
+                    self._adjacent[beside_first][direction] == beside_second:
+                return True
+
+        return False
+
+    def __fence_cells(self, orient, coord):
+        """Given a character (v or h) that represents orientation and a tuple of the coordinate location of a fence,
+        returns a tuple of the number of the cell above or to the left of the fence, the number of the cell below or to
+        the right of it, and the direction from the first cell to the second."""
+        second = coord[0] + coord[1] * self._size
+        if orient == 'h':
+            return second - self._size, second, BOT  # cell above
+
+        return second - 1, second, RIGHT  # cell to the left
+
+    def __close_fence(self, orient, coord):
+        """Given a character (v or h) that represents orientation and a tuple of the coordinate location of a fence,
+        closes every border under the fence with __close_border. Returns the changes to pass to __open_fence: the
+        dictionary returned by __close_border, or a list of one for each half of a two-cell fence."""
+        if not self._long_fences:
+            return self.__close_border(orient, coord)
+
+        return [self.__close_border(*border) for border in long_fence_borders(orient, coord)]
+
+    def __open_fence(self, orient, coord, changes):
+        """Given a character (v or h) that represents orientation, a tuple of the coordinate location of a fence, and
+        the changes returned by __close_fence, opens every border under the fence again with __open_border, last closed
+        first. Returns nothing."""
+        if not self._long_fences:
+            self.__open_border(orient, coord, changes)
+            return
+
+        for border, border_changes in reversed(list(zip(long_fence_borders(orient, coord), changes))):
+            self.__open_border(border[0], border[1], border_changes)
+
+    def __center_of(self, orient, coord):
+        """Given a character (v or h) that represents orientation and a tuple of the coordinate location of a two-cell
+        fence, returns a tuple of the number of the cells on each side of the center grid and the index of the fence's
+        center in the grid, or None for the index if the fence would hang off the board."""
+        side = self._size - 1
+        col, row = (coord[0], coord[1] - 1) if orient == 'h' else (coord[0] - 1, coord[1])
+        if 0 <= col < side and 0 <= row < side:
+            return side, col + row * side
+
+        return side, None
+
+    def __long_fence_open(self, orient, coord):
+        """Given a character (v or h) that represents orientation and a tuple of the coordinate location of a two-cell
+        fence, returns True if the fence is on the board and no placed fence crosses it at its center or overlaps one
+        of its halves. Otherwise returns False. Takes at most three lookups in the occupancy grid."""
+        side, center = self.__center_of(orient, coord)
+        if center is None or self._centers[center]:
+            return False  # off the board, or crossing or on top of a placed fence
+
+        # a fence of the same orientation centered one point away along the fence's length overlaps it
+        step = 1 if orient == 'h' else side
+        position = center % side if orient == 'h' else center // side
+        value = CENTER_VALUES[orient]
+        return not (position > 0 and self._centers[center - step] == value) and \
+            not (position < side - 1 and self._centers[center + step] == value)
+
+    def __fill_center(self, orient, coord):
+        """Given a character (v or h) that represents orientation and a tuple of the coordinate location of a legal
+        two-cell fence, places both halves on the board, marks its center in the occupancy grid, and removes the slots
+        it blocks from the set of open slots. Returns nothing."""
+        for border in long_fence_borders(orient, coord):
+            self._board.place_fence(*border)
+
+        self._centers[self.__center_of(orient, coord)[1]] = CENTER_VALUES[orient]
+        self._open_slots.difference_update(long_fence_conflicts(orient, coord))
+
+    def __clear_center(self, orient, coord):
+        """Given a character (v or h) that represents orientation and a tuple of the coordinate location of a placed
+        two-cell fence, removes both halves from the board, clears its center in the occupancy grid, and puts back
+        each slot it blocked that no other fence blocks. Returns nothing."""
+        for border in long_fence_borders(orient, coord):
+            self._board.remove_fence(*border)
+
+        self._centers[self.__center_of(orient, coord)[1]] = 0
+        for slot in long_fence_conflicts(orient, coord):
+            if self.__long_fence_open(*slot):
+                self._open_slots.add(slot)
+
+    def __close_border(self, orient, coord):
+        """Given a character (v or h) that represents orientation and a tuple of the coordinate location of a fence,
+        removes the border under the fence from the adjacency list and updates each player's distance map. Returns a
+        dictionary of the distance map changes for each player, which can be passed to __open_border."""
+        first, second = self.__close_adjacent(orient, coord)
+        return {player: self._distances[player].remove_edge(first, second) for player in self._distances}
+
+    def __close_adjacent(self, orient, coord):
+        """Given a character (v or h) that represents orientation and a tuple of the coordinate location of a fence,
+        removes the border under the fence from the adjacency list. Returns a tuple of the numbers of the cells on
+        either side of the fence."""
+        first, second, direction = self.__fence_cells(orient, coord)
+        self._adjacent[first][direction] = None
+        self._adjacent[second][(direction + 2) % 4] = None
+        return first, second
+
+    def __open_border(self, orient, coord, changes):
+        """Given a character (v or h) that represents orientation, a tuple of the coordinate location of a fence, and
+        the dictionary returned by __close_border, puts the border back into the adjacency list and restores each
+        player's distance map. Returns nothing."""
+        first, second, direction = self.__fence_cells(orient, coord)
+        self._adjacent[first][direction] = second
+        self._adjacent[second][(direction + 2) % 4] = first
+
+        for player in changes:
+            self._distances[player].restore(changes[player])
+
+    def __pawn_cut_off(self):
+        """Takes no parameters. Returns True if any player's pawn has no path to their goal line. Otherwise returns
+        False."""
+        return None in (self.get_path_length(player) for player in self._players)
 
     def __check_fence_legality(self, orient, coord):
         """Given a character (v or h) that represents orientation, and a tuple of the coordinate location of the
@@ -230,12 +1625,16 @@ class QuoridorGame:
         if self._players[self._player_turn].get_fences() < 1:
             return False  # not enough fences!
 
+        # two-cell fences are legal if they are still in the set of open slots
+        if self._long_fences:
+            return (orient, coord) in self._open_slots
+
         # check if horizontal orientation
         if orient == 'h':
             if coord[1] == 0:  # check if row is 0
                 return False  # can't place fence on edge of board!
 
-            if self._board.get_cell(coord).get_fence("top"):  # check if fence already in target side of cell
+            if self._board.get_fence(coord, "top"):  # check if fence already in target side of cell
                 return False
 
             else:
@@ -246,7 +1645,7 @@ class QuoridorGame:
             if coord[0] == 0:  # check if col is 0
                 return False  # can't place fence on edge of board!
 
-            if self._board.get_cell(coord).get_fence("left"):  # check if fence already in target side of cell
+            if self._board.get_fence(coord, "left"):  # check if fence already in target side of cell
                 return False
 
             else:
@@ -254,207 +1653,44 @@ class QuoridorGame:
 
     def __check_move_legality(self, player, coord):
         """Given an integer that represents the player and a tuple of the coordinate locations of the attempted move,
-        returns True if the move was legal by calling the orthogonal_move and diagonal_move methods. Otherwise returns
-        False."""
+        returns True if the move was legal: a step across an open border, or a jump or diagonal move around the opposing
+        pawn found in the face-off table (see face_off_table). Otherwise returns False. With more than two players, the
+        move is checked against legal_pawn_moves instead, since the table only looks at a single opponent."""
         # check for opponent's pawn in destination cell
-        if self._board.get_cell(coord).get_pawn():
-            return False
-
-        # call orthogonal_move function to check if move is orthogonal and no fences block the way
-        orthogonal = self.__orthogonal_move(player, coord)
-        if orthogonal:
-            return True  # move was orthogonal and legal!
-
-        # if move was NOT orthogonal, call diagonal_move to check if move is diagonal and legal
-        if orthogonal is None:
-            if self.__diagonal_move(player, coord):
-                return True  # move was diagonal and legal!
-
-        else:
-            return False  # illegal move
-
-    def __orthogonal_move(self, player, coord):
-        """Given an integer that represents the player and a tuple of the coordinate location of the attempted move,
-        returns True if the move was orthogonal and legal. Returns False if the move was orthogonal and illegal. Returns
-        None if the move was not orthogonal."""
-        pawn_coord = self._players[player].get_pawn_loc()  # current player's pawn coordinates
-
-        if player == 1:
-            enemy_pawn = self._players[2].get_pawn_loc()
-
-        else:
-            enemy_pawn = self._players[1].get_pawn_loc()
-
-        # check if direction of move is orthogonal
-        standard_orthogonal = self.__orthogonal_move_standard(coord, pawn_coord)
-        if standard_orthogonal:
-            return True
-
-        # check if direction of move is orthogonal and move is a jump over enemy pawn
-        jump_orthogonal = self.__orthogonal_move_jump(coord, pawn_coord, enemy_pawn)
-        if jump_orthogonal:
-            return True
-
-        if standard_orthogonal is None and jump_orthogonal is None:
-            return None  # not orthogonal
-
-        else:
+        if self._board.get_pawn(coord):
             return False
 
-    def __orthogonal_move_standard(self, coord, pawn_coord):
-        """Given the coordinates of the move and the pawn coordinates of the current player both as tuples, finds
-        direction of move and returns a call of the orthogonal_fence_check method. Returns None if the move is not
-        orthogonally adjacent to the player's pawn."""
-        # find direction of movement if orthogonal
-        if pawn_coord[0] + 1 == coord[0] and pawn_coord[1] == coord[1]:  # moving to right
-            return self.__orthogonal_fence_check(pawn_coord, "right")
-
-        if pawn_coord[0] - 1 == coord[0] and pawn_coord[1] == coord[1]:  # moving to left
-            return self.__orthogonal_fence_check(pawn_coord, "left")
-
-        if pawn_coord[0] == coord[0] and pawn_coord[1] + 1 == coord[1]:  # moving down
-            return self.__orthogonal_fence_check(pawn_coord, "bot")
-
-        if pawn_coord[0] == coord[0] and pawn_coord[1] - 1 == coord[1]:  # moving up
-            return self.__orthogonal_fence_check(pawn_coord, "top")
-
-    def __orthogonal_move_jump(self, coord, pawn_coord, enemy_pawn):
-        """Given target coordinates, player's pawn coordinates, and enemy pawn coordinates each as a tuple, finds the
-        direction of the move and returns a call of the orthogonal_fence_check method. Returns None if the move is not
-        orthogonally two spaces away from the player's pawn"""
-        # check if attempting orthogonal jump
-        if pawn_coord[0] + 2 == coord[0] and pawn_coord[1] == coord[1]:  # moving to right
-            adjacent = (pawn_coord[0] + 1, pawn_coord[1])  # bookmark cell being jumped
-            return self.__orthogonal_fence_check(pawn_coord, "right", enemy_pawn, adjacent)  # check the way
-
-        if pawn_coord[0] - 2 == coord[0] and pawn_coord[1] == coord[1]:  # moving to left
-            adjacent = (pawn_coord[0] - 1, pawn_coord[1])  # bookmark cell being jumped
-            return self.__orthogonal_fence_check(pawn_coord, "left", enemy_pawn, adjacent)  # check the way
-
-        if pawn_coord[0] == coord[0] and pawn_coord[1] + 2 == coord[1]:  # moving down
-            adjacent = (pawn_coord[0], pawn_coord[1] + 1)  # bookmark cell being jumped
-            return self.__orthogonal_fence_check(pawn_coord, "bot", enemy_pawn, adjacent)  # check the way
-
-        if pawn_coord[0] == coord[0] and pawn_coord[1] - 2 == coord[1]:  # moving up
-            adjacent = (pawn_coord[0], pawn_coord[1] - 1)  # bookmark cell being jumped
-            return self.__orthogonal_fence_check(pawn_coord, "top", enemy_pawn, adjacent)  # check the way
-
-    def __orthogonal_fence_check(self, pawn_coord, side, enemy_pawn=None, adjacent=None):
-        """Given pawn_coord as a tuple, a side of a cell as a string for a standard orthogonal move, and enemy_pawn
-        coordinates as a tuple and the coordinates of the adjacent cell as a tuple in addition for jump moves, returns
-        False if a fence bars the way. Otherwise returns True."""
-        # jump orthogonal fence check
-        if enemy_pawn is not None and adjacent is not None:
-            # check if opposing pawn adjacent in direction of jump
-            if enemy_pawn != adjacent:
-                return False
+        if self._player_count > 2:
+            return coord in self.legal_pawn_moves(player)
 
-            # check given side of player pawn's cell AND enemy pawn's cell
-            if self._board.get_cell(pawn_coord).get_fence(side) or self._board.get_cell(enemy_pawn).get_fence(side):
-                return False  # fence in the way!
-            else:
-                return True  # the way is clear
+        size = self._size
+        adjacent = self._adjacent
+        pawn_coord = self._players[player].get_pawn_loc()
+        pawn = pawn_coord[0] + pawn_coord[1] * size
+        target = coord[0] + coord[1] * size
 
-        # standard orthogonal fence check
-        else:
-            if self._board.get_cell(pawn_coord).get_fence(side):  # check given side of current cell
-                return False  # fence in the way!
-            else:
-                return True  # the way is clear
-
-    def __diagonal_move(self, player, coord):
-        """Given an integer that represents the player and a tuple of the coordinate location of the attempted move,
-        calls the diagonal_move_vertical and/or the diagonal_move_horizontal methods to check direction of move
-        relative to the enemy pawn, then returns True if the move was legal and not blocked by a fence. Otherwise,
-        returns False."""
-        pawn_coord = self._players[player].get_pawn_loc()  # current player's pawn coordinates
-        tar_cell = self._board.get_cell(coord)  # destination cell object
-
-        # call diagonal_move_vertical method to check vertical conditions
-        if self.__diagonal_move_vertical(coord, pawn_coord, -1, "top") or \
-                self.__diagonal_move_vertical(coord, pawn_coord, 1, "bot"):
-
-            # check if move is to the left
-            if pawn_coord[0] - 1 == coord[0]:
-                if not tar_cell.get_fence("right"):  # check if fence in the way
-                    return True  # move valid!
-
-            # check if move is to the right
-            elif pawn_coord[0] + 1 == coord[0]:
-                if not tar_cell.get_fence("left"):  # check if fence in the way
-                    return True  # move valid!
-
-            else:
-                return False  # illegal move
+        if target in adjacent[pawn]:
+            return True  # orthogonal step across an open border
 
-        # call diagonal_move_vertical method to check horizontal conditions
-        if self.__diagonal_move_horizontal(coord, pawn_coord, -1, "left") or \
-                self.__diagonal_move_horizontal(coord, pawn_coord, 1, "right"):
-
-            # check if move is up
-            if pawn_coord[1] - 1 == coord[1]:
-                if not tar_cell.get_fence("bot"):  # check if fence in the way
-                    return True  # move valid!
-
-            # check if move is down
-            elif pawn_coord[1] + 1 == coord[1]:
-                if not tar_cell.get_fence("top"):  # check if fence in the way
-                    return True  # move valid!
-
-            else:
-                return False  # illegal move
-
-    def __diagonal_move_vertical(self, coord, pawn_coord, value, side):
-        """Given a tuple of two integers representing coordinates, the coordinates of the current player's pawn,
-        an integer value 1 or -1, returns True/False for each of the following checks: 1) move is vertical, 2) opposing
-        pawn is vertically adjacent, 3) a fence is behind the opposing pawn, and 4) no fence in between
-        player's pawn and opposing pawn."""
-        # make sure cells checked are not out of bounds
-        if pawn_coord[1] + value not in range(9):
+        # otherwise the move has to go around an opposing pawn next to the player's pawn, with no fence between them
+        enemy_coord = self._players[3 - player].get_pawn_loc()
+        enemy = enemy_coord[0] + enemy_coord[1] * size
+        if enemy not in adjacent[pawn]:
             return False
 
-        # check if move is up or down
-        direc = pawn_coord[1] + value == coord[1]
-        # check if opposing pawn orthogonally up or down and adjacent
-        enemy_pawn = self._board.get_cell((pawn_coord[0], pawn_coord[1] + value)).get_pawn()
-        # check if fence behind opposing pawn
-        far_fence = self._board.get_cell((pawn_coord[0], pawn_coord[1] + value)).get_fence(side)
-        # check if fence in the way in current player's pawn's cell
-        adjacent_fence = not self._board.get_cell(pawn_coord).get_fence(side)
-
-        return direc and enemy_pawn and far_fence and adjacent_fence
-
-    def __diagonal_move_horizontal(self, coord, pawn_coord, value, side):
-        """Given a tuple of two integers representing coordinates, the coordinates of the current player's pawn,
-        an integer value 1 or -1, returns True/False for each of the following checks: 1) move is horizontal, 2)
-        opposing pawn is horizontally adjacent, 3) a fence is behind the opposing pawn, and 4) no fence in between
-        player's pawn and opposing pawn."""
-        # make sure cells checked are not out of bounds
-        if pawn_coord[0] + value not in range(9):
-            return False
-
-        # check if move is left or right
-        direc = pawn_coord[0] + value == coord[0]
-        # check if opposing pawn orthogonally left or right and adjacent
-        enemy_pawn = self._board.get_cell((pawn_coord[0] + value, pawn_coord[1])).get_pawn()
-        # check if fence behind opposing pawn
-        far_fence = self._board.get_cell((pawn_coord[0] + value, pawn_coord[1])).get_fence(side)
-        # check if fence in the way in current player's pawn's cell
-        adjacent_fence = not self._board.get_cell(pawn_coord).get_fence(side)
-
-        return direc and enemy_pawn and far_fence and adjacent_fence
+        direction = adjacent[pawn].index(enemy)
+        borders = adjacent[enemy]
+        mask = (borders[direction] is None) | (borders[(direction + 1) % 4] is None) << 1 | \
+            (borders[(direction + 3) % 4] is None) << 2
+        return target in FACE_OFF_TABLES[size][(pawn * 4 + direction) * FACE_OFF_MASKS + mask]
 
     def __check_win_condition(self, player):
         """Given an integer that represents the player, returns True if win conditions have been met. Otherwise returns
         False."""
-        # if player 1, check if win conditions have been met
-        if player == 1 and self._players[1].get_pawn_loc()[1] == 8:
-            self._winner = 1
-            return True
-
-        # if player 2, check if win conditions have been met
-        if player == 2 and self._players[2].get_pawn_loc()[1] == 0:
-            self._winner = 2
+        # check if the player's pawn is on their goal line
+        axis, line = self._goals[player - 1]
+        if self._players[player].get_pawn_loc()[axis] == line:
+            self._winner = player
             return True
 
         return False  # no winners yet
@@ -476,7 +1712,7 @@ class QuoridorGame:
         if type(coord) is tuple:
             if len(coord) == 2:
                 if type(coord[0]) is int and type(coord[1]) is int:
-                    if coord[0] not in range(9) or coord[1] not in range(9):  # check if coord is inside board
+                    if coord[0] not in self._bounds or coord[1] not in self._bounds:  # check if coord is inside board
                         return False  # out of bounds!
 
                 else:
@@ -496,52 +1732,55 @@ class QuoridorGame:
         return True
 
     def __change_turn(self):
-        """Takes no parameters. Changes the turn to the next player. Returns nothing."""
-        # change to second player's turn if currently player one's turn
-        if self._player_turn == 1:
-            self._player_turn = 2
+        """Takes no parameters. Changes the turn to the next player and updates the hash. Returns nothing."""
+        last = self._player_turn
 
-        # change to first player's turn if currently player two's turn
+        # change to the next player's turn, going back to player one after the last player
+        if last < self._player_count:
+            self._player_turn = last + 1
         else:
             self._player_turn = 1
 
+        self._hash ^= ZOBRIST_TURN[last] ^ ZOBRIST_TURN[self._player_turn]  # swap one turn key for the other
+
     def print_board(self):
         """Prints the current state of the Quoridor game board. Used for testing purposes only."""
         # iterate through cols
-        for row in range(9):
-            for col in range(9):  # iterate through rows
+        for row in range(self._size):
+            for col in range(self._size):  # iterate through rows
                 print(str(col) + str(row), end='')  # print cell coords in line
 
                 # print fences, if any
-                if self._board.get_cell((col, row)).get_fence("left"):
+                if self._board.get_fence((col, row), "left"):
                     print("l", end='')  # print left fence in line
-                if self._board.get_cell((col, row)).get_fence("right"):
+                if self._board.get_fence((col, row), "right"):
                     print("r", end='')  # print right fence in line
-                if self._board.get_cell((col, row)).get_fence("top"):
+                if self._board.get_fence((col, row), "top"):
                     print("t", end='')  # print top fence in line
-                if self._board.get_cell((col, row)).get_fence("bot"):
+                if self._board.get_fence((col, row), "bot"):
                     print("b", end='')  # print bottom fence in line
                 # print pawn, if any
-                if self._board.get_cell((col, row)).get_pawn():
+                if self._board.get_pawn((col, row)):
                     print("P", end='')  # print pawn in line
 
                 print(" ", end='')  # space after cell/fences/pawn
             print("\n")  # new line after each row
 
-    def change_pawn_loc(self, p1, p2):
-        """Given two tuples, one for player 1 and one for player 2, changes the player's pawn locations to the new
-        tuple coordinates, respectively. Returns a string. Used for testing purposes only."""
+    def change_pawn_loc(self, p1, p2, *others):
+        """Given two tuples, one for player 1 and one for player 2, and one more for each other player, changes the
+        player's pawn locations to the new tuple coordinates, respectively. Returns a string. Used for testing purposes
+        only."""
         # remove pawns from board
-        self._board.get_cell(self._players[1].get_pawn_loc()).set_pawn(False)
-        self._board.get_cell(self._players[2].get_pawn_loc()).set_pawn(False)
+        for player in self._players:
+            self._board.set_pawn(self._players[player].get_pawn_loc(), False)
 
-        # change pawn location for each player
-        self._players[1].set_pawn_loc(p1)
-        self._players[2].set_pawn_loc(p2)
+        # change pawn location for each player and replace pawns on board
+        for player, coord in zip(self._players, (p1, p2) + others):
+            self._players[player].set_pawn_loc(coord)
+            self._board.set_pawn(coord, True)
 
-        # replace pawns on board
-        self._board.get_cell(p1).set_pawn(True)
-        self._board.get_cell(p2).set_pawn(True)
+        self._hash = self.__full_hash()
+        self._epoch += 1
 
         return "Cheater."
 
@@ -0,0 +1,257 @@
+# Author: Christopher Felt
+# Date: 10/18/2026
+#
+# Description: Batched version of the Quoridor program for evaluating many games at once with NumPy. The GameBatch
+# class holds N games as arrays: a horizontal and a vertical fence plane for each game, both indexed [game, row, col],
+# the coordinates of both pawns, the fences each player has left, whose turn it is, and the winner. Its methods work on
+# every game at once: legal_mask gives the legal moves of the player to move in each game, apply_moves makes one move
+# in each game, and check_winners finds the games that have been won. They follow the same rules as move_pawn,
+# place_fence and the win check of QuoridorGame, including the fair-play rule.
+#
+# A move is an index into the MOVE_COUNT moves of a board, as given by move_index in the Quoridor program.
+
+# import modules
+from Quoridor import TOP, RIGHT, BOT, LEFT
+import numpy as np
+
+STEPS = {TOP: (0, -1), RIGHT: (1, 0), BOT: (0, 1), LEFT: (-1, 0)}  # (col, row) change for each direction
+SLOTS = np.eye(81, dtype=bool).reshape(81, 9, 9)  # fence plane with one fence, for each cell number
+
+
+def goal_reach(h_fences, v_fences, goal_row):
+    """Given horizontal and vertical fence planes with any number of leading dimensions and a goal row, returns a
+    Boolean array of the same shape that is True for every cell with a path to the goal row. Grows the cells that reach
+    the goal row one step at a time until they stop changing."""
+    reach = np.zeros(h_fences.shape, dtype=bool)
+    reach[..., goal_row, :] = True
+    up, left = ~h_fences[..., 1:, :], ~v_fences[..., :, 1:]  # open borders above and left of each cell
+
+    while True:
+        grown = reach.copy()
+        grown[..., :-1, :] |= reach[..., 1:, :] & up  # step down
+        grown[..., 1:, :] |= reach[..., :-1, :] & up  # step up
+        grown[..., :, :-1] |= reach[..., :, 1:] & left  # step right
+        grown[..., :, 1:] |= reach[..., :, :-1] & left  # step left
+        if np.array_equal(grown, reach):
+            return reach
+
+        reach = grown
+
+
+class GameBatch:
+    """Represents a batch of Quoridor games stored as NumPy arrays. New games start in the opening position; a
+    QuoridorGame can be copied into any game with set_game. The fair-play rule is enforced unless fair_play is passed as
+    False. Player numbers are 1 and 2 as in QuoridorGame, and a winner of 0 means the game hasn't been won."""
+    # initialize data members
+    def __init__(self, count, fair_play=True):
+        self._count = count  # number of games
+        self._fair_play = fair_play  # reject fences that cut off every path to a goal row
+        self._h_fences = np.zeros((count, 9, 9), dtype=bool)  # fence on the top border of each cell
+        self._v_fences = np.zeros((count, 9, 9), dtype=bool)  # fence on the left border of each cell
+        self._pawns = np.tile(np.array([[4, 0], [4, 8]]), (count, 1, 1))  # (col, row) of each player's pawn
+        self._stock = np.full((count, 2), 10)  # fences left for each player
+        self._turn = np.ones(count, dtype=int)  # player to move. player 1 goes first
+        self._winner = np.zeros(count, dtype=int)  # winner of each game, or 0
+
+    def set_game(self, index, game):
+        """Given the index of a game in the batch and a QuoridorGame object, copies the game's position into the batch.
+        Returns nothing."""
+        self._h_fences[index] = False
+        self._v_fences[index] = False
+        for orient, (col, row) in game.get_placed_fences():
+            (self._h_fences if orient == 'h' else self._v_fences)[index, row, col] = True
+
+        for player in (1, 2):
+            self._pawns[index, player - 1] = game.get_pawn_loc(player)
+            self._stock[index, player - 1] = game.get_fences(player)
+
+        self._turn[index] = game.get_turn()
+        self._winner[index] = 1 if game.is_winner(1) else 2 if game.is_winner(2) else 0
+
+    def get_fence_planes(self):
+        """Takes no parameters and returns a tuple of the horizontal and vertical fence planes."""
+        return self._h_fences, self._v_fences
+
+    def get_pawns(self):
+        """Takes no parameters and returns the array of (col, row) pawn coordinates, indexed [game, player - 1]."""
+        return self._pawns
+
+    def get_fences(self):
+        """Takes no parameters and returns the array of fences left, indexed [game, player - 1]."""
+        return self._stock
+
+    def get_turns(self):
+        """Takes no parameters and returns the array of the player to move in each game. After a winning move, the
+        winner stays the player to move, as in QuoridorGame.get_turn."""
+        return self._turn
+
+    def get_winners(self):
+        """Takes no parameters and returns the array of the winner of each game, or 0 if it hasn't been won."""
+        return self._winner
+
+    def __movers(self):
+        """Takes no parameters and returns a tuple of arrays of the (col, row) pawn coordinates of the player to move
+        and of the opposing player in each game."""
+        games = np.arange(self._count)
+        return self._pawns[games, self._turn - 1], self._pawns[games, 2 - self._turn]
+
+    def __open_borders(self):
+        """Takes no parameters and returns a Boolean array indexed [game, direction, row, col] that is True where a
+        pawn can step from the cell in the direction (TOP, RIGHT, BOT or LEFT): not off the board or through a
+        fence."""
+        borders = np.zeros((self._count, 4, 9, 9), dtype=bool)
+        borders[:, TOP, 1:, :] = ~self._h_fences[:, 1:, :]
+        borders[:, BOT, :-1, :] = ~self._h_fences[:, 1:, :]
+        borders[:, LEFT, :, 1:] = ~self._v_fences[:, :, 1:]
+        borders[:, RIGHT, :, :-1] = ~self._v_fences[:, :, 1:]
+        return borders
+
+    def legal_pawn_mask(self):
+        """Takes no parameters and returns a Boolean array indexed [game, row, col] that is True for every cell the
+        player to move can move their pawn to. Games that have been won have no legal moves."""
+        mask = np.zeros((self._count, 9, 9), dtype=bool)
+        games = np.arange(self._count)
+        borders = self.__open_borders()
+        pawn, enemy = self.__movers()
+        active = self._winner == 0
+
+        for direction, step in STEPS.items():
+            target = pawn + step
+            way_open = active & borders[games, direction, pawn[:, 1], pawn[:, 0]]
+            face_off = way_open & (target == enemy).all(axis=1)
+            self.__mark(mask, way_open & ~face_off, target)  # standard orthogonal move
+            self.__face_off_moves(mask, face_off, enemy, direction, borders)
+
+        return mask
+
+    def __face_off_moves(self, mask, face_off, enemy, direction, borders):
+        """Given the pawn mask, a Boolean array of the games where the opposing pawn is next to the player's pawn in the
+        direction, the opposing pawn coordinates, the direction and the open border array, marks the cell behind the
+        opposing pawn if the way is open, otherwise the cells on either side of it if a fence (not the edge of the
+        board) is behind it. Returns nothing."""
+        games = np.arange(self._count)
+        behind = enemy + STEPS[direction]
+        behind_open = borders[games, direction, enemy[:, 1], enemy[:, 0]]
+        on_board = ((behind >= 0) & (behind < 9)).all(axis=1)
+        self.__mark(mask, face_off & behind_open, behind)  # jump over opposing pawn
+
+        # fence behind opposing pawn: move to either side of it
+        fenced = face_off & ~behind_open & on_board
+        for side in ((direction + 1) % 4, (direction + 3) % 4):
+            side_open = borders[games, side, enemy[:, 1], enemy[:, 0]]
+            self.__mark(mask, fenced & side_open, enemy + STEPS[side])
+
+    def __mark(self, mask, where, coords):
+        """Given a Boolean array indexed [game, row, col], a Boolean array of games and an array of (col, row)
+        coordinates for each game, sets the mask at the coordinates of the games picked. Returns nothing."""
+        games = np.flatnonzero(where)
+        mask[games, coords[games, 1], coords[games, 0]] = True
+
+    def legal_fence_mask(self):
+        """Takes no parameters and returns a Boolean array indexed [game, orientation, row, col], with orientation 0
+        for horizontal and 1 for vertical fences, that is True for every fence the player to move can place. With the
+        fair-play rule, every free slot is tried at once with goal_reach."""
+        mask = np.stack((self._h_fences, self._v_fences), axis=1)
+        mask = ~mask
+        mask[:, 0, 0, :] = False  # edges of the board
+        mask[:, 1, :, 0] = False
+        mask &= ((self._winner == 0) & (self._stock[np.arange(self._count), self._turn - 1] > 0))[:, None, None, None]
+
+        if self._fair_play:
+            h_slots = self._h_fences[:, None] | SLOTS  # each game with each horizontal fence added
+            v_slots = self._v_fences[:, None] | SLOTS
+            mask[:, 0] &= ~self.__cut_off(h_slots, self._v_fences[:, None]).reshape(self._count, 9, 9)
+            mask[:, 1] &= ~self.__cut_off(self._h_fences[:, None], v_slots).reshape(self._count, 9, 9)
+
+        return mask
+
+    def __cut_off(self, h_fences, v_fences):
+        """Given horizontal and vertical fence planes shaped [game, slot, row, col] (either may have a slot size of 1),
+        returns a Boolean array indexed [game, slot] that is True where either pawn has no path to its goal row."""
+        h_fences, v_fences = np.broadcast_arrays(h_fences, v_fences)
+        games = np.arange(self._count)[:, None]
+        cut_off = np.zeros(h_fences.shape[:2], dtype=bool)
+
+        for player, goal_row in ((1, 8), (2, 0)):
+            reach = goal_reach(h_fences, v_fences, goal_row)
+            pawn = self._pawns[:, player - 1]
+            cut_off |= ~reach[games, np.arange(h_fences.shape[1]), pawn[:, None, 1], pawn[:, None, 0]]
+
+        return cut_off
+
+    def legal_mask(self):
+        """Takes no parameters and returns a Boolean array indexed [game, move index] that is True for every legal move
+        of the player to move."""
+        return np.concatenate((self.legal_pawn_mask().reshape(self._count, 81),
+                               self.legal_fence_mask().reshape(self._count, 162)), axis=1)
+
+    def apply_moves(self, moves):
+        """Given an array with a move index for each game, makes each legal move and returns a Boolean array that is
+        True for the games where the move was made, as move_pawn and place_fence return True. A game is left as it was
+        if its move is illegal, breaks the fair-play rule, or the game has been won. Pawn moves are checked for a win;
+        the turn changes after every other move."""
+        moves = np.asarray(moves)
+        pawn_moves = moves < 81
+        cells = moves % 81
+        games = np.arange(self._count)
+
+        legal = np.where(pawn_moves, self.legal_pawn_mask().reshape(self._count, 81)[games, cells],
+                         self.__fence_legal(moves >= 162, cells))
+
+        self.__move_pawns(legal & pawn_moves, cells)
+        self.__place_fences(legal & ~pawn_moves, moves >= 162, cells)
+
+        # change turns in games that weren't won
+        changed = legal & (self._winner == 0)
+        self._turn[changed] = 3 - self._turn[changed]
+
+        return legal
+
+    def __fence_legal(self, vertical, cells):
+        """Given a Boolean array that is True for vertical fences and an array of cell numbers, one for each game,
+        returns a Boolean array that is True where the player to move can place that fence."""
+        games = np.arange(self._count)
+        rows, cols = cells // 9, cells % 9
+        planes = np.where(vertical[:, None, None], self._v_fences, self._h_fences)
+        legal = ~planes[games, rows, cols] & np.where(vertical, cols > 0, rows > 0)
+        legal &= (self._winner == 0) & (self._stock[games, self._turn - 1] > 0)
+
+        if self._fair_play:
+            h_fences = self._h_fences | (SLOTS[cells] & ~vertical[:, None, None])
+            v_fences = self._v_fences | (SLOTS[cells] & vertical[:, None, None])
+            legal &= ~self.__cut_off(h_fences[:, None], v_fences[:, None])[:, 0]
+
+        return legal
+
+    def __move_pawns(self, where, cells):
+        """Given a Boolean array of games and an array of cell numbers, moves the pawn of the player to move to the cell
+        in the games picked, then records a winner where the pawn reached its goal row. Returns nothing."""
+        games = np.flatnonzero(where)
+        players = self._turn[games] - 1
+        self._pawns[games, players, 0] = cells[games] % 9
+        self._pawns[games, players, 1] = cells[games] // 9
+        self.check_winners()
+
+    def __place_fences(self, where, vertical, cells):
+        """Given a Boolean array of games, a Boolean array that is True for vertical fences and an array of cell
+        numbers, places the fence and uses a fence of the player to move in the games picked. Returns nothing."""
+        for plane, picked in ((self._h_fences, where & ~vertical), (self._v_fences, where & vertical)):
+            games = np.flatnonzero(picked)
+            plane[games, cells[games] // 9, cells[games] % 9] = True
+            self._stock[games, self._turn[games] - 1] -= 1
+
+    def check_winners(self):
+        """Takes no parameters. Records player 1 as the winner of every game where their pawn is on row 8, and player 2
+        where their pawn is on row 0, then returns the array of winners."""
+        self._winner[(self._winner == 0) & (self._pawns[:, 0, 1] == 8)] = 1
+        self._winner[(self._winner == 0) & (self._pawns[:, 1, 1] == 0)] = 2
+        return self._winner
+
+
+def batch_from_games(games, fair_play=True):
+    """Given a list of QuoridorGame objects, returns a GameBatch holding their positions in the same order."""
+    batch = GameBatch(len(games), fair_play)
+    for index, game in enumerate(games):
+        batch.set_game(index, game)
+
+    return batch
@@ -0,0 +1,81 @@
+# Author: Christopher Felt
+# Date: 10/18/2026
+#
+# Description: Unit test program for testing the QuoridorBatch program. Plays random games with a GameBatch and with
+# QuoridorGame objects side by side and checks that they agree. Skipped if NumPy isn't installed.
+
+# import modules
+from Quoridor import QuoridorGame, FlatBoard, MOVE_COUNT, move_index, index_move
+import random
+import unittest
+
+try:
+    import numpy as np
+    from QuoridorBatch import GameBatch, batch_from_games
+except ImportError:
+    np = None
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class UnitTests(unittest.TestCase):
+    """Class for testing the QuoridorBatch program. Inherits from Unit test."""
+
+    def assertSameGames(self, batch, games):
+        """Checks that every game in the batch has the same position as the QuoridorGame at the same index."""
+        h_fences, v_fences = batch.get_fence_planes()
+        for index, q in enumerate(games):
+            fences = {(orient, (col, row)) for orient, plane in (('h', h_fences), ('v', v_fences))
+                      for row, col in zip(*np.nonzero(plane[index]))}
+            self.assertEqual(fences, set(q.get_placed_fences()))
+            self.assertEqual([tuple(loc) for loc in batch.get_pawns()[index]], [q.get_pawn_loc(1), q.get_pawn_loc(2)])
+            self.assertEqual(list(batch.get_fences()[index]), [q.get_fences(1), q.get_fences(2)])
+            self.assertEqual(batch.get_turns()[index], q.get_turn())
+            self.assertEqual(batch.get_winners()[index], 1 if q.is_winner(1) else 2 if q.is_winner(2) else 0)
+
+    def test_move_index(self):
+        """Test that move indexes and moves convert back and forth."""
+        self.assertEqual(move_index((None, (4, 1))), 13)
+        self.assertEqual(move_index(('h', (0, 1))), 90)
+        self.assertEqual(move_index(('v', (8, 8))), MOVE_COUNT - 1)
+        for index in range(MOVE_COUNT):
+            self.assertEqual(move_index(index_move(index)), index)
+
+    def test_GameBatch_matches_QuoridorGame(self):
+        """Test legal moves, moves and winners against QuoridorGame on random games, with some illegal moves."""
+        rand = random.Random(5)
+        games = [QuoridorGame(FlatBoard) for n in range(12)]
+        batch = GameBatch(len(games))
+
+        for ply in range(120):
+            moves = []
+            mask = batch.legal_mask()
+            for index, q in enumerate(games):
+                legal = {move_index(move) for move in q.legal_moves(q.get_turn())}
+                self.assertEqual(set(np.flatnonzero(mask[index])), legal)
+
+                # mostly legal moves, pawn moves most of all so that games get won, and some random moves that are
+                # usually illegal
+                pawn_moves = sorted(move for move in legal if move < 81)
+                chance = rand.random()
+                moves.append(rand.choice(pawn_moves) if pawn_moves and chance < 0.5 else
+                             rand.choice(sorted(legal)) if legal and chance < 0.8 else rand.randrange(MOVE_COUNT))
+
+            results = [q.push_move(q.get_turn(), index_move(move)) is True for q, move in zip(games, moves)]
+            self.assertEqual(list(batch.apply_moves(np.array(moves))), results)
+            self.assertSameGames(batch, games)
+
+        # a batch loaded from the games matches them too
+        self.assertSameGames(batch_from_games(games), games)
+
+    def test_fair_play(self):
+        """Test that a fence cutting off a pawn is rejected unless fair play is turned off."""
+        q = QuoridorGame()
+        q.change_pawn_loc((0, 0), (4, 8))
+        for move in (('v', (1, 0)), ('v', (1, 1)), ('v', (1, 2))):
+            q.push_move(q.get_turn(), move)
+
+        # player 1 fenced into the corner column, with the way out at the bottom of (0, 2)
+        for fair_play in (True, False):
+            batch = batch_from_games([q], fair_play)
+            self.assertEqual(batch.legal_fence_mask()[0, 0, 3, 0], not fair_play)
+            self.assertEqual(batch.apply_moves(np.array([move_index(('h', (0, 3)))]))[0], not fair_play)
@@ -0,0 +1,294 @@
+# Author: Christopher Felt
+# Date: 10/18/2026
+#
+# Description: Benchmark program for the Quoridor program. Runs a set of workloads on QuoridorGame objects that use the
+# Board class, the CompactBoard class and the FlatBoard class and reports each result as a rate (calls, games or
+# workloads per second), plus the memory used by one QuoridorGame object, measured with tracemalloc. Results are
+# printed as a table, and can be written as JSON with --json so that runs from different versions can be diffed.
+# Passing an earlier JSON file with --baseline lists every result that got worse by more than the tolerance (10% by
+# default) and exits with status 1 if there are any.
+#
+# The workloads are: creating a new game, copying a game in progress (the way a bot explores a move), playing a short
+# scripted game while checking the legality of a pawn move to every cell of the board before each turn, replaying the
+# scripted game and restoring its last position with from_bytes, move_pawn and place_fence calls, __check_move_legality
+# calls for an orthogonal step, a jump and a diagonal move, random full games, and exploring every legal move of a
+# position with a deep copy of the game or with push_move and pop_move.
+#
+# Every workload uses fixed moves or a fixed random seed, and the best of several timing runs is kept.
+
+# import modules
+from Quoridor import QuoridorGame, Board, CompactBoard, FlatBoard
+from QuoridorPolicy import RandomPlayer, GREEDY_CHANCE, play_moves
+import argparse
+import copy
+import json
+import platform
+import random
+import sys
+import time
+import timeit
+import tracemalloc
+
+# scripted game as (player, orientation, coordinates). orientation is None for pawn moves
+SCRIPT = [(1, None, (4, 1)), (2, None, (4, 7)), (1, 'h', (6, 5)), (2, 'v', (3, 3)), (1, None, (4, 2)),
+          (2, 'h', (4, 3)), (1, None, (5, 2)), (2, None, (4, 6)), (1, 'v', (5, 5)), (2, None, (4, 5)),
+          (1, None, (5, 3)), (2, 'h', (5, 4)), (1, None, (5, 4)), (2, None, (4, 4)), (1, 'v', (4, 4))]
+
+# pawn moves that put both pawns back where they started, for timing move_pawn
+SHUFFLE = [(1, (4, 1)), (2, (4, 7)), (1, (4, 0)), (2, (4, 8))]
+
+# every fence of both players, taking turns, for timing place_fence
+FENCES = [fence for pair in zip([(1, 'h', (col, row)) for row in (2, 5) for col in range(5)],
+                                [(2, 'v', (col, row)) for col in (7, 2) for row in range(5)]) for fence in pair]
+
+# pawn move cases for __check_move_legality as (player 1 pawn, player 2 pawn, fences, target of player 1's move)
+MOVE_CASES = {"orthogonal": ((4, 4), (0, 8), [], (4, 5)),
+              "jump": ((4, 4), (4, 5), [], (4, 6)),
+              "diagonal": ((4, 4), (4, 5), [('h', (4, 6))], (3, 5))}
+
+SEED = 162  # random seed for the random games
+
+
+def play_workload(board_class):
+    """Given a board class, plays the scripted game on a new QuoridorGame object that uses that board class, checking
+    the legality of a pawn move to every cell of the board before each turn. Returns nothing."""
+    q = QuoridorGame(board_class)
+    check_move = q._QuoridorGame__check_move_legality  # legality check used by move_pawn
+
+    for player, orient, coord in SCRIPT:
+        # probe every cell of the board for the player whose turn it is
+        for col in range(9):
+            for row in range(9):
+                check_move(player, (col, row))
+
+        # make the scripted move
+        q.push_move(player, (orient, coord))
+
+
+def copy_workload(board_class):
+    """Given a board class, plays the scripted game on a new QuoridorGame object that uses that board class and makes a
+    deep copy of the game after every move. Returns nothing."""
+    q = QuoridorGame(board_class)
+
+    for player, orient, coord in SCRIPT:
+        copy.deepcopy(q)
+        q.push_move(player, (orient, coord))  # make the scripted move
+
+
+def explore_workload(board_class, use_copy):
+    """Given a board class and a Boolean, plays the scripted game on a new QuoridorGame object that uses that board
+    class and tries every legal move for the player whose turn it is before each turn, on a deep copy of the game if
+    use_copy is True, otherwise with push_move and pop_move. Returns nothing."""
+    q = QuoridorGame(board_class)
+
+    for player, orient, coord in SCRIPT:
+        for move in q.legal_moves(player):
+            if use_copy:
+                copy.deepcopy(q).push_move(player, move)
+            else:
+                q.push_move(player, move)
+                q.pop_move()
+
+        q.push_move(player, (orient, coord))  # make the scripted move
+
+
+def random_game(board_class, rand):
+    """Given a board class and a random.Random object, plays a random game on a new QuoridorGame object that uses that
+    board class with the greedy RandomPlayer of the QuoridorPolicy program for both players, until a player wins or
+    MAX_PLIES moves are made. Returns nothing."""
+    policy = RandomPlayer(rand, GREEDY_CHANCE)
+    for player, move in play_moves(QuoridorGame(board_class), [policy, policy]):
+        pass
+
+
+def replay_workload(board_class):
+    """Given a board class, plays the scripted game on a new QuoridorGame object that uses that board class. Returns
+    the game."""
+    q = QuoridorGame(board_class)
+    for player, orient, coord in SCRIPT:
+        q.push_move(player, (orient, coord))
+
+    return q
+
+
+def time_workload(function, board_class, number, repeat=5):
+    """Given a workload function, a board class, the number of workloads per run, and the number of timing runs,
+    returns the best time in seconds taken to run the workload once."""
+    return min(timeit.repeat(lambda: function(board_class), repeat=repeat, number=number)) / number
+
+
+def call_rate(setup, run, calls, repeat=5):
+    """Given a setup function, a run function, the number of calls made by one run, and the number of timing runs,
+    times run on a new result of setup for each timing run (setup isn't timed) and returns the best number of calls
+    per second."""
+    best = None
+    for n in range(repeat):
+        state = setup()
+        start = time.perf_counter()
+        run(state)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    return calls / best
+
+
+def move_pawn_rate(board_class):
+    """Given a board class, returns the number of successful move_pawn calls per second."""
+    def run(q):
+        for n in range(100):
+            for player, coord in SHUFFLE:
+                q.move_pawn(player, coord)
+
+    return call_rate(lambda: QuoridorGame(board_class), run, 100 * len(SHUFFLE))
+
+
+def place_fence_rate(board_class):
+    """Given a board class, returns the number of successful place_fence calls per second, placing every fence of
+    both players on new games."""
+    def run(games):
+        for q in games:
+            for player, orient, coord in FENCES:
+                q.place_fence(player, orient, coord)
+
+    return call_rate(lambda: [QuoridorGame(board_class) for n in range(20)], run, 20 * len(FENCES))
+
+
+def check_move_rate(board_class, case):
+    """Given a board class and the name of a case in MOVE_CASES, returns the number of __check_move_legality calls
+    per second for player 1's move in that case."""
+    p1, p2, fences, target = MOVE_CASES[case]
+    q = QuoridorGame(board_class, fair_play=False)
+    q.change_pawn_loc(p1, p2)
+    for orient, coord in fences:
+        q.place_fence(q.get_turn(), orient, coord)
+
+    check_move = q._QuoridorGame__check_move_legality
+    assert check_move(1, target), case  # every case is a legal move
+
+    def run(state):
+        for n in range(1000):
+            check_move(1, target)
+
+    return call_rate(lambda: None, run, 1000)
+
+
+def random_game_rate(board_class, games=20):
+    """Given a board class and the number of games per timing run, returns the number of random full games played per
+    second. Every timing run plays the same games."""
+    def run(rand):
+        for n in range(games):
+            random_game(board_class, rand)
+
+    return call_rate(lambda: random.Random(SEED), run, games, repeat=3)
+
+
+def game_memory(board_class, count=100):
+    """Given a board class and a number of games, returns the number of bytes allocated for each new QuoridorGame
+    object that uses that board class, measured with tracemalloc over that many games."""
+    QuoridorGame(board_class)  # build shared tables before measuring
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    games = [QuoridorGame(board_class) for n in range(count)]
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    return used // len(games)
+
+
+def board_results(board_class):
+    """Given a board class, runs every workload with that board class and returns a dictionary of the results. Keys
+    ending in _per_second are rates, where higher is better; bytes_per_game is memory, where lower is better."""
+    state = replay_workload(board_class).to_bytes()  # position at the end of the scripted game
+    results = {"new_game_per_second": 1 / time_workload(QuoridorGame, board_class, 2000),
+               "copy_workload_per_second": 1 / time_workload(copy_workload, board_class, 10),
+               "legality_probes_per_second": 1 / time_workload(play_workload, board_class, 50),
+               "replay_script_per_second": 1 / time_workload(replay_workload, board_class, 200),
+               "from_bytes_per_second": 1 / time_workload(lambda cls: QuoridorGame.from_bytes(state, cls), board_class,
+                                                          200),
+               "move_pawn_per_second": move_pawn_rate(board_class),
+               "place_fence_per_second": place_fence_rate(board_class),
+               "random_games_per_second": random_game_rate(board_class),
+               "explore_deepcopy_per_second": 1 / time_workload(lambda cls: explore_workload(cls, True), board_class,
+                                                                1, repeat=3),
+               "explore_push_pop_per_second": 1 / time_workload(lambda cls: explore_workload(cls, False), board_class,
+                                                                1, repeat=3),
+               "bytes_per_game": game_memory(board_class)}
+
+    for case in MOVE_CASES:
+        results["check_move_%s_per_second" % case] = check_move_rate(board_class, case)
+
+    return results
+
+
+def run_benchmarks():
+    """Runs every workload with the Board, CompactBoard and FlatBoard classes and returns a dictionary of the Python
+    version, the platform, and the results for each board class."""
+    return {"python": platform.python_version(),
+            "platform": platform.platform(),
+            "results": {board_class.__name__: board_results(board_class)
+                        for board_class in (Board, CompactBoard, FlatBoard)}}
+
+
+def find_regressions(baseline, current, tolerance=0.1):
+    """Given two dictionaries returned by run_benchmarks and the fraction by which a result may get worse, returns a
+    list of a line of text for each result in both that got worse by more than that: a rate that dropped, or memory
+    that grew. New workloads and results that were 0 in the baseline are skipped."""
+    regressions = []
+    for name, results in current["results"].items():
+        for key, value in sorted(results.items()):
+            old = baseline["results"].get(name, {}).get(key)
+            if not old:
+                continue  # new workload, or nothing to compare with
+
+            change = value / old - 1
+            if (key.endswith("_per_second") and change < -tolerance) or \
+                    (key == "bytes_per_game" and change > tolerance):
+                regressions.append("%s %s: %.6g -> %.6g (%+.1f%%)" % (name, key, old, value, change * 100))
+
+    return regressions
+
+
+def print_results(report):
+    """Given a dictionary returned by run_benchmarks, prints a table of the results with the speedup of CompactBoard and
+    FlatBoard over Board (for memory, the ratio of Board's memory to theirs). Returns nothing."""
+    board, compact, flat = [report["results"][name] for name in ("Board", "CompactBoard", "FlatBoard")]
+    print("%-34s %14s %14s %8s %14s %8s" % ("result", "Board", "CompactBoard", "speedup", "FlatBoard", "speedup"))
+
+    for key in board:
+        ratios = [board[key] / other[key] if key == "bytes_per_game" else other[key] / board[key]
+                  for other in (compact, flat)]
+        print("%-34s %14.1f %14.1f %7.2fx %14.1f %7.2fx" % (key, board[key], compact[key], ratios[0], flat[key],
+                                                            ratios[1]))
+
+
+# define main function
+def main():
+    """Runs the benchmarks, prints the results, and writes them as JSON or compares them with a baseline if asked to by
+    the command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark the Quoridor program.")
+    parser.add_argument("--json", help="write the results to this JSON file ('-' for standard output only)")
+    parser.add_argument("--baseline", help="JSON file of earlier results to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="fraction a result may get worse (default 0.1)")
+    args = parser.parse_args()
+
+    report = run_benchmarks()
+    if args.json == "-":
+        print(json.dumps(report, indent=2, sort_keys=True))
+    else:
+        print_results(report)
+        if args.json:
+            with open(args.json, "w") as file:
+                json.dump(report, file, indent=2, sort_keys=True)
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            regressions = find_regressions(json.load(file), report, args.tolerance)
+        for line in regressions:
+            print("regression:", line, file=sys.stderr)
+        sys.exit(1 if regressions else 0)
+
+
+# run main function if run as script
+if __name__ == '__main__':
+    main()
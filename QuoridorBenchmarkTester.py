@@ -0,0 +1,29 @@
+# Author: Christopher Felt
+# Date: 10/18/2026
+#
+# Description: Unit test program for testing the QuoridorBenchmark program. Checks which results find_regressions
+# reports.
+
+# import modules
+from QuoridorBenchmark import find_regressions
+import unittest
+
+
+def report(**results):
+    """Given the results of one board class as keyword arguments, returns a report shaped like run_benchmarks'."""
+    return {"python": "3", "platform": "test", "results": {"FlatBoard": results}}
+
+
+class UnitTests(unittest.TestCase):
+    """Class for testing the QuoridorBenchmark program. Inherits from Unit test."""
+
+    def test_find_regressions(self):
+        """Test that slower rates and more memory beyond the tolerance are reported, and new or zero results aren't."""
+        baseline = report(moves_per_second=1000.0, games_per_second=50.0, bytes_per_game=10000, pops_per_second=0.0)
+        current = report(moves_per_second=850.0, games_per_second=47.0, bytes_per_game=12000, pops_per_second=5.0,
+                         jumps_per_second=1.0)
+        self.assertEqual(find_regressions(baseline, current),
+                         ["FlatBoard bytes_per_game: 10000 -> 12000 (+20.0%)",
+                          "FlatBoard moves_per_second: 1000 -> 850 (-15.0%)"])
+        self.assertEqual(find_regressions(baseline, current, tolerance=0.25), [])
+        self.assertEqual(find_regressions(current, current), [])
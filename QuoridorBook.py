@@ -0,0 +1,162 @@
+# Author: Christopher Felt
+# Date: 10/18/2026
+#
+# Description: Opening book for bots that play the Quoridor program. build_book searches every position of the first
+# few moves of a game with an AlphaBetaPlayer, starting from the position of a new QuoridorGame, and write_book saves
+# the best move of each position to a book file. In the book each position takes BOOK_RECORD bytes: its Zobrist hash
+# and the move_index of its move, sorted by hash.
+#
+# The OpeningBook class memory-maps a book file, so opening it reads nothing, and finds a position's move with a binary
+# search on the hashes. The BookPlayer class is a bot that plays the book move while the game is in the book and falls
+# back on another bot's search once it isn't.
+#
+# Run this file as a script to build a book file: python QuoridorBook.py BOOK_FILE [PLIES] [TIME_LIMIT_MS]
+
+# import modules
+from Quoridor import QuoridorGame, FlatBoard, move_index, index_move
+from QuoridorSearch import AlphaBetaPlayer
+import mmap
+import struct
+import sys
+import time
+
+BOOK_MAGIC = b"QBK1"  # first bytes of a book file
+BOOK_HEADER = struct.Struct("<4sI")  # magic and number of positions
+BOOK_ENTRY = struct.Struct("<QH")  # position hash and move index
+BOOK_RECORD = BOOK_ENTRY.size  # bytes per position
+
+
+def build_book(plies=4, time_limit=200, board_class=FlatBoard):
+    """Given the number of moves from the start of the game to cover, the search time per position in milliseconds,
+    and a board class, returns a dictionary of the best move found by an AlphaBetaPlayer for every position in the book.
+    The book covers the positions reached by playing either the book move or any pawn move at each turn, since those
+    are the moves an opponent is most likely to make early on."""
+    searcher = AlphaBetaPlayer(time_limit)
+    book = {}
+    add_position(QuoridorGame(board_class), plies, searcher, book)
+    return book
+
+
+def add_position(game, plies, searcher, book):
+    """Given a QuoridorGame object, the number of moves left to cover, an AlphaBetaPlayer, and the dictionary of book
+    moves by position hash, searches the game's position if it isn't in the book yet, then adds the positions after the
+    book move and each pawn move. Returns nothing."""
+    player = game.get_turn()
+    if plies == 0 or game.is_winner(player) or game.get_hash() in book:
+        return
+
+    move = searcher.choose_move(game)
+    book[game.get_hash()] = move
+
+    replies = [move] + [(None, coord) for coord in game.legal_pawn_moves(player) if (None, coord) != move]
+    for reply in replies:
+        with game.trial(player, reply) as result:
+            if result is True:
+                add_position(game, plies - 1, searcher, book)
+
+
+def write_book(path, book):
+    """Given a file name and a dictionary of moves by position hash, writes the book file. Returns nothing."""
+    with open(path, "wb") as file:
+        file.write(BOOK_HEADER.pack(BOOK_MAGIC, len(book)))
+        for key in sorted(book):
+            file.write(BOOK_ENTRY.pack(key, move_index(book[key])))
+
+
+class OpeningBook:
+    """Represents a book file opened for lookups. The file is memory-mapped, so the operating system only reads the
+    pages a lookup touches, and the map is shared by every process that opens the same file. Raises ValueError if the
+    file isn't a book file."""
+    # initialize data members
+    def __init__(self, path):
+        with open(path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)  # contents of the book file
+
+        if len(self._map) < BOOK_HEADER.size:
+            self._map.close()
+            raise ValueError("not a book file: %s" % path)
+
+        magic, self._size = BOOK_HEADER.unpack_from(self._map)  # number of positions
+        if magic != BOOK_MAGIC or len(self._map) != BOOK_HEADER.size + self._size * BOOK_RECORD:
+            self._map.close()
+            raise ValueError("not a book file: %s" % path)
+
+    def get_size(self):
+        """Takes no parameters and returns the number of positions in the book."""
+        return self._size
+
+    def lookup(self, key):
+        """Given a position hash, returns the book move for that position as a tuple of orientation and coordinates, or
+        None if the position isn't in the book."""
+        low, high = 0, self._size
+        while low < high:  # binary search on the sorted hashes
+            middle = (low + high) // 2
+            found, index = BOOK_ENTRY.unpack_from(self._map, BOOK_HEADER.size + middle * BOOK_RECORD)
+            if found == key:
+                return index_move(index)
+            if found < key:
+                low = middle + 1
+            else:
+                high = middle
+
+        return None
+
+    def close(self):
+        """Takes no parameters. Closes the memory map. Returns nothing."""
+        self._map.close()
+
+
+class BookPlayer:
+    """Represents a bot that plays the book move for the player whose turn it is when the position is in an
+    OpeningBook, and otherwise returns the move chosen by a fallback bot (any object with a choose_move method, such as
+    an AlphaBetaPlayer)."""
+    # initialize data members
+    def __init__(self, book, fallback):
+        self._book = book  # OpeningBook object
+        self._fallback = fallback  # bot used out of book
+        self._stats = {"book_moves": 0, "searched_moves": 0}
+
+    def choose_move(self, game):
+        """Given a QuoridorGame object, returns the book move for its position if there is one and it is legal, or the
+        fallback bot's move if not. The game is left as it was found."""
+        player = game.get_turn()
+        move = self._book.lookup(game.get_hash())
+
+        if move is not None and not game.is_winner(player):
+            with game.trial(player, move) as result:
+                if result is True:  # guards against hash collisions
+                    self._stats["book_moves"] += 1
+                    return move
+
+        self._stats["searched_moves"] += 1
+        return self._fallback.choose_move(game)
+
+    def get_stats(self):
+        """Takes no parameters and returns a dictionary of the number of moves played from the book and searched."""
+        return dict(self._stats)
+
+
+# define main function
+def main():
+    """Builds a book file with the file name, number of moves and search time per position given on the command line,
+    then prints the number of positions and the average lookup time."""
+    if len(sys.argv) < 2:
+        print("usage: python QuoridorBook.py BOOK_FILE [PLIES] [TIME_LIMIT_MS]")
+        return
+
+    plies = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    time_limit = int(sys.argv[3]) if len(sys.argv) > 3 else 200
+    write_book(sys.argv[1], build_book(plies, time_limit))
+
+    book = OpeningBook(sys.argv[1])
+    key = QuoridorGame().get_hash()
+    start = time.perf_counter()
+    for n in range(10000):
+        book.lookup(key)
+    print("%d positions, %.2f us per lookup" % (book.get_size(), (time.perf_counter() - start) * 100))
+    book.close()
+
+
+# run main function if run as script
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+# Author: Christopher Felt
+# Date: 10/18/2026
+#
+# Description: Unit test program for testing the QuoridorBook program. Builds a small book and looks up its moves.
+
+# import modules
+from QuoridorBook import build_book, write_book, OpeningBook, BookPlayer
+from Quoridor import QuoridorGame
+import os
+import tempfile
+import unittest
+
+
+class FixedPlayer:
+    """Represents a stand-in bot that always chooses the same move."""
+    # initialize data members
+    def __init__(self, move):
+        self._move = move  # move to choose
+
+    def choose_move(self, game):
+        """Given a QuoridorGame object, returns the fixed move."""
+        return self._move
+
+
+class UnitTests(unittest.TestCase):
+    """Class for testing the QuoridorBook program. Inherits from Unit test."""
+
+    def setUp(self):
+        """Builds a two move book and writes it to a temporary file."""
+        self.book = build_book(2, 20)
+        handle, self.path = tempfile.mkstemp()
+        os.close(handle)
+        write_book(self.path, self.book)
+
+    def tearDown(self):
+        """Deletes the book file."""
+        os.remove(self.path)
+
+    def test_OpeningBook(self):
+        """Test that every book position's move is found and other positions aren't."""
+        book = OpeningBook(self.path)
+        self.assertEqual(book.get_size(), len(self.book))
+        for key, move in self.book.items():
+            self.assertEqual(book.lookup(key), move)
+
+        q = QuoridorGame()
+        self.assertIn(book.lookup(q.get_hash()), q.legal_moves(1))
+        q.place_fence(1, 'h', (0, 1))
+        self.assertIsNone(book.lookup(q.get_hash()))
+        book.close()
+
+        # file that isn't a book
+        with open(self.path, "wb") as file:
+            file.write(b"not a book")
+        self.assertRaises(ValueError, OpeningBook, self.path)
+
+        # file shorter than the header
+        with open(self.path, "wb") as file:
+            file.write(b"QB")
+        self.assertRaises(ValueError, OpeningBook, self.path)
+
+    def test_BookPlayer(self):
+        """Test that book moves are played in book and the fallback bot's moves out of book."""
+        book = OpeningBook(self.path)
+        player = BookPlayer(book, FixedPlayer(('v', (8, 8))))
+
+        q = QuoridorGame()
+        self.assertEqual(player.choose_move(q), self.book[q.get_hash()])
+        q.place_fence(1, 'h', (0, 1))
+        self.assertEqual(player.choose_move(q), ('v', (8, 8)))
+        self.assertEqual(player.get_stats(), {"book_moves": 1, "searched_moves": 1})
+        book.close()
@@ -0,0 +1,200 @@
+# Author: Christopher Felt
+# Date: 10/18/2026
+#
+# Description: Static evaluation of Quoridor positions for bots. The Evaluator class scores a QuoridorGame position
+# from a weighted sum of features, each counted as the player's value minus the opponent's:
+#
+#   path_difference   steps on the opponent's shortest path to their goal row minus steps on the player's
+#   path_count        log2 of the number of different shortest paths of the player's pawn, minus the opponent's (more
+#                     shortest paths are harder to block with one fence)
+#   mobility          legal pawn moves of the player, from QuoridorGame.legal_pawn_moves, minus the opponent's
+#   fence_difference  fences the player has left minus the fences the opponent has left
+#
+# The features of a position are cached by its Zobrist hash, so a position reached again (by another move order or in
+# the next iteration of a search) costs one lookup. The number of shortest paths from every cell is cached by fence
+# layout (see layout_hash in the QuoridorTablebase program), so it is only counted again after a fence is placed; pawn
+# moves reuse it, and the path lengths come from the DistanceMaps the game already keeps up to date. Both caches drop
+# their oldest entry when full.
+#
+# Evaluator.evaluate takes the same parameters as evaluate in the QuoridorSearch program, so it can be passed to
+# AlphaBetaPlayer as AlphaBetaPlayer(evaluate=Evaluator().evaluate). Run this file as a script to measure evaluations
+# per second.
+
+# import modules
+from Quoridor import QuoridorGame, FlatBoard, UNREACHABLE, goal_cells, check_standard_game
+from QuoridorSearch import evaluate
+from QuoridorTablebase import layout_hash, layout_adjacency
+from QuoridorPolicy import RandomPlayer, play_moves
+import math
+import random
+import time
+
+FEATURES = ("path_difference", "path_count", "mobility", "fence_difference")  # names of the features, in order
+DEFAULT_WEIGHTS = {"path_difference": 10, "path_count": 1, "mobility": 1, "fence_difference": 1}
+
+
+def count_shortest_paths(adjacent, player):
+    """Given an adjacency list of a 9x9 board, shaped like a neighbor table with None for closed borders, and an integer
+    that represents the player, returns a list of the number of different shortest paths from each cell to the player's
+    goal row (0 if fences block every path). Counted with a breadth-first search from the goal row."""
+    queue = goal_cells(9, player)
+    dist = [UNREACHABLE] * len(adjacent)
+    counts = [0] * len(adjacent)
+    for n in queue:
+        dist[n], counts[n] = 0, 1
+
+    # visit cells in order of distance; every path to a cell one step further goes through a cell of this distance
+    for n in queue:
+        for neighbor in adjacent[n]:
+            if neighbor is None:
+                continue
+            if dist[neighbor] == UNREACHABLE:
+                dist[neighbor] = dist[n] + 1
+                queue.append(neighbor)
+            if dist[neighbor] == dist[n] + 1:
+                counts[neighbor] += counts[n]
+
+    return counts
+
+
+class Evaluator:
+    """Represents a static evaluation with a weight for each feature in FEATURES. Weights not passed keep their value
+    in DEFAULT_WEIGHTS. Features are cached for up to max_positions positions, and shortest path counts for up to
+    max_layouts fence layouts. Raises ValueError if a weight is given for a feature that doesn't exist."""
+    # initialize data members
+    def __init__(self, weights=None, max_positions=65536, max_layouts=1024):
+        weights = dict(DEFAULT_WEIGHTS, **(weights or {}))
+        if set(weights) != set(FEATURES):
+            raise ValueError("unknown features: %s" % ", ".join(sorted(set(weights) - set(FEATURES))))
+
+        self._weights = tuple(weights[name] for name in FEATURES)  # weight of each feature, in order
+        self._max_positions = max_positions  # positions kept in the cache
+        self._max_layouts = max_layouts  # layouts kept in the cache
+        self._positions = {}  # (features, score) for player 1 for each position hash, oldest first
+        self._layouts = {}  # shortest path counts of player 1 and player 2 for each layout hash, oldest first
+        self._stats = {"hits": 0, "misses": 0, "layouts": 0}
+
+    def evaluate(self, game, player):
+        """Given a QuoridorGame object and an integer that represents the player, returns the weighted sum of the
+        features from that player's point of view. Raises ValueError unless the game is a two-player 9x9 game."""
+        check_standard_game(game)
+        entry = self._positions.get(game.get_hash())
+        if entry is None:
+            entry = self.__compute(game)
+        else:
+            self._stats["hits"] += 1
+
+        return entry[1] if player == 1 else -entry[1]
+
+    def features(self, game, player):
+        """Given a QuoridorGame object and an integer that represents the player, returns a dictionary of the value of
+        each feature from that player's point of view. Raises ValueError unless the game is a two-player 9x9 game."""
+        check_standard_game(game)
+        entry = self._positions.get(game.get_hash()) or self.__compute(game)
+        sign = 1 if player == 1 else -1
+        return {name: value * sign for name, value in zip(FEATURES, entry[0])}
+
+    def __compute(self, game):
+        """Given a QuoridorGame object, computes the features and score of the position for player 1, adds them to the
+        position cache, and returns them as a tuple."""
+        self._stats["misses"] += 1
+        counts = self.__path_counts(game)
+        values = []
+
+        for player in (1, 2):
+            path = game.get_path_length(player)
+            loc = game.get_pawn_loc(player)
+            values.append((-(UNREACHABLE if path is None else path),
+                           math.log2(max(counts[player - 1][loc[0] + loc[1] * 9], 1)),
+                           len(game.legal_pawn_moves(player)),
+                           game.get_fences(player)))
+
+        features = tuple(mine - theirs for mine, theirs in zip(*values))
+        entry = features, sum(weight * value for weight, value in zip(self._weights, features))
+        self.__store(self._positions, game.get_hash(), entry, self._max_positions)
+        return entry
+
+    def __path_counts(self, game):
+        """Given a QuoridorGame object, returns a tuple of the shortest path counts of player 1 and player 2 for its
+        fence layout, counting them if the layout isn't cached."""
+        key = layout_hash(game)
+        counts = self._layouts.get(key)
+
+        if counts is None:
+            adjacent = layout_adjacency(game.get_placed_fences())
+            counts = count_shortest_paths(adjacent, 1), count_shortest_paths(adjacent, 2)
+            self.__store(self._layouts, key, counts, self._max_layouts)
+            self._stats["layouts"] += 1
+
+        return counts
+
+    def __store(self, cache, key, value, limit):
+        """Given a cache dictionary, a key, a value and the most entries the cache may hold, adds the entry and drops
+        the oldest one if the cache is over the limit. Returns nothing."""
+        cache[key] = value
+        if len(cache) > limit:
+            del cache[next(iter(cache))]
+
+    def get_stats(self):
+        """Takes no parameters and returns a dictionary of the position cache hits and misses and the layouts
+        counted."""
+        return dict(self._stats)
+
+    def clear(self):
+        """Takes no parameters. Empties both caches and resets the stats. Returns nothing."""
+        self._positions.clear()
+        self._layouts.clear()
+        self._stats = {"hits": 0, "misses": 0, "layouts": 0}
+
+
+def sample_positions(count, seed=21):
+    """Given a number of positions and a seed, plays random games with the RandomPlayer of the QuoridorPolicy program
+    and returns a list of that many QuoridorGame objects, each a game stopped after a random number of moves (fewer
+    than 40)."""
+    rand = random.Random(seed)
+    positions = []
+
+    while len(positions) < count:
+        game = QuoridorGame(FlatBoard)
+        policy = RandomPlayer(rand)
+        for player, move in play_moves(game, [policy, policy], rand.randrange(40)):
+            pass
+        positions.append(game)
+
+    return positions
+
+
+def evaluation_rate(function, positions, repeat=3):
+    """Given an evaluation function that takes a game and a player, a list of QuoridorGame objects and a number of
+    runs, evaluates every position for both players in each run and returns the evaluations per second of the fastest
+    run."""
+    best = None
+    for run in range(repeat):
+        start = time.perf_counter()
+        for game in positions:
+            function(game, 1)
+            function(game, 2)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    return 2 * len(positions) / best
+
+
+# define main function
+def main():
+    """Measures the evaluations per second of the evaluate function of the QuoridorSearch program, of an Evaluator on
+    positions it hasn't seen, and of an Evaluator on positions it has cached, and prints them."""
+    positions = sample_positions(500)
+    cold = [evaluation_rate(Evaluator().evaluate, positions, 1) for run in range(3)]
+    evaluator = Evaluator()
+    evaluation_rate(evaluator.evaluate, positions, 1)  # fill the caches
+
+    print("%-26s %12s" % ("evaluation", "evals/s"))
+    print("%-26s %12.0f" % ("QuoridorSearch.evaluate", evaluation_rate(evaluate, positions)))
+    print("%-26s %12.0f" % ("Evaluator (cold cache)", max(cold)))
+    print("%-26s %12.0f" % ("Evaluator (warm cache)", evaluation_rate(evaluator.evaluate, positions)))
+
+
+# run main function if run as script
+if __name__ == '__main__':
+    main()
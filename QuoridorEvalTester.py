@@ -0,0 +1,53 @@
+# Author: Christopher Felt
+# Date: 10/18/2026
+#
+# Description: Unit test program for testing the QuoridorEval program. Checks the features of known positions and that
+# cached scores match scores computed from scratch.
+
+# import modules
+from QuoridorEval import Evaluator, sample_positions
+from Quoridor import QuoridorGame, FlatBoard
+import unittest
+
+
+class UnitTests(unittest.TestCase):
+    """Class for testing the QuoridorEval program. Inherits from Unit test."""
+
+    def test_features(self):
+        """Test each feature and the weighted score of a position with one fence."""
+        evaluator = Evaluator()
+        q = QuoridorGame()
+        self.assertEqual(evaluator.evaluate(q, 1), 0)  # opening position is even
+
+        # both pawns have to step around the fence: 2 shortest paths for player 1, 16 for player 2
+        q.place_fence(1, 'h', (4, 1))
+        expected = {"path_difference": 0, "path_count": -3.0, "mobility": -1, "fence_difference": -1}
+        self.assertEqual(evaluator.features(q, 1), expected)
+        self.assertEqual(evaluator.features(q, 2), {name: -value for name, value in expected.items()})
+        self.assertEqual(evaluator.evaluate(q, 1), -5)
+        self.assertEqual(Evaluator({"path_count": 2, "mobility": 0}).evaluate(q, 2), 7)
+
+        with self.assertRaises(ValueError):
+            Evaluator({"center": 1})
+
+        # only two-player 9x9 games
+        for game in (QuoridorGame(FlatBoard, size=5), QuoridorGame(FlatBoard, players=4)):
+            self.assertRaises(ValueError, evaluator.evaluate, game, 1)
+            self.assertRaises(ValueError, evaluator.features, game, 1)
+
+    def test_caches(self):
+        """Test that positions and layouts are reused, and that cached scores match an empty Evaluator's."""
+        evaluator = Evaluator(max_positions=50, max_layouts=10)
+        q = QuoridorGame()
+        evaluator.evaluate(q, 1)
+        evaluator.evaluate(q, 2)
+        q.move_pawn(1, (4, 1))
+        evaluator.evaluate(q, 2)
+        self.assertEqual(evaluator.get_stats(), {"hits": 1, "misses": 2, "layouts": 1})  # pawn move kept the layout
+
+        for game in sample_positions(200) * 2:
+            self.assertEqual(evaluator.evaluate(game, 2), Evaluator().evaluate(game, 2))
+        self.assertGreater(evaluator.get_stats()["hits"], 1)
+
+        evaluator.clear()
+        self.assertEqual(evaluator.get_stats(), {"hits": 0, "misses": 0, "layouts": 0})
@@ -0,0 +1,332 @@
+# Author: Christopher Felt
+# Date: 10/18/2026
+#
+# Description: Monte Carlo tree search bot for the Quoridor program. The MCTSPlayer class grows a search tree over a
+# QuoridorGame with push_move and pop_move, and scores each new leaf by playing the rest of the game out with fast
+# random moves (a playout). Playouts don't use the QuoridorGame: they run on a RolloutBoard, which holds only an
+# adjacency list, two pawn cells, the fences left and the turn, and moves pawns greedily along their shortest paths
+# with random fences mixed in.
+#
+# With more than one worker, the MCTSPlayer uses root parallelism: each worker process in a process pool grows its own
+# tree from the same position with its own random seed, and the visit counts of the root moves are added together to
+# pick the move. Run this file as a script to measure playouts per second and the scaling efficiency at 1, 2, 4 and 8
+# workers.
+
+# import modules
+from concurrent.futures import ProcessPoolExecutor
+from Quoridor import QuoridorGame, FlatBoard, neighbor_table, check_standard_game, FENCE_SLOTS, UNREACHABLE, TOP, \
+    RIGHT, BOT, LEFT
+from QuoridorPolicy import FENCE_CHANCE, GREEDY_CHANCE
+import math
+import random
+import time
+
+PLAYOUT_PLIES = 200  # playouts longer than this are decided by the shorter path to the goal row
+
+
+class RolloutBoard:
+    """Represents a compact copy of a QuoridorGame position used for fast playouts. Holds an adjacency list shaped like
+    a neighbor table (None where a border is closed), the cell number of each pawn, the fences each player has left,
+    and whose turn it is, plus each player's distance to their goal row from every cell, which only changes when a
+    fence is placed. Playout moves are always legal moves, though only a subset of them: pawns take single steps to
+    free cells, and a fence is only kept if both pawns can still reach their goal rows. Raises ValueError unless the
+    game is a two-player 9x9 game."""
+    # initialize data members
+    def __init__(self, game):
+        check_standard_game(game)
+        self._adjacent = [list(row) for row in neighbor_table(9)]  # open neighbors of each cell
+        self._pawns = {}  # cell number of each player's pawn
+        self._stock = {}  # fences left for each player
+        self._turn = game.get_turn()  # player to move
+
+        for player in (1, 2):
+            loc = game.get_pawn_loc(player)
+            self._pawns[player] = loc[0] + loc[1] * 9
+            self._stock[player] = game.get_fences(player)
+
+        for orient, coord in game.get_placed_fences():
+            self.__set_border(orient, coord, False)
+
+        self._dist = {1: self.distances(1), 2: self.distances(2)}  # steps to the goal row from each cell
+
+    def __set_border(self, orient, coord, is_open):
+        """Given the orientation and coordinates of a fence and a Boolean, opens the border under the fence if the
+        Boolean is True, otherwise closes it. Returns nothing."""
+        second = coord[0] + coord[1] * 9
+        first, direction = (second - 9, BOT) if orient == 'h' else (second - 1, RIGHT)
+
+        self._adjacent[first][direction] = second if is_open else None
+        self._adjacent[second][(direction + 2) % 4] = first if is_open else None
+
+    def distances(self, player):
+        """Given an integer that represents the player, returns a list of the number of steps from each cell to that
+        player's goal row (UNREACHABLE if there is no path), found with a breadth-first search."""
+        goal_row = 8 if player == 1 else 0
+        dist = [UNREACHABLE] * 81
+        queue = [col + goal_row * 9 for col in range(9)]
+        for n in queue:
+            dist[n] = 0
+
+        for n in queue:  # queue grows while it is being read
+            for neighbor in self._adjacent[n]:
+                if neighbor is not None and dist[neighbor] == UNREACHABLE:
+                    dist[neighbor] = dist[n] + 1
+                    queue.append(neighbor)
+
+        return dist
+
+    def play(self, rand):
+        """Given a random.Random object, plays the position out and returns the integer that represents the winner. If
+        the game lasts PLAYOUT_PLIES moves, the player with the shorter path wins, counting the move of the player to
+        move."""
+        for ply in range(PLAYOUT_PLIES):
+            player = self._turn
+            if not (self._stock[player] and rand.random() < FENCE_CHANCE and self.__random_fence(rand)):
+                self.__step(player, rand)
+
+            # player 1 wins on row 8 and player 2 wins on row 0
+            if (player == 1 and self._pawns[1] >= 72) or (player == 2 and self._pawns[2] < 9):
+                return player
+
+            self._turn = 3 - player
+
+        player = self._turn
+        return player if self._dist[player][self._pawns[player]] <= self._dist[3 - player][self._pawns[3 - player]] \
+            else 3 - player
+
+    def __step(self, player, rand):
+        """Given an integer that represents the player and a random.Random object, moves the player's pawn one step to
+        a free neighboring cell: the one closest to the goal row most of the time, otherwise a random one. The pawn
+        stays put if every neighbor is taken. Returns nothing."""
+        pawn = self._pawns[player]
+        steps = [n for n in self._adjacent[pawn] if n is not None and n != self._pawns[3 - player]]
+        if not steps:
+            return
+
+        if rand.random() < GREEDY_CHANCE:
+            self._pawns[player] = min(steps, key=self._dist[player].__getitem__)
+        else:
+            self._pawns[player] = rand.choice(steps)
+
+    def __random_fence(self, rand):
+        """Given a random.Random object, tries to place the player to move's fence in a random slot. Returns True if the
+        slot was free and the fence leaves both pawns a path to their goal rows. Otherwise leaves the board as it was
+        and returns False."""
+        orient, coord = rand.choice(FENCE_SLOTS)
+        second = coord[0] + coord[1] * 9
+        if self._adjacent[second][TOP if orient == 'h' else LEFT] is None:
+            return False  # fence already there
+
+        self.__set_border(orient, coord, False)
+        dist = {1: self.distances(1), 2: self.distances(2)}
+        if dist[1][self._pawns[1]] == UNREACHABLE or dist[2][self._pawns[2]] == UNREACHABLE:
+            self.__set_border(orient, coord, True)  # breaks the fair play rule
+            return False
+
+        self._dist = dist
+        self._stock[self._turn] -= 1
+        return True
+
+
+class TreeNode:
+    """Represents a node of a Monte Carlo search tree: the position after a move. Holds the move and the player who
+    made it, the parent node, the child nodes expanded so far, the legal moves not yet expanded, the number of
+    playouts through the node, and how many of them the player who made the move won."""
+    # initialize data members
+    def __init__(self, move, player, parent, untried):
+        self._move = move  # move that led to this position, as a tuple of orientation and coordinates
+        self._player = player  # player who made the move
+        self._parent = parent  # parent TreeNode, or None for the root
+        self._children = []  # expanded child TreeNodes
+        self._untried = untried  # legal moves from this position not yet expanded
+        self._visits = 0  # playouts through this node
+        self._wins = 0  # playouts won by self._player
+
+    def get_move(self):
+        """Takes no parameters and returns the move that led to this node."""
+        return self._move
+
+    def get_player(self):
+        """Takes no parameters and returns the integer that represents the player who made the move."""
+        return self._player
+
+    def is_expanded(self):
+        """Takes no parameters. Returns True if every legal move from this node has a child node and there is at least
+        one child. Otherwise returns False."""
+        return not self._untried and self._children
+
+    def pop_untried(self, rand):
+        """Given a random.Random object, removes and returns a random move that has no child node yet, or None if there
+        are none left."""
+        if not self._untried:
+            return None
+
+        return self._untried.pop(rand.randrange(len(self._untried)))
+
+    def select_child(self, exploration):
+        """Given the exploration constant, returns the child with the highest upper confidence bound score."""
+        log_visits = math.log(self._visits)
+        return max(self._children, key=lambda child: child._wins / child._visits +
+                   exploration * math.sqrt(log_visits / child._visits))
+
+    def add_child(self, move, player, untried):
+        """Given a move, the player who made it, and the legal moves from the resulting position, adds and returns a
+        new child node for it."""
+        child = TreeNode(move, player, self, untried)
+        self._children.append(child)
+        return child
+
+    def update(self, winner):
+        """Given the integer that represents the winner of a playout, adds the playout to this node and every node
+        above it. Returns nothing."""
+        node = self
+        while node is not None:
+            node._visits += 1
+            node._wins += node._player == winner
+            node = node._parent
+
+    def get_move_stats(self):
+        """Takes no parameters and returns a dictionary of (visits, wins) for the move of each child node."""
+        return {child._move: (child._visits, child._wins) for child in self._children}
+
+
+def descend(root, game, exploration, rand):
+    """Given the root TreeNode, the QuoridorGame object at the root's position, the exploration constant, and a
+    random.Random object, walks down the fully expanded nodes of the tree and adds a child for one untried move, unless
+    the game is over. Each move is made on the game with push_move. Returns a tuple of the node reached and the number
+    of moves made."""
+    node, depth = root, 0
+
+    # select: walk down fully expanded nodes
+    while node.is_expanded():
+        node = node.select_child(exploration)
+        game.push_move(node.get_player(), node.get_move())
+        depth += 1
+
+    # expand: add one untried move, unless the game is over
+    move = node.pop_untried(rand)
+    if move is not None:
+        mover = 3 - node.get_player()
+        game.push_move(mover, move)
+        depth += 1
+        node = node.add_child(move, mover, [] if game.is_winner(mover) else game.legal_moves(3 - mover))
+
+    return node, depth
+
+
+def grow_tree(game, time_limit, exploration, seed):
+    """Given a QuoridorGame object, a time limit in seconds, the exploration constant, and a random seed, grows a Monte
+    Carlo search tree from the game's position until the time runs out. Runs in a worker process when the search is
+    parallel. Returns a tuple of the dictionary of (visits, wins) for each root move and the number of playouts."""
+    rand = random.Random(seed)
+    player = game.get_turn()
+    root = TreeNode(None, 3 - player, None, game.legal_moves(player))
+    deadline = time.perf_counter() + time_limit
+    playouts = 0
+
+    while time.perf_counter() < deadline or playouts == 0:
+        node, depth = descend(root, game, exploration, rand)
+
+        # simulate from the new position, then back up the result
+        winner = node.get_player() if game.is_winner(node.get_player()) else RolloutBoard(game).play(rand)
+        node.update(winner)
+        playouts += 1
+
+        for n in range(depth):
+            game.pop_move()
+
+    return root.get_move_stats(), playouts
+
+
+class MCTSPlayer:
+    """Represents a bot that chooses moves for a QuoridorGame with Monte Carlo tree search within a time limit per move
+    (in milliseconds). With workers greater than 1, the search runs in that many processes of a process pool, each
+    growing its own tree, and their root visit counts are added together (root parallelism). The pool is started on
+    the first move and kept until close is called. The move played is the root move with the most visits."""
+    # initialize data members
+    def __init__(self, time_limit=1000, workers=1, exploration=1.4, seed=None):
+        self._time_limit = time_limit / 1000  # time budget per move in seconds
+        self._workers = workers  # number of trees grown in parallel
+        self._exploration = exploration  # UCT exploration constant
+        self._rand = random.Random(seed)  # source of the seed for each tree
+        self._pool = None  # ProcessPoolExecutor, started on the first parallel search
+        self._stats = {"playouts": 0, "time_ms": 0.0, "playouts_per_second": 0.0, "visits": {}}
+
+    def choose_move(self, game):
+        """Given a QuoridorGame object, returns the move with the most playouts for the player whose turn it is, as a
+        tuple of orientation and coordinates that can be passed to push_move. A move onto the goal row is played without
+        searching. Returns None if the game has been won or the player has no legal moves, as AlphaBetaPlayer does. The
+        game is left as it was found. Raises ValueError unless the game is a two-player 9x9 game."""
+        check_standard_game(game)
+        player = game.get_turn()
+        if game.is_winner(1) or game.is_winner(2) or not game.legal_moves(player):
+            return None
+
+        # playouts from a nearly won position are all won, so they can't tell a winning step from any other move
+        goal_row = 8 if player == 1 else 0
+        for coord in game.legal_pawn_moves(player):
+            if coord[1] == goal_row:
+                return None, coord
+
+        start = time.perf_counter()
+        seeds = [self._rand.getrandbits(32) for n in range(self._workers)]
+
+        if self._workers == 1:
+            results = [grow_tree(game, self._time_limit, self._exploration, seeds[0])]
+        else:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(self._workers)
+            results = list(self._pool.map(grow_tree, [game] * self._workers, [self._time_limit] * self._workers,
+                                          [self._exploration] * self._workers, seeds))
+
+        self.__record_stats(results, start)
+        return max(self._stats["visits"], key=lambda move: self._stats["visits"][move])
+
+    def __record_stats(self, results, start):
+        """Given a list of the results of grow_tree and the perf_counter time the search started, adds up the visits of
+        each root move and records the playouts, time taken, and playouts per second. Returns nothing."""
+        visits = {}
+        for moves, playouts in results:
+            for move in moves:
+                visits[move] = visits.get(move, 0) + moves[move][0]
+
+        elapsed = time.perf_counter() - start
+        playouts = sum(result[1] for result in results)
+        self._stats.update(playouts=playouts, time_ms=elapsed * 1000, playouts_per_second=playouts / elapsed,
+                           visits=visits)
+
+    def get_stats(self):
+        """Takes no parameters and returns a dictionary with the results of the last search: playouts run, time taken in
+        milliseconds, playouts per second, and the visits of each root move."""
+        return dict(self._stats)
+
+    def close(self):
+        """Takes no parameters. Shuts down the process pool, if one was started. Returns nothing."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+
+# define main function
+def main():
+    """Measures playouts per second from the opening position with 1, 2, 4 and 8 workers and prints the scaling
+    efficiency of each: the playouts per second divided by the workers times the playouts per second of 1 worker."""
+    game = QuoridorGame(FlatBoard)
+    single = None
+    print("%7s %10s %11s %10s" % ("workers", "playouts", "playouts/s", "efficiency"))
+
+    for workers in (1, 2, 4, 8):
+        player = MCTSPlayer(2000, workers, seed=workers)
+        player.choose_move(game)  # start the pool
+        player.choose_move(game)
+        player.close()
+
+        stats = player.get_stats()
+        single = single or stats["playouts_per_second"]
+        print("%7d %10d %11.0f %9.0f%%" % (workers, stats["playouts"], stats["playouts_per_second"],
+                                             100 * stats["playouts_per_second"] / (workers * single)))
+
+
+# run main function if run as script
+if __name__ == '__main__':
+    main()
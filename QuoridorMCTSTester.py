@@ -0,0 +1,76 @@
+# Author: Christopher Felt
+# Date: 10/18/2026
+#
+# Description: Unit test program for testing the QuoridorMCTS program. Tests playouts and the MCTSPlayer bot.
+
+# import modules
+from QuoridorMCTS import RolloutBoard, MCTSPlayer
+from Quoridor import QuoridorGame, FlatBoard, initial_state
+import random
+import unittest
+
+
+class UnitTests(unittest.TestCase):
+    """Class for testing the QuoridorMCTS program. Inherits from Unit test."""
+
+    def test_RolloutBoard(self):
+        """Test that playouts finish with a winner and leave the game unchanged."""
+
+        # create game object with some fences
+        q = QuoridorGame(FlatBoard)
+        q.place_fence(1, 'h', (4, 4))
+        q.place_fence(2, 'v', (4, 5))
+        key = q.get_hash()
+        rand = random.Random(7)
+
+        winners = [RolloutBoard(q).play(rand) for n in range(50)]
+        self.assertEqual(set(winners) <= {1, 2}, True)
+        self.assertEqual(q.get_hash(), key)
+
+        # player 1 one step from winning nearly always wins
+        q.change_pawn_loc((4, 7), (0, 8))
+        winners = [RolloutBoard(q).play(rand) for n in range(50)]
+        self.assertGreater(winners.count(1), 40)
+
+    def test_MCTSPlayer(self):
+        """Test that the bot finds a winning move, in one process and in a process pool."""
+
+        # player 1 is one step from winning
+        q = QuoridorGame(FlatBoard)
+        q.change_pawn_loc((4, 7), (0, 4))
+        key = q.get_hash()
+
+        bot = MCTSPlayer(300, seed=3)
+        self.assertEqual(bot.choose_move(q), (None, (4, 8)))
+
+        # player 2 to move has no win in one, so the search picks a legal move
+        q.place_fence(1, 'h', (4, 8))
+        key = q.get_hash()
+        for workers in (1, 2):
+            bot = MCTSPlayer(300, workers, seed=3)
+            self.assertIn(bot.choose_move(q), q.legal_moves(2))
+            bot.close()
+
+            stats = bot.get_stats()
+            self.assertGreater(stats["playouts"], 0)
+            self.assertEqual(sum(stats["visits"].values()), stats["playouts"])
+            self.assertEqual(q.get_hash(), key)
+
+    def test_no_moves(self):
+        """Test that the bot returns None instead of searching when the game is over or it has no legal moves, and that
+        games other than two-player 9x9 games are rejected."""
+        # player 1 boxed into the corner with no fences left, which needs the fair-play rule off
+        state = initial_state()._replace(pawns=(0, 80), stock=(0, 0), h_fences=1 << 9, v_fences=1 << 1)
+        q = QuoridorGame.from_state(state, FlatBoard, fair_play=False)
+        self.assertEqual(q.legal_moves(1), [])
+        self.assertIsNone(MCTSPlayer(100, seed=7).choose_move(q))
+
+        q = QuoridorGame(FlatBoard)
+        q.change_pawn_loc((4, 7), (0, 4))
+        q.move_pawn(1, (4, 8))
+        self.assertIsNone(MCTSPlayer(100, seed=7).choose_move(q))
+
+        # only two-player 9x9 games
+        for game in (QuoridorGame(FlatBoard, size=5), QuoridorGame(FlatBoard, players=4)):
+            self.assertRaises(ValueError, RolloutBoard, game)
+            self.assertRaises(ValueError, MCTSPlayer(100, seed=7).choose_move, game)
@@ -0,0 +1,55 @@
+# Author: Christopher Felt
+# Date: 10/18/2026
+#
+# Description: Move policies and the game loop shared by the programs that play whole games: the benchmark, the
+# profiler, the self-play generator, the evaluation samples and the tournament runner. A policy is anything with a
+# choose_move method that takes a QuoridorGame and returns a move for push_move (or None if it has none), like the
+# bots in the QuoridorSearch and QuoridorMCTS programs.
+#
+# RandomPlayer is the cheap policy they all use for random games: a random legal fence about one move in FENCE_CHANCE
+# while the player has fences left, and otherwise a pawn move, which follows the shortest path GREEDY_CHANCE of the
+# time for the greedy policy. play_moves runs a game between two policies for at most MAX_PLIES moves.
+
+FENCE_CHANCE = 0.2  # chance that a random policy move is a fence, while the player has fences left
+GREEDY_CHANCE = 0.8  # chance that a greedy policy pawn move follows the shortest path
+MAX_PLIES = 300  # games longer than this are stopped without a winner
+
+
+class RandomPlayer:
+    """Represents a policy that plays a random legal fence about one time in FENCE_CHANCE, and a pawn move otherwise.
+    Takes the random.Random object to draw from and, optionally, the chance that a pawn move follows the player's
+    shortest path to the goal row instead of a random step (0 by default)."""
+    # initialize data members
+    def __init__(self, rand, greedy_chance=0.0):
+        self._rand = rand  # source of the random moves
+        self._greedy_chance = greedy_chance  # chance of a shortest path pawn move
+
+    def choose_move(self, game):
+        """Given a QuoridorGame object, returns a legal move for the player whose turn it is, as a tuple of orientation
+        and coordinates that can be passed to push_move. Returns None if there are no legal moves."""
+        player = game.get_turn()
+        fences = game.legal_fences(player) if self._rand.random() < FENCE_CHANCE else []
+        moves = game.legal_pawn_moves(player)
+
+        if fences or not moves:
+            return self._rand.choice(fences or game.legal_moves(player) or [None])
+        if self._rand.random() < self._greedy_chance:
+            return None, min(moves, key=lambda coord: game.get_distance(player, coord))
+
+        return None, self._rand.choice(moves)
+
+
+def play_moves(game, policies, max_plies=MAX_PLIES):
+    """Given a QuoridorGame object, a list of the policies of player 1 and player 2, and optionally the most moves to
+    play, asks the policy of the player to move for a move, makes it with push_move, and yields a tuple of (player,
+    move) after it is made. Stops after a player wins, when a policy returns None or a move that isn't legal (which
+    isn't made or yielded, so the player who failed is the one to move), or after max_plies moves."""
+    for ply in range(max_plies):
+        player = game.get_turn()
+        move = policies[player - 1].choose_move(game)
+        if move is None or game.push_move(player, move) is not True:
+            return  # no legal move
+
+        yield player, move
+        if game.is_winner(player):
+            return
@@ -0,0 +1,55 @@
+# Author: Christopher Felt
+# Date: 10/18/2026
+#
+# Description: Unit test program for testing the QuoridorPolicy program. Checks that the random policies play legal
+# moves and that play_moves stops on a win, on a missing or illegal move, and after the most moves.
+
+# import modules
+from QuoridorPolicy import RandomPlayer, GREEDY_CHANCE, play_moves
+from Quoridor import QuoridorGame
+import random
+import unittest
+
+
+class FixedPlayer:
+    """Represents a policy that always returns the move it was made with."""
+    # initialize data members
+    def __init__(self, move):
+        self._move = move  # move returned every turn
+
+    def choose_move(self, game):
+        """Given a QuoridorGame object, returns the move the policy was made with."""
+        return self._move
+
+
+class UnitTests(unittest.TestCase):
+    """Class for testing the QuoridorPolicy program. Inherits from Unit test."""
+
+    def test_random_games(self):
+        """Test that random and greedy policies play legal moves until a player wins, and that the same seed plays the
+        same game."""
+        for greedy_chance in (0.0, GREEDY_CHANCE):
+            games = []
+            for n in range(2):
+                game = QuoridorGame()
+                policy = RandomPlayer(random.Random(7), greedy_chance)
+                games.append(list(play_moves(game, [policy, policy], 1000)))
+                player = games[-1][-1][0]
+                self.assertEqual(game.is_winner(player), True)
+
+            self.assertEqual(games[0], games[1])
+
+    def test_stops(self):
+        """Test that play_moves stops after the most moves, and before a missing or illegal move, leaving the player
+        who failed to move."""
+        game = QuoridorGame()
+        policy = RandomPlayer(random.Random(1))
+        self.assertEqual(len(list(play_moves(game, [policy, policy], 3))), 3)
+
+        game = QuoridorGame()
+        self.assertEqual([player for player, move in play_moves(game, [policy, FixedPlayer(None)])], [1])
+        self.assertEqual(game.get_turn(), 2)
+
+        game = QuoridorGame()
+        self.assertEqual(list(play_moves(game, [FixedPlayer((None, (0, 0))), policy])), [])
+        self.assertEqual(game.get_turn(), 1)
@@ -0,0 +1,110 @@
+# Author: Christopher Felt
+# Date: 10/18/2026
+#
+# Description: Profiling mode for the Quoridor program. ProfiledGame is a QuoridorGame that counts the calls to its
+# public moves and internal checks (such as __check_initial_parameters, __check_move_legality and __pawn_cut_off) and
+# adds up the wall time spent in each. Because the counting is done by a separate class chosen when the game is created,
+# a plain QuoridorGame runs exactly the same code as before and pays nothing for it.
+#
+# Times are inclusive: the time of a check also counts towards every method that called it, so move_pawn includes
+# __check_move_legality, place_fence includes __check_fence_legality, and so on. The stats can be read as a dictionary
+# with get_profile or as JSON with get_profile_json, and cleared between games with reset_profile.
+#
+# Run this file as a script to play a random game with a ProfiledGame and print the stats: python QuoridorProfile.py
+
+# import modules
+from Quoridor import QuoridorGame, Board, FlatBoard
+from QuoridorPolicy import RandomPlayer, play_moves
+import functools
+import json
+import random
+import time
+
+# QuoridorGame methods counted by ProfiledGame. names starting with __ are private to QuoridorGame
+PROFILED_METHODS = ("move_pawn", "place_fence", "push_move", "push_trusted", "pop_move", "legal_pawn_moves",
+                    "legal_fences", "is_legal_fence", "__check_initial_parameters", "__check_move_legality",
+                    "__check_fence_legality", "__check_win_condition", "__make_pawn_move", "__make_fence_move",
+                    "__close_border", "__open_border", "__pawn_cut_off", "__change_turn")
+
+
+def attribute_name(name):
+    """Given the name of a QuoridorGame method as written in the class, returns the name of its class attribute. Private
+    names are mangled by Python, so __check_win_condition is stored as _QuoridorGame__check_win_condition."""
+    return "_QuoridorGame" + name if name.startswith("__") else name
+
+
+def profiled(name, method):
+    """Given the name of a method and the function that implements it, returns a function that calls it and adds the
+    call and the wall time it took to the game's stats under that name."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            stats = self._profile[name]
+            stats[0] += 1
+            stats[1] += time.perf_counter() - start
+
+    return wrapper
+
+
+class ProfiledGame(QuoridorGame):
+    """Represents a Quoridor game that counts the calls to each method in PROFILED_METHODS and the wall time spent in
+    them. Takes the same parameters as QuoridorGame and plays exactly the same game; it can be passed to any code that
+    takes a QuoridorGame, such as the bots."""
+    # initialize data members
+    def __init__(self, *args, **kwargs):
+        self._profile = {}  # [calls, seconds] for each method name
+        self.reset_profile()
+        super().__init__(*args, **kwargs)
+
+    @classmethod
+    def from_state(cls, state, board_class=Board, fair_play=True):
+        """Given a GameState, and optionally a board class and fair_play, returns a new ProfiledGame object with that
+        position and empty stats, as for QuoridorGame.from_state. QuoridorGame.from_bytes calls this as well."""
+        game = super().from_state(state, board_class, fair_play)  # made with cls.__new__, so __init__ isn't called
+        game.reset_profile()
+        return game
+
+    def reset_profile(self):
+        """Takes no parameters. Sets the call count and time of every method back to 0. Returns nothing."""
+        self._profile = {name: [0, 0.0] for name in PROFILED_METHODS}
+
+    def get_profile(self):
+        """Takes no parameters and returns a dictionary with an entry for each method that has been called: a
+        dictionary of the number of calls, the total seconds and the average microseconds per call."""
+        return {name: {"calls": calls, "seconds": seconds, "us_per_call": seconds / calls * 1e6}
+                for name, (calls, seconds) in self._profile.items() if calls}
+
+    def get_profile_json(self):
+        """Takes no parameters and returns the stats of get_profile as a JSON string, slowest method first."""
+        profile = self.get_profile()
+        return json.dumps(dict(sorted(profile.items(), key=lambda item: -item[1]["seconds"])), indent=2)
+
+
+# replace each profiled method of ProfiledGame with a counting wrapper around the QuoridorGame method
+for method_name in PROFILED_METHODS:
+    setattr(ProfiledGame, attribute_name(method_name),
+            profiled(method_name, getattr(QuoridorGame, attribute_name(method_name))))
+
+
+def play_random_game(game, rand):
+    """Given a QuoridorGame object and a random.Random object, plays random moves with the RandomPlayer of the
+    QuoridorPolicy program for both players until a player wins or MAX_PLIES moves are made. Returns nothing."""
+    policy = RandomPlayer(rand)
+    for player, move in play_moves(game, [policy, policy]):
+        pass
+
+
+# define main function
+def main():
+    """Plays a random game with a ProfiledGame and prints the stats as JSON."""
+    game = ProfiledGame(FlatBoard)
+    play_random_game(game, random.Random(18))
+    print(game.get_profile_json())
+
+
+# run main function if run as script
+if __name__ == '__main__':
+    main()
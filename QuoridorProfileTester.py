@@ -0,0 +1,49 @@
+# Author: Christopher Felt
+# Date: 10/18/2026
+#
+# Description: Unit test program for testing the QuoridorProfile program. Checks that a ProfiledGame plays the same
+# game as a QuoridorGame while counting the calls to its checks.
+
+# import modules
+from QuoridorProfile import ProfiledGame, play_random_game
+from Quoridor import QuoridorGame, FlatBoard
+import json
+import random
+import unittest
+
+
+class UnitTests(unittest.TestCase):
+    """Class for testing the QuoridorProfile program. Inherits from Unit test."""
+
+    def test_ProfiledGame(self):
+        """Test that calls to public moves and private checks are counted, and that the stats can be reset."""
+        q = ProfiledGame(FlatBoard)
+        q.change_pawn_loc((4, 3), (4, 4))
+        self.assertEqual(q.move_pawn(1, (4, 5)), True)  # jump
+        self.assertEqual(q.place_fence(2, 'h', (4, 0)), False)  # edge of board
+        self.assertEqual(q.move_pawn(2, (4, 9)), False)  # off the board
+
+        profile = q.get_profile()
+        self.assertEqual(profile["move_pawn"]["calls"], 2)
+        self.assertEqual(profile["__check_initial_parameters"]["calls"], 3)
+        self.assertEqual(profile["__check_move_legality"]["calls"], 1)
+        self.assertEqual(profile["__check_fence_legality"]["calls"], 1)
+        self.assertNotIn("pop_move", profile)  # never called
+        self.assertGreaterEqual(profile["move_pawn"]["seconds"], profile["__check_move_legality"]["seconds"])
+        self.assertEqual(json.loads(q.get_profile_json())["move_pawn"]["calls"], 2)
+
+        q.reset_profile()
+        self.assertEqual(q.get_profile(), {})
+        r = ProfiledGame.from_bytes(q.to_bytes(), FlatBoard)
+        self.assertEqual(r.get_profile(), {})
+        self.assertEqual(r.get_pawn_loc(1), (4, 5))
+
+    def test_same_game(self):
+        """Test that a ProfiledGame plays a random game move for move like a QuoridorGame."""
+        q = QuoridorGame(FlatBoard)
+        p = ProfiledGame(FlatBoard)
+        play_random_game(q, random.Random(4))
+        play_random_game(p, random.Random(4))
+
+        self.assertEqual(p.get_hash(), q.get_hash())
+        self.assertEqual(p.get_profile()["push_move"]["calls"], len(q._undo))
@@ -0,0 +1,106 @@
+# Author: Christopher Felt
+# Date: 10/18/2026
+#
+# Description: Replay engine for recorded Quoridor games. A game record is one line of text with the game's moves in
+# move notation (see to_notation in the Quoridor program) separated by spaces, e.g. "e2 e8 e3h d6v". Blank lines and
+# lines starting with # are skipped, so a record file can hold comments.
+#
+# replay_moves plays one game's moves on a QuoridorGame and yields an event for each move as it is made. replay_games
+# does the same for every record read from an iterable of lines, such as an open file, one line at a time, so that a
+# file of any size is replayed in bounded memory. Both stop a game at its first illegal move. With trusted=True, moves
+# are made with QuoridorGame.push_trusted, which skips the parameter, turn, rule and fair-play checks; use it only for
+# records that have already been checked.
+#
+# Run this file as a script with the name of a record file to check every game in it and print statistics.
+
+# import modules
+from Quoridor import QuoridorGame, FlatBoard, to_notation
+import json
+import sys
+import time
+
+# every move in move notation, for fast lookup. pawn moves, then horizontal and vertical fences on every cell
+MOVES = {to_notation((orient, (col, row))): (orient, (col, row))
+         for orient in (None, 'h', 'v') for row in range(9) for col in range(9)}
+
+
+def read_records(lines):
+    """Given an iterable of lines of text, yields a list of the move notation strings of each game record, skipping
+    blank lines and lines starting with #."""
+    for line in lines:
+        moves = line.split()
+        if moves and not moves[0].startswith("#"):
+            yield moves
+
+
+def replay_moves(game, moves, trusted=False):
+    """Given a QuoridorGame object, an iterable of moves in move notation, and whether the moves are trusted, makes each
+    move for the player whose turn it is and yields a tuple of (ply, player, move, result) after it is made. ply counts
+    from 1, move is the (orientation, coordinates) tuple or None if the notation isn't a move, and result is what
+    push_move returned (always True for trusted moves). Stops after the first move whose result isn't True."""
+    for ply, text in enumerate(moves, 1):
+        player = game.get_turn()
+        move = MOVES.get(text)
+
+        if move is None:
+            result = False  # not a move
+        elif trusted:
+            game.push_trusted(player, move)
+            result = True
+        else:
+            result = game.push_move(player, move)
+
+        yield ply, player, move, result
+        if result is not True:
+            return
+
+
+def replay_games(lines, trusted=False, board_class=FlatBoard):
+    """Given an iterable of lines of game records, whether the moves are trusted, and a board class, replays each record
+    on a new QuoridorGame object that uses that board class and yields a tuple of (game number, game, ply, player, move,
+    result) for each move, as for replay_moves. Game numbers count from 1. The game is the live game object, which only
+    holds the position after the move until the next event is taken."""
+    for number, moves in enumerate(read_records(lines), 1):
+        game = QuoridorGame(board_class)
+        for ply, player, move, result in replay_moves(game, moves, trusted):
+            yield number, game, ply, player, move, result
+
+
+def record_stats(lines, trusted=False, board_class=FlatBoard):
+    """Given an iterable of lines of game records, whether the moves are trusted, and a board class, replays every game
+    and returns a dictionary of statistics: the number of games and moves, the games stopped by an illegal move, the
+    games won by each player, and the fences placed."""
+    stats = {"games": 0, "moves": 0, "illegal_games": 0, "wins": {1: 0, 2: 0}, "fences": 0}
+
+    for number, game, ply, player, move, result in replay_games(lines, trusted, board_class):
+        stats["games"] = number
+        if result is not True:
+            stats["illegal_games"] += 1
+            continue
+
+        stats["moves"] += 1
+        stats["fences"] += move[0] is not None
+        stats["wins"][player] += game.is_winner(player)
+
+    return stats
+
+
+# define main function
+def main():
+    """Replays every game in the record file named on the command line, checking every move, then prints the statistics
+    and the moves replayed per second as JSON. Pass --trusted after the file name to skip the checks."""
+    if len(sys.argv) < 2:
+        print("usage: python QuoridorReplay.py RECORD_FILE [--trusted]")
+        return
+
+    start = time.perf_counter()
+    with open(sys.argv[1]) as file:
+        stats = record_stats(file, "--trusted" in sys.argv[2:])
+
+    stats["moves_per_second"] = stats["moves"] / (time.perf_counter() - start)
+    print(json.dumps(stats, indent=2))
+
+
+# run main function if run as script
+if __name__ == '__main__':
+    main()
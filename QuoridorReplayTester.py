@@ -0,0 +1,62 @@
+# Author: Christopher Felt
+# Date: 10/18/2026
+#
+# Description: Unit test program for testing the QuoridorReplay program. Replays recorded random games with and without
+# the trusted fast path.
+
+# import modules
+from QuoridorReplay import read_records, replay_moves, replay_games, record_stats
+from Quoridor import QuoridorGame, FlatBoard, to_notation
+import io
+import random
+import unittest
+
+
+def random_record(rand, plies):
+    """Given a random.Random object and a number of moves, plays a random game of up to that many legal moves and
+    returns a tuple of the game record and the final game."""
+    q = QuoridorGame(FlatBoard)
+    moves = []
+    for ply in range(plies):
+        legal = q.legal_moves(q.get_turn())
+        if not legal:
+            break
+        moves.append(rand.choice(legal))
+        q.push_move(q.get_turn(), moves[-1])
+
+    return " ".join(to_notation(move) for move in moves), q
+
+
+class UnitTests(unittest.TestCase):
+    """Class for testing the QuoridorReplay program. Inherits from Unit test."""
+
+    def test_replay_games(self):
+        """Test that trusted and checked replays reach the same positions as the recorded games."""
+        rand = random.Random(3)
+        records = [random_record(rand, rand.randrange(1, 50)) for n in range(8)]
+        text = "# recorded games\n\n" + "\n".join(record for record, q in records) + "\n"
+
+        for trusted in (False, True):
+            final = {}
+            for number, game, ply, player, move, result in replay_games(io.StringIO(text), trusted):
+                self.assertEqual(result, True)
+                final[number] = game.get_hash()
+
+            self.assertEqual(final, {n + 1: q.get_hash() for n, (record, q) in enumerate(records)})
+
+        stats = record_stats(io.StringIO(text))
+        self.assertEqual(stats["games"], 8)
+        self.assertEqual(stats["moves"], sum(len(record.split()) for record, q in records))
+        self.assertEqual(stats["illegal_games"], 0)
+
+    def test_replay_moves(self):
+        """Test that a checked replay stops at the first illegal move."""
+        q = QuoridorGame()
+        events = list(replay_moves(q, ["e2", "e8", "e2h", "a5", "e3"]))
+        self.assertEqual([event[-1] for event in events], [True, True, True, False])
+        self.assertEqual(events[2], (3, 1, ('h', (4, 1)), True))
+        self.assertEqual(q.get_pawn_loc(1), (4, 1))
+
+        # notation that isn't a move
+        self.assertEqual(list(replay_moves(QuoridorGame(), ["z9"])), [(1, 1, None, False)])
+        self.assertEqual(list(read_records(["", "# comment", " a1  b2 "])), [["a1", "b2"]])
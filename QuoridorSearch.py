@@ -0,0 +1,542 @@
+# Author: Christopher Felt
+# Date: 10/18/2026
+#
+# Description: Search tools for bots that play the Quoridor program. Positions are identified by the Zobrist hash
+# returned by QuoridorGame.get_hash, so that a position reached by different move orders is only evaluated once.
+#
+# The TranspositionTable class holds search results in a fixed number of slots and keeps the deepest result when two
+# positions want the same slot, unless the old result is left over from an earlier search. The LRUTranspositionTable
+# class holds the same results but forgets the least recently used position when it is full. Both have the same methods
+# and can be cleared or reused between searches.
+#
+# The AlphaBetaPlayer class is a bot that picks moves with a negamax search using alpha-beta pruning and iterative
+# deepening, within a time limit per move. It reports the nodes it searched per second through get_stats. Run this
+# file as a script to watch two bots play each other.
+#
+# Most of the 128 fence slots are nowhere near either pawn's path, and searching them all makes every node of the
+# search expensive. relevant_fences yields only the fences that cross a shortest path of either player, touch a placed
+# fence, or border a pawn, ranked by the share of the opponent's shortest paths they block, and checks each one's
+# legality only when it is reached. AlphaBetaPlayer(prune_fences=True) searches those fences instead of all of them.
+
+# import modules
+from collections import OrderedDict
+from Quoridor import QuoridorGame, FlatBoard, UNREACHABLE, FENCE_SLOTS, check_standard_game
+from QuoridorTablebase import layout_adjacency
+import time
+
+# type of value stored with a search result
+EXACT = 0  # value is the exact score of the position
+LOWER = 1  # value is a lower bound (search failed high)
+UPPER = 2  # value is an upper bound (search failed low)
+
+
+class TranspositionTable:
+    """Represents a transposition table with a fixed number of slots, using a depth-preferred replacement policy. A
+    position's slot is picked by the low bits of its hash. A new result replaces the one in its slot if the slot is
+    empty, holds the same position, holds a result from an earlier search, or holds a result searched no deeper than
+    the new one. Each entry is a tuple of (hash, depth, value, flag, move, search number)."""
+    # initialize data members
+    def __init__(self, size=1 << 16):
+        self._mask = (1 << (size - 1).bit_length()) - 1  # round size up to a power of two
+        self._slots = [None] * (self._mask + 1)  # one entry or None for each slot
+        self._search = 0  # number of the current search, used to age old entries
+        self._hits = 0  # lookups that found their position
+        self._lookups = 0  # total lookups
+
+    def lookup(self, key):
+        """Given the hash of a position, returns a tuple of (depth, value, flag, move) stored for that position, or None
+        if the table does not hold it."""
+        self._lookups += 1
+        entry = self._slots[key & self._mask]
+
+        if entry is None or entry[0] != key:
+            return None
+
+        self._hits += 1
+        return entry[1:5]
+
+    def store(self, key, depth, value, flag, move=None):
+        """Given the hash of a position, the depth it was searched to, its value, the type of value (EXACT, LOWER or
+        UPPER) and the best move found, stores the result if the replacement policy allows it. Returns nothing."""
+        slot = key & self._mask
+        entry = self._slots[slot]
+
+        if entry is None or entry[0] == key or entry[5] != self._search or entry[1] <= depth:
+            self._slots[slot] = (key, depth, value, flag, move, self._search)
+
+    def new_search(self):
+        """Takes no parameters. Marks every stored result as belonging to an earlier search, so that they can still be
+        read but any new result may replace them. Returns nothing."""
+        self._search += 1
+
+    def clear(self):
+        """Takes no parameters. Removes every stored result and resets the hit counters. Returns nothing."""
+        self._slots = [None] * (self._mask + 1)
+        self._hits = 0
+        self._lookups = 0
+
+    def get_hit_rate(self):
+        """Takes no parameters and returns the fraction of lookups that found their position, or 0.0 if there have
+        been no lookups."""
+        return self._hits / self._lookups if self._lookups else 0.0
+
+
+class LRUTranspositionTable:
+    """Represents a transposition table that holds up to a fixed number of positions, using a least recently used
+    replacement policy. Looking up or storing a position marks it as recently used, and storing a new position in a
+    full table removes the position that has gone unused the longest. Has the same methods as TranspositionTable."""
+    # initialize data members
+    def __init__(self, size=1 << 16):
+        self._size = size  # most positions held at once
+        self._entries = OrderedDict()  # (depth, value, flag, move) for each hash, least recently used first
+        self._hits = 0  # lookups that found their position
+        self._lookups = 0  # total lookups
+
+    def lookup(self, key):
+        """Given the hash of a position, returns a tuple of (depth, value, flag, move) stored for that position, or None
+        if the table does not hold it."""
+        self._lookups += 1
+        entry = self._entries.get(key)
+
+        if entry is not None:
+            self._hits += 1
+            self._entries.move_to_end(key)  # mark as recently used
+
+        return entry
+
+    def store(self, key, depth, value, flag, move=None):
+        """Given the hash of a position, the depth it was searched to, its value, the type of value (EXACT, LOWER or
+        UPPER) and the best move found, stores the result, removing the least recently used position if the table is
+        full. Returns nothing."""
+        self._entries[key] = (depth, value, flag, move)
+        self._entries.move_to_end(key)
+
+        if len(self._entries) > self._size:
+            self._entries.popitem(last=False)  # remove least recently used
+
+    def new_search(self):
+        """Takes no parameters. Has nothing to do for this policy; kept so both tables have the same methods. Returns
+        nothing."""
+        pass
+
+    def clear(self):
+        """Takes no parameters. Removes every stored result and resets the hit counters. Returns nothing."""
+        self._entries.clear()
+        self._hits = 0
+        self._lookups = 0
+
+    def get_hit_rate(self):
+        """Takes no parameters and returns the fraction of lookups that found their position, or 0.0 if there have
+        been no lookups."""
+        return self._hits / self._lookups if self._lookups else 0.0
+
+
+WIN_SCORE = 100000  # score of a won position, less one for each move it takes to get there
+WIN_BOUND = WIN_SCORE - 1000  # scores at least this far from 0 are wins or losses, not evaluations
+INFINITY = 1000000  # larger than any score
+
+# search order rank of a fence, by whether it crosses the opponent's and the player's shortest paths. pawn moves that
+# shorten the player's path rank 5 and other pawn moves rank 2
+FENCE_RANKS = {(True, False): 4, (True, True): 3, (False, False): 1, (False, True): 0}
+
+
+class SearchTimeout(Exception):
+    """Raised inside a search when its time budget runs out, to unwind back to AlphaBetaPlayer.choose_move."""
+    pass
+
+
+def evaluate(game, player):
+    """Given a QuoridorGame object and an integer that represents the player, returns a score for the position from
+    that player's point of view: ten points for each step the opponent's shortest path to their goal row is longer
+    than the player's, plus one point for each extra fence the player has left."""
+    opponent = 3 - player
+    mine = game.get_path_length(player)
+    theirs = game.get_path_length(opponent)
+
+    # a pawn with no path can only happen when the fair-play rule is off
+    mine = UNREACHABLE if mine is None else mine
+    theirs = UNREACHABLE if theirs is None else theirs
+
+    return (theirs - mine) * 10 + game.get_fences(player) - game.get_fences(opponent)
+
+
+def to_table_score(score, ply):
+    """Given a score found at a node and the number of moves made since the root, returns the score to store in a
+    transposition table. A win or loss is scored from the root by the search, so it is stored counting its moves from
+    the node instead, which stays right when the position comes up again at another ply or in a later search."""
+    if WIN_BOUND <= score <= WIN_SCORE:
+        return score + ply
+    if -WIN_SCORE <= score <= -WIN_BOUND:
+        return score - ply
+
+    return score
+
+
+def from_table_score(score, ply):
+    """Given a score read from a transposition table and the number of moves made since the root, returns the score
+    as the search counts it, undoing to_table_score."""
+    if WIN_BOUND <= score <= WIN_SCORE:
+        return score - ply
+    if -WIN_SCORE <= score <= -WIN_BOUND:
+        return score + ply
+
+    return score
+
+
+def fence_cells(orient, coord):
+    """Given a character (v or h) that represents orientation and a tuple of the coordinate location of a fence,
+    returns a tuple of the coordinates of the two cells on either side of it."""
+    if orient == 'h':
+        return (coord[0], coord[1] - 1), coord  # cell above and target cell
+
+    return (coord[0] - 1, coord[1]), coord  # cell to the left and target cell
+
+
+def on_shortest_path(game, player, orient, coord):
+    """Given a QuoridorGame object, an integer that represents the player, and the orientation and coordinates of a
+    fence, returns True if the fence crosses a border used by one of the player's shortest paths to their goal row.
+    Only these fences can make the player's path longer."""
+    first, second = fence_cells(orient, coord)
+    first, second = game.get_distance(player, first), game.get_distance(player, second)
+
+    return first is not None and second is not None and abs(first - second) == 1
+
+
+def path_step(game, adjacent, player, level, dist, forward, children):
+    """Given a QuoridorGame object, an adjacency list of its fences, an integer that represents the player, a list of
+    the cells a number of steps along the player's shortest paths, and dictionaries of the distance to the goal row, the
+    number of shortest paths from the pawn, and the cells one step closer to the goal row of the cells seen so far,
+    fills in the dictionaries for the cells one step further along and returns a list of those cells."""
+    following = []
+    for n in level:
+        children[n] = []
+        for neighbor in adjacent[n]:
+            if neighbor is None:
+                continue
+            if neighbor not in dist:
+                dist[neighbor] = game.get_distance(player, (neighbor % 9, neighbor // 9))
+            if dist[neighbor] == dist[n] - 1:
+                children[n].append(neighbor)
+                if neighbor not in forward:
+                    forward[neighbor] = 0
+                    following.append(neighbor)
+                forward[neighbor] += forward[n]
+
+    return following
+
+
+def path_shares(game, adjacent, player):
+    """Given a QuoridorGame object, an adjacency list of its fences as returned by layout_adjacency, and an integer that
+    represents the player, returns a dictionary with an entry for each border on one of the shortest paths from the
+    player's pawn to their goal row: the fraction of those shortest paths that cross it, keyed by the numbers of the
+    cells on either side, lowest first. A fence on a border with a share of 1 makes the player's path longer. Returns
+    an empty dictionary if the pawn has no path or is on its goal row. Raises ValueError unless the game is a
+    two-player 9x9 game."""
+    check_standard_game(game)
+    loc = game.get_pawn_loc(player)
+    start = loc[0] + loc[1] * 9
+    dist = {start: game.get_path_length(player)}
+    if not dist[start]:
+        return {}
+
+    # walk down the distances one step at a time, counting the shortest paths from the pawn to each cell
+    levels, forward, children = [[start]], {start: 1}, {}
+    while dist[levels[-1][0]] > 0:
+        levels.append(path_step(game, adjacent, player, levels[-1], dist, forward, children))
+
+    # count the shortest paths from each cell to the goal row, working back up from the goal row
+    backward = {n: 1 for n in levels[-1]}
+    for level in reversed(levels[:-1]):
+        for n in level:
+            backward[n] = sum(backward[child] for child in children[n])
+
+    return {(min(n, child), max(n, child)): forward[n] * backward[child] / backward[start]
+            for n in children for child in children[n]}
+
+
+def border_slot(border):
+    """Given a tuple of the numbers of two neighboring cells, lowest first, returns the (orientation, coordinates) fence
+    slot on the border between them."""
+    second = border[1]
+    return ('h' if second - border[0] == 9 else 'v'), (second % 9, second // 9)
+
+
+def fence_corners(orient, coord):
+    """Given a character (v or h) that represents orientation and a tuple of the coordinate location of a one-cell
+    fence, returns a tuple of the (col, row) cell corners at its two ends, where corner (col, row) is the top left
+    corner of cell (col, row)."""
+    if orient == 'h':
+        return coord, (coord[0] + 1, coord[1])
+
+    return coord, (coord[0], coord[1] + 1)
+
+
+CORNER_SLOTS = {}  # fence slots with an end at each cell corner
+for slot in FENCE_SLOTS:
+    for corner in fence_corners(*slot):
+        CORNER_SLOTS.setdefault(corner, []).append(slot)
+
+
+def nearby_slots(game):
+    """Given a QuoridorGame object, returns a list of the fence slots that touch a placed fence or border a cell with a
+    pawn, in no particular order. A slot may appear more than once."""
+    slots = [slot for fence in game.get_placed_fences() for corner in fence_corners(*fence)
+             for slot in CORNER_SLOTS[corner]]
+
+    for player in (1, 2):
+        col, row = game.get_pawn_loc(player)
+        slots.extend([('h', (col, row)), ('h', (col, row + 1)), ('v', (col, row)), ('v', (col + 1, row))])
+
+    return slots
+
+
+def relevant_fences(game, player):
+    """Given a QuoridorGame object and an integer that represents the player, yields the player's legal fences that are
+    likely to matter, best first: fences across only the opponent's shortest paths, then across both players', then
+    fences that touch a placed fence or border a pawn, then fences across only the player's own shortest paths. Within
+    each group, fences that block a larger share of the opponent's shortest paths (less the share of the player's own)
+    come first. Other fences are never yielded. Legality is only checked for a fence when it is about to be yielded, so
+    a search that stops early (e.g., after a cutoff) doesn't pay for the rest. Raises ValueError when the first fence is
+    taken unless the game is a two-player 9x9 game."""
+    check_standard_game(game)
+    if game.is_winner(1) or game.is_winner(2) or not game.get_fences(player):
+        return
+
+    adjacent = layout_adjacency(game.get_placed_fences())
+    ours, theirs = path_shares(game, adjacent, player), path_shares(game, adjacent, 3 - player)
+
+    # rank and share difference of each candidate slot
+    candidates = {}
+    for border in list(theirs) + list(ours):
+        candidates[border_slot(border)] = (FENCE_RANKS[(border in theirs, border in ours)],
+                                           theirs.get(border, 0) - ours.get(border, 0))
+    for slot in nearby_slots(game):
+        candidates.setdefault(slot, (FENCE_RANKS[(False, False)], 0))
+
+    for slot in sorted(candidates, key=candidates.get, reverse=True):
+        if game.is_legal_fence(player, *slot):
+            yield slot
+
+
+class AlphaBetaPlayer:
+    """Represents a bot that chooses moves for a QuoridorGame with a negamax search using alpha-beta pruning and
+    iterative deepening: it searches one move ahead, then two, and so on until the time limit (in milliseconds) runs
+    out, and plays the best move of the last search that finished. Moves that shorten the player's path or fences
+    across the opponent's shortest path are searched first, and results are kept in a transposition table. Searches
+    are made with push_move and pop_move on the game passed, which is left as it was found. With a Tablebase from the
+    QuoridorTablebase program, positions where neither player has fences left are scored exactly without searching.
+    With prune_fences, only the fences yielded by relevant_fences are searched, and each position's moves are generated
+    as they are searched instead of all at once."""
+    # initialize data members
+    def __init__(self, time_limit=1000, max_depth=32, table=None, evaluate=evaluate, tablebase=None,
+                 prune_fences=False):
+        self._time_limit = time_limit / 1000  # time budget per move in seconds
+        self._max_depth = max_depth  # deepest search to start
+        self._table = table if table is not None else TranspositionTable()  # results shared between searches
+        self._evaluate = evaluate  # function that scores a position for a player
+        self._tablebase = tablebase  # exact results of positions without fences, or None
+        self._prune_fences = prune_fences  # search only the relevant fences
+        self._deadline = 0.0  # perf_counter time when the current search must stop
+        self._stats = {"nodes": 0, "depth": 0, "score": 0, "time_ms": 0.0, "nodes_per_second": 0.0}
+
+    def choose_move(self, game):
+        """Given a QuoridorGame object, returns the best move found for the player whose turn it is, as a tuple of
+        orientation and coordinates that can be passed to push_move. Returns None if the game has been won. The time
+        limit covers finding and ordering the moves as well as the search. Raises ValueError unless the game is a
+        two-player 9x9 game."""
+        check_standard_game(game)
+        start = time.perf_counter()
+        self._deadline = start + self._time_limit
+        player = game.get_turn()
+        moves = list(self.__order_moves(game, player, None))
+        if game.is_winner(player) or not moves:
+            return None
+
+        self._stats.update(nodes=0, depth=0, score=0)
+        self._table.new_search()
+        best = moves[0]  # fall back on the best ordered move if no search finishes
+
+        try:
+            for depth in range(1, self._max_depth + 1):
+                best = self.__search_root(game, player, moves, depth)
+                moves.remove(best)
+                moves.insert(0, best)  # search the best move first next time
+                self._stats["depth"] = depth
+                if abs(self._stats["score"]) >= WIN_SCORE - depth:
+                    break  # found a forced win or loss
+        except SearchTimeout:
+            pass
+
+        self.__finish_stats(start)
+        return best
+
+    def __search_root(self, game, player, moves, depth):
+        """Given a QuoridorGame object, the player to move, a list of their legal moves, and a depth, searches each
+        move to that depth and returns the best one. Raises SearchTimeout if the time budget runs out."""
+        alpha = -INFINITY
+        best = moves[0]
+
+        for move in moves:
+            with game.trial(player, move):
+                score = -self.__negamax(game, 3 - player, depth - 1, -INFINITY, -alpha, 1)
+            if score > alpha:
+                alpha, best = score, move
+
+        self._stats["score"] = alpha
+        self._table.store(game.get_hash(), depth, alpha, EXACT, best)
+        return best
+
+    def __negamax(self, game, player, depth, alpha, beta, ply):
+        """Given a QuoridorGame object, the player to move, the depth left to search, the alpha-beta window, and the
+        number of moves made since the root, returns the score of the position for the player to move."""
+        self._stats["nodes"] += 1
+        if time.perf_counter() > self._deadline:
+            raise SearchTimeout
+
+        leaf = self.__leaf_score(game, player, depth, ply)
+        if leaf is not None:
+            return leaf
+
+        # use the stored result if it was searched deep enough
+        key = game.get_hash()
+        entry = self._table.lookup(key)
+        stored = self.__stored_score(entry, depth, alpha, beta, ply)
+        if stored is not None:
+            return stored
+
+        best, best_move = self.__search_moves(game, player, depth, alpha, beta, ply, entry[3] if entry else None)
+        flag = UPPER if best <= alpha else LOWER if best >= beta else EXACT
+        self._table.store(key, depth, to_table_score(best, ply), flag, best_move)
+        return best
+
+    def __leaf_score(self, game, player, depth, ply):
+        """Given a QuoridorGame object, the player to move, the depth left to search, and the number of moves made since
+        the root, returns the score of the position for the player to move if it isn't searched any further: a loss if
+        the opponent won with the last move, the tablebase score, or the evaluation once the depth runs out. Otherwise
+        returns None."""
+        if game.is_winner(3 - player):
+            return ply - WIN_SCORE  # opponent won with the last move; later losses score higher
+        exact = self.__probe(game, ply)
+        if exact is not None:
+            return exact
+        if depth == 0:
+            return self._evaluate(game, player)
+
+        return None
+
+    def __stored_score(self, entry, depth, alpha, beta, ply):
+        """Given a transposition table entry (or None), the depth left to search, the alpha-beta window, and the number
+        of moves made since the root, returns the stored score if it was searched deep enough and settles the position
+        within the window. Otherwise returns None."""
+        if entry is None or entry[0] < depth:
+            return None
+
+        value = from_table_score(entry[1], ply)
+        if entry[2] == EXACT or (entry[2] == LOWER and value >= beta) or (entry[2] == UPPER and value <= alpha):
+            return value
+
+        return None
+
+    def __search_moves(self, game, player, depth, alpha, beta, ply, first):
+        """Given a QuoridorGame object, the player to move, the depth left to search, the alpha-beta window, the number
+        of moves made since the root, and a move to search first (or None), searches the player's moves until one is
+        too good for the opponent to allow, and returns a tuple of the best score and the best move (None if there are
+        no moves)."""
+        best, best_move = -INFINITY, None
+        for move in self.__order_moves(game, player, first):
+            with game.trial(player, move):
+                score = -self.__negamax(game, 3 - player, depth - 1, -beta, -alpha, ply + 1)
+            if score > best:
+                best, best_move, alpha = score, move, max(alpha, score)
+                if alpha >= beta:
+                    break  # opponent will avoid this position
+
+        return best, best_move
+
+    def __probe(self, game, ply):
+        """Given a QuoridorGame object and the number of moves made since the root, returns the exact score of the
+        position for the player to move from the tablebase, or None if there is no tablebase or the position isn't in
+        it. Wins and losses are scored like those found by the search."""
+        result = self._tablebase.probe(game) if self._tablebase is not None else None
+        if result is None:
+            return None
+
+        outcome, plies = result
+        return outcome * (WIN_SCORE - ply - plies)
+
+    def __order_moves(self, game, player, first):
+        """Given a QuoridorGame object, the player to move, and a move to search first (or None), returns a list of the
+        player's legal moves sorted so that the moves most likely to be best come first: pawn moves that shorten the
+        player's path, then fences across only the opponent's shortest path, then fences across both players' paths,
+        then the other pawn moves, then fences that change no path, then fences across only the player's path. With
+        prune_fences, returns a generator of __pruned_moves instead."""
+        if self._prune_fences:
+            return self.__pruned_moves(game, player, first)
+
+        current = game.get_path_length(player)
+        ranked = []
+
+        for move in game.legal_moves(player):
+            if move[0] is None:
+                rank = 5 if game.get_distance(player, move[1]) < current else 2
+            else:
+                rank = FENCE_RANKS[(on_shortest_path(game, 3 - player, *move), on_shortest_path(game, player, *move))]
+            ranked.append((move != first, -rank, move))
+
+        ranked.sort(key=lambda item: item[:2])
+        return [item[2] for item in ranked]
+
+    def __pruned_moves(self, game, player, first):
+        """Given a QuoridorGame object, the player to move, and a move to search first (or None), yields the move to
+        search first if it is legal, then the pawn moves that shorten the player's path, then the fences yielded by
+        relevant_fences, then the other pawn moves. Each move is yielded once."""
+        pawn_moves = [(None, coord) for coord in game.legal_pawn_moves(player)]
+        if first is not None and (first in pawn_moves if first[0] is None else game.is_legal_fence(player, *first)):
+            yield first
+
+        current = game.get_path_length(player)
+        shorter = [move for move in pawn_moves if game.get_distance(player, move[1]) < current]
+        for move in shorter:
+            if move != first:
+                yield move
+        for move in relevant_fences(game, player):
+            if move != first:
+                yield move
+        for move in pawn_moves:
+            if move != first and move not in shorter:
+                yield move
+
+    def __finish_stats(self, start):
+        """Given the perf_counter time the search started, records the time taken and the nodes searched per second.
+        Returns nothing."""
+        elapsed = time.perf_counter() - start
+        self._stats["time_ms"] = elapsed * 1000
+        self._stats["nodes_per_second"] = self._stats["nodes"] / elapsed if elapsed > 0 else 0.0
+
+    def get_stats(self):
+        """Takes no parameters and returns a dictionary with the results of the last search: nodes searched, deepest
+        search finished, score of the best move, time taken in milliseconds, and nodes searched per second."""
+        return dict(self._stats)
+
+
+# define main function
+def main():
+    """Plays a game between two AlphaBetaPlayer bots with a 500 millisecond time limit and prints each move with the
+    search statistics."""
+    game = QuoridorGame(FlatBoard)
+    bots = {1: AlphaBetaPlayer(500), 2: AlphaBetaPlayer(500)}
+
+    while not (game.is_winner(1) or game.is_winner(2)):
+        player = game.get_turn()
+        move = bots[player].choose_move(game)
+        game.push_move(player, move)
+        stats = bots[player].get_stats()
+        print("player %d: %-16s depth %2d  score %6d  %8d nodes  %8.0f nodes/s" %
+              (player, move, stats["depth"], stats["score"], stats["nodes"], stats["nodes_per_second"]))
+
+    print("player 1 wins" if game.is_winner(1) else "player 2 wins")
+
+
+# run main function if run as script
+if __name__ == '__main__':
+    main()
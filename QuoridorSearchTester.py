@@ -0,0 +1,157 @@
+# Author: Christopher Felt
+# Date: 10/18/2026
+#
+# Description: Unit test program for testing the QuoridorSearch program. Tests the transposition tables and the
+# AlphaBetaPlayer bot with and without fence pruning.
+
+# import modules
+from QuoridorSearch import TranspositionTable, LRUTranspositionTable, AlphaBetaPlayer, EXACT, LOWER, WIN_SCORE, \
+    relevant_fences
+from QuoridorProfile import ProfiledGame
+from Quoridor import QuoridorGame, FlatBoard, initial_state
+import unittest
+
+
+class UnitTests(unittest.TestCase):
+    """Class for testing the QuoridorSearch program. Inherits from Unit test."""
+
+    def test_TranspositionTable(self):
+        """Test the depth-preferred replacement policy."""
+
+        # create table with 4 slots
+        table = TranspositionTable(4)
+        q = QuoridorGame()
+        key = q.get_hash()
+
+        # store and look up a position
+        self.assertIsNone(table.lookup(key))
+        table.store(key, 3, 10, EXACT, (None, (4, 1)))
+        self.assertEqual(table.lookup(key), (3, 10, EXACT, (None, (4, 1))))
+
+        # shallower result for another position in the same slot is not stored
+        table.store(key + 4, 2, -5, LOWER)
+        self.assertIsNone(table.lookup(key + 4))
+        self.assertEqual(table.lookup(key)[1], 10)
+
+        # deeper result replaces it
+        table.store(key + 4, 5, -5, LOWER)
+        self.assertEqual(table.lookup(key + 4), (5, -5, LOWER, None))
+        self.assertIsNone(table.lookup(key))
+
+        # result from an earlier search can be replaced by a shallower one
+        table.new_search()
+        table.store(key, 1, 7, EXACT)
+        self.assertEqual(table.lookup(key), (1, 7, EXACT, None))
+        self.assertEqual(table.get_hit_rate(), 4 / 7)
+
+        # cleared table holds nothing
+        table.clear()
+        self.assertIsNone(table.lookup(key))
+
+    def test_LRUTranspositionTable(self):
+        """Test the least recently used replacement policy."""
+
+        # create table with room for 2 positions
+        table = LRUTranspositionTable(2)
+        table.store(1, 1, 1, EXACT)
+        table.store(2, 1, 2, EXACT)
+
+        # looking up 1 makes 2 the least recently used
+        self.assertEqual(table.lookup(1), (1, 1, EXACT, None))
+        table.store(3, 1, 3, EXACT)
+        self.assertIsNone(table.lookup(2))
+        self.assertEqual(table.lookup(1)[1], 1)
+        self.assertEqual(table.lookup(3)[1], 3)
+
+    def test_AlphaBetaPlayer(self):
+        """Test that the bot finds wins, stays within its time limit, and leaves the game unchanged."""
+
+        # player 1 is one step from winning
+        q = QuoridorGame(FlatBoard)
+        q.change_pawn_loc((4, 7), (0, 1))
+        bot = AlphaBetaPlayer(2000)
+        self.assertEqual(bot.choose_move(q), (None, (4, 8)))
+        self.assertEqual(bot.get_stats()["score"], 100000 - 1)
+
+        # player 2 to move wins before player 1 can
+        q.place_fence(1, 'h', (0, 5))
+        self.assertEqual(bot.choose_move(q), (None, (0, 0)))
+
+        # search from the opening stops on time and leaves the game as it was
+        q = QuoridorGame(FlatBoard)
+        key = q.get_hash()
+        bot = AlphaBetaPlayer(200)
+        self.assertIn(bot.choose_move(q), q.legal_moves(1))
+        stats = bot.get_stats()
+        self.assertLess(stats["time_ms"], 400)
+        self.assertGreater(stats["nodes_per_second"], 0)
+        self.assertEqual(q.get_hash(), key)
+        self.assertEqual(q._undo, [])
+
+        # only two-player 9x9 games
+        for game in (QuoridorGame(FlatBoard, size=5), QuoridorGame(FlatBoard, players=4)):
+            self.assertRaises(ValueError, bot.choose_move, game)
+
+    def test_mate_distance(self):
+        """Test that wins are stored counting moves from their own position, so a table kept for the next move reports
+        the right number of moves to the win."""
+        state = initial_state()._replace(pawns=(4 + 6 * 9, 0 + 4 * 9), stock=(0, 0))  # no fences left
+        q = QuoridorGame.from_state(state, FlatBoard)
+        table = TranspositionTable()
+        bot = AlphaBetaPlayer(600000, 8, table=table)
+        self.assertEqual(bot.choose_move(q), (None, (4, 7)))
+        self.assertEqual(bot.get_stats()["score"], WIN_SCORE - 3)
+
+        # one move from the win, two moves after the first root
+        q.move_pawn(1, (4, 7))
+        q.move_pawn(2, (0, 3))
+        self.assertEqual(table.lookup(q.get_hash())[1], WIN_SCORE - 1)
+        self.assertEqual(bot.choose_move(q), (None, (4, 8)))
+        self.assertEqual(bot.get_stats()["score"], WIN_SCORE - 1)
+
+    def test_relevant_fences(self):
+        """Test that relevant_fences yields legal fences only, best first, and checks them only as they are taken."""
+        q = ProfiledGame(FlatBoard)
+        q.place_fence(1, 'h', (5, 4))
+        fences = list(relevant_fences(q, 2))
+        legal = q.legal_fences(2)
+        self.assertEqual(len(set(fences)), len(fences))
+        self.assertTrue(set(fences) < set(legal))
+        self.assertLess(len(fences), len(legal) // 2)
+        self.assertEqual(fences[0], ('h', (4, 1)))  # every shortest path of player 1 crosses it
+        self.assertIn(('v', (6, 3)), fences)  # ends where the placed fence ends
+
+        # taking one fence checks one fence
+        q.reset_profile()
+        next(relevant_fences(q, 2))
+        self.assertEqual(q.get_profile()["is_legal_fence"]["calls"], 1)
+        self.assertNotIn("legal_fences", q.get_profile())
+
+        # player 1 places all their fences
+        q = QuoridorGame(FlatBoard)
+        for n in range(10):
+            self.assertEqual(q.push_move(1, next(relevant_fences(q, 1))), True)
+            self.assertEqual(q.push_move(2, (None, q.legal_pawn_moves(2)[0])), True)
+        self.assertEqual(list(relevant_fences(q, 1)), [])
+
+        # only two-player 9x9 games
+        for game in (QuoridorGame(FlatBoard, size=5), QuoridorGame(FlatBoard, players=4)):
+            self.assertRaises(ValueError, next, relevant_fences(game, 1))
+
+    def test_prune_fences(self):
+        """Test that the pruned bot still finds wins and searches fewer nodes than the full bot."""
+        q = QuoridorGame(FlatBoard)
+        q.change_pawn_loc((4, 7), (0, 1))
+        bot = AlphaBetaPlayer(2000, prune_fences=True)
+        self.assertEqual(bot.choose_move(q), (None, (4, 8)))
+
+        q = QuoridorGame(FlatBoard)
+        q.move_pawn(1, (4, 1))
+        q.place_fence(2, 'h', (3, 2))
+        key = q.get_hash()
+        full = AlphaBetaPlayer(600000, 2)
+        pruned = AlphaBetaPlayer(600000, 2, prune_fences=True)
+        self.assertIn(pruned.choose_move(q), q.legal_moves(1))
+        full.choose_move(q)
+        self.assertLess(pruned.get_stats()["nodes"], full.get_stats()["nodes"])
+        self.assertEqual(q.get_hash(), key)
@@ -0,0 +1,141 @@
+# Author: Christopher Felt
+# Date: 10/18/2026
+#
+# Description: Self-play data generator for the Quoridor program. generate plays a number of games between two move
+# policies across a process pool and writes every position to sharded binary files for training. Each record is
+# RECORD_SIZE bytes: the position before the move as returned by QuoridorGame.to_bytes, the index of the move played
+# (see move_index in the Quoridor program), the winner of the game (0 if it was stopped after MAX_PLIES moves) and the
+# ply of the move, counting from 1.
+#
+# The games are split into shards of games_per_shard games, and each shard is one task for the pool and one file. A
+# shard's games are written to its file one game at a time as soon as the winner is known, so memory stays bounded
+# by a single game however many games are played. Every shard has its own random seed made from the seed passed and
+# the shard number, so the files are the same for the same seed whatever the number of workers.
+#
+# A policy is named in POLICIES and is anything with a choose_move method that takes a QuoridorGame, like the bots in
+# the QuoridorSearch program and RandomPlayer in the QuoridorPolicy program. The time-limited bots aren't offered,
+# since their moves depend on the speed of the machine; "alphabeta" searches to a fixed depth instead.
+#
+# Run this file as a script to generate data: python QuoridorSelfPlay.py DIRECTORY --games 1000 --workers 4
+
+# import modules
+from concurrent.futures import ProcessPoolExecutor
+from Quoridor import QuoridorGame, FlatBoard, STATE_SIZE, move_index, index_move
+from QuoridorSearch import AlphaBetaPlayer
+from QuoridorPolicy import RandomPlayer, GREEDY_CHANCE, MAX_PLIES, play_moves
+import argparse
+import os
+import random
+import struct
+import time
+
+RECORD = struct.Struct("<%dsBBH" % STATE_SIZE)  # position, move index, winner and ply of a record
+RECORD_SIZE = RECORD.size  # bytes of each record
+READ_RECORDS = 4096  # records read from a shard at a time
+
+SEARCH_DEPTH = 2  # depth searched by the alphabeta policy
+
+
+# policy for each name, made from a random.Random object
+POLICIES = {"random": RandomPlayer,
+            "greedy": lambda rand: RandomPlayer(rand, GREEDY_CHANCE),
+            "alphabeta": lambda rand: AlphaBetaPlayer(time_limit=600000, max_depth=SEARCH_DEPTH)}
+
+
+def play_game(policies):
+    """Given a list of the policy of player 1 and of player 2, plays a game on a new QuoridorGame object until a player
+    wins, a policy has no legal move, or MAX_PLIES moves are made, and returns a tuple of the winner (0 if none) and a
+    list of (position bytes, move) tuples, one for each move."""
+    game = QuoridorGame(FlatBoard)
+    moves, state = [], game.to_bytes()
+
+    for player, move in play_moves(game, policies):
+        moves.append((state, move))  # position the move was chosen in
+        state = game.to_bytes()
+
+    return (1 if game.is_winner(1) else 2 if game.is_winner(2) else 0), moves
+
+
+def shard_path(directory, shard):
+    """Given a directory and a shard number, returns the path of the shard's file."""
+    return os.path.join(directory, "shard-%05d.bin" % shard)
+
+
+def play_shard(directory, shard, games, policy_names, seed):
+    """Given a directory, a shard number, a number of games, a list of the policy names of player 1 and player 2, and a
+    seed, plays that many games and writes their records to the shard's file, one game at a time. Returns a tuple of
+    the path, the games played and the records written."""
+    rand = random.Random("%d:%d" % (seed, shard))  # same games for the same seed and shard, in any process
+    policies = [POLICIES[name](rand) for name in policy_names]
+    path = shard_path(directory, shard)
+    records = 0
+
+    with open(path, "wb") as file:
+        for n in range(games):
+            winner, moves = play_game(policies)
+            file.write(b"".join(RECORD.pack(state, move_index(move), winner, ply)
+                                for ply, (state, move) in enumerate(moves, 1)))
+            records += len(moves)
+
+    return path, games, records
+
+
+def generate(directory, games, workers=1, games_per_shard=100, policies=("greedy", "greedy"), seed=0):
+    """Given a directory, a number of games, and optionally the number of worker processes, the games in each shard,
+    the policy names of player 1 and player 2 and a seed, plays the games and writes them to shard files in the
+    directory, which is created if needed. Returns a list of (path, games, records) tuples, one for each shard in
+    order. Raises ValueError if a policy name isn't in POLICIES."""
+    for name in policies:
+        if name not in POLICIES:
+            raise ValueError("unknown policy: %s" % name)
+
+    os.makedirs(directory, exist_ok=True)
+    shards = [min(games_per_shard, games - start) for start in range(0, games, games_per_shard)]
+    args = ([directory] * len(shards), range(len(shards)), shards, [tuple(policies)] * len(shards),
+            [seed] * len(shards))
+
+    if workers == 1:
+        return list(map(play_shard, *args))
+
+    with ProcessPoolExecutor(workers) as pool:
+        return list(pool.map(play_shard, *args))
+
+
+def read_shard(path):
+    """Given the path of a shard file, reads it READ_RECORDS records at a time and yields a tuple of (position bytes,
+    move, winner, ply) for each record, where move is a tuple of orientation and coordinates. The position can be
+    restored with QuoridorGame.from_bytes."""
+    with open(path, "rb") as file:
+        while True:
+            data = file.read(RECORD_SIZE * READ_RECORDS)
+            if not data:
+                return
+
+            for state, index, winner, ply in RECORD.iter_unpack(data):
+                yield state, index_move(index), winner, ply
+
+
+# define main function
+def main():
+    """Generates self-play data with the options given on the command line and prints the games, records and records
+    per second."""
+    parser = argparse.ArgumentParser(description="Generate Quoridor self-play data.")
+    parser.add_argument("directory", help="directory for the shard files")
+    parser.add_argument("--games", type=int, default=1000, help="games to play (default 1000)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="worker processes (default: all CPUs)")
+    parser.add_argument("--games-per-shard", type=int, default=100, help="games in each shard file (default 100)")
+    parser.add_argument("--policies", nargs=2, default=["greedy", "greedy"], choices=sorted(POLICIES),
+                        help="policies of player 1 and player 2 (default: greedy greedy)")
+    parser.add_argument("--seed", type=int, default=0, help="random seed (default 0)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    shards = generate(args.directory, args.games, args.workers, args.games_per_shard, args.policies, args.seed)
+    records = sum(shard[2] for shard in shards)
+    print("%d games, %d records in %d shards, %.0f records/s" % (args.games, records, len(shards),
+                                                                  records / (time.perf_counter() - start)))
+
+
+# run main function if run as script
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+# Author: Christopher Felt
+# Date: 10/18/2026
+#
+# Description: Unit test program for testing the QuoridorSelfPlay program. Checks that the shard files replay as legal
+# games and are the same for the same seed with any number of workers.
+
+# import modules
+from QuoridorSelfPlay import generate, read_shard, RECORD_SIZE
+from Quoridor import QuoridorGame
+import os
+import tempfile
+import unittest
+
+
+def shard_bytes(shards):
+    """Given a list of shards returned by generate, returns a list of the contents of each shard file."""
+    contents = []
+    for path, games, records in shards:
+        with open(path, "rb") as file:
+            contents.append(file.read())
+
+    return contents
+
+
+class UnitTests(unittest.TestCase):
+    """Class for testing the QuoridorSelfPlay program. Inherits from Unit test."""
+
+    def test_records_replay(self):
+        """Test that every record holds a legal move from its position, and that the next record of the game holds the
+        position after it."""
+        with tempfile.TemporaryDirectory() as directory:
+            shards = generate(directory, 5, games_per_shard=2, policies=("greedy", "random"), seed=20)
+            self.assertEqual([shard[1] for shard in shards], [2, 2, 1])
+
+            for path, games, records in shards:
+                self.assertEqual(os.path.getsize(path), records * RECORD_SIZE)
+                finished, game = 0, None
+                for state, move, winner, ply in read_shard(path):
+                    if ply > 1:
+                        self.assertEqual(state, game.to_bytes())  # position after the last move
+                    game = QuoridorGame.from_bytes(state)
+                    player = game.get_turn()
+                    self.assertEqual(game.push_move(player, move), True)
+                    if game.is_winner(player):
+                        self.assertEqual(winner, player)
+                        finished += 1
+                self.assertEqual(finished, games)
+
+        with self.assertRaises(ValueError):
+            generate(directory, 1, policies=("greedy", "mcts"))
+
+    def test_same_seed(self):
+        """Test that the shards are the same with one worker and with a process pool, and differ for another seed."""
+        with tempfile.TemporaryDirectory() as directory:
+            single = shard_bytes(generate(os.path.join(directory, "a"), 6, 1, 3, seed=7))
+            pooled = shard_bytes(generate(os.path.join(directory, "b"), 6, 2, 3, seed=7))
+            other = shard_bytes(generate(os.path.join(directory, "c"), 6, 1, 3, seed=8))
+
+        self.assertEqual(single, pooled)
+        self.assertNotEqual(single, other)
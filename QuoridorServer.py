@@ -0,0 +1,200 @@
+# Author: Christopher Felt
+# Date: 10/18/2026
+#
+# Description: Session layer for hosting many Quoridor games at once with asyncio. The SessionManager class owns a
+# QuoridorGame for every live game, keyed by game ID. Moves for a game are made one at a time under the game's lock,
+# only for the player whose turn it is, and every successful move is pushed to the game's subscribers as an update.
+# When a game is won, its subscribers are told and the game is evicted, so memory only grows with the live games.
+#
+# Run this file as a script for a load test: fake clients play thousands of games at the same time on one
+# SessionManager, and the per-move latency and per-game memory are printed for each number of games.
+
+# import modules
+from Quoridor import QuoridorGame, FlatBoard, to_notation
+import asyncio
+import itertools
+import time
+import tracemalloc
+
+
+class GameSession:
+    """Represents one live game hosted by a SessionManager: the QuoridorGame, the lock that makes its moves one at a
+    time, and the queues of its subscribers."""
+    # initialize data members
+    def __init__(self, game):
+        self._game = game  # QuoridorGame object
+        self._lock = asyncio.Lock()  # held while a move is made
+        self._subscribers = []  # asyncio.Queue for each subscriber
+
+    def get_game(self):
+        """Takes no parameters and returns the QuoridorGame object."""
+        return self._game
+
+    def get_lock(self):
+        """Takes no parameters and returns the asyncio.Lock held while a move is made."""
+        return self._lock
+
+    def get_subscribers(self):
+        """Takes no parameters and returns the list of subscriber queues."""
+        return self._subscribers
+
+
+class SessionManager:
+    """Represents a server's live Quoridor games, keyed by game ID. Games are started with create_game and played with
+    make_move. Clients get updates by reading the queue returned by subscribe: an update is a tuple of the game ID, the
+    player, the move in move notation, and the position as returned by to_bytes, and None is put on the queue after
+    the winning move's update, when the game is evicted. The board class and fair_play are passed to every new
+    QuoridorGame."""
+    # initialize data members
+    def __init__(self, board_class=FlatBoard, fair_play=True):
+        self._board_class = board_class  # board class of new games
+        self._fair_play = fair_play  # enforce the fair-play rule in new games
+        self._sessions = {}  # GameSession for each live game ID
+        self._ids = itertools.count(1)  # source of new game IDs
+        self._finished = 0  # games won and evicted
+
+    def create_game(self, game_id=None):
+        """Given an optional game ID (any hashable value), starts a new game with that ID, or the next free number if
+        none is given. Returns the game ID, or None if a live game already has that ID."""
+        if game_id is None:
+            game_id = next(self._ids)
+            while game_id in self._sessions:
+                game_id = next(self._ids)
+
+        if game_id in self._sessions:
+            return None
+
+        self._sessions[game_id] = GameSession(QuoridorGame(self._board_class, self._fair_play))
+        return game_id
+
+    def get_game(self, game_id):
+        """Given a game ID, returns the live QuoridorGame object with that ID, or None if there isn't one. The game
+        should only be read, since moves must go through make_move."""
+        session = self._sessions.get(game_id)
+        return session.get_game() if session is not None else None
+
+    def get_game_count(self):
+        """Takes no parameters and returns the number of live games."""
+        return len(self._sessions)
+
+    def get_finished_count(self):
+        """Takes no parameters and returns the number of games that have been won and evicted."""
+        return self._finished
+
+    def subscribe(self, game_id):
+        """Given a game ID, returns a new asyncio.Queue that gets an update for every move made in that game from now
+        on, then None when the game is won. Returns None if there is no live game with that ID."""
+        session = self._sessions.get(game_id)
+        if session is None:
+            return None
+
+        queue = asyncio.Queue()
+        session.get_subscribers().append(queue)
+        return queue
+
+    def unsubscribe(self, game_id, queue):
+        """Given a game ID and a queue returned by subscribe, stops sending updates to the queue. Returns nothing."""
+        session = self._sessions.get(game_id)
+        if session is not None and queue in session.get_subscribers():
+            session.get_subscribers().remove(queue)
+
+    async def make_move(self, game_id, player, move):
+        """Given a game ID, an integer that represents the player, and a move as for push_move, waits for any move
+        already being made in that game, then makes the move if it is the player's turn. Returns what push_move
+        returned, or False if there is no live game with that ID or it isn't the player's turn. A successful move is
+        pushed to the game's subscribers, and the game is evicted if it was won."""
+        session = self._sessions.get(game_id)
+        if session is None:
+            return False
+
+        async with session.get_lock():
+            game = session.get_game()
+            if self._sessions.get(game_id) is not session or game.get_turn() != player:
+                return False  # evicted while waiting, or not the player's turn
+
+            result = game.push_move(player, move)
+            if result is True:
+                self.__publish(game_id, session, player, move)
+
+        return result
+
+    def __publish(self, game_id, session, player, move):
+        """Given a game ID, its GameSession, and the player and move just made, puts an update on every subscriber queue
+        and evicts the game if the move won it. Returns nothing."""
+        game = session.get_game()
+        if session.get_subscribers():
+            update = (game_id, player, to_notation(move), game.to_bytes())
+            for queue in session.get_subscribers():
+                queue.put_nowait(update)
+
+        if game.is_winner(player):
+            for queue in session.get_subscribers():
+                queue.put_nowait(None)  # game over
+            del self._sessions[game_id]
+            self._finished += 1
+
+
+# moves of a fake client's game as (player, coordinates). player 1 walks down column 4 and player 2 walks up column 3,
+# so player 1 wins on move 15
+RACE = [move for pair in zip([(1, (4, row)) for row in range(1, 9)], [(2, (3, row)) for row in range(8, 0, -1)])
+        for move in pair][:15]
+
+
+async def fake_client(manager, latencies, updates):
+    """Given a SessionManager, a list to add the latency of each move to in seconds, and a list to add the number of
+    updates received to, starts a game, subscribes to it, and plays RACE, yielding to other clients after every move.
+    Returns nothing."""
+    game_id = manager.create_game()
+    queue = manager.subscribe(game_id)
+
+    for player, coord in RACE:
+        start = time.perf_counter()
+        await manager.make_move(game_id, player, (None, coord))
+        latencies.append(time.perf_counter() - start)
+        await asyncio.sleep(0)
+
+    count = 0
+    while await queue.get() is not None:
+        count += 1
+    updates.append(count)
+
+
+async def load_test(games):
+    """Given a number of games, creates all of them on a new SessionManager at once and then plays them all at the same
+    time with fake clients. Returns a dictionary of the games finished, the updates received, the median and 99th
+    percentile move latency in microseconds, the moves per second, and the bytes of memory allocated for each live
+    game."""
+    manager = SessionManager()
+    latencies, updates = [], []
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    tasks = [asyncio.ensure_future(fake_client(manager, latencies, updates)) for n in range(games)]
+    await asyncio.sleep(0)  # every client has created its game and made its first move
+    memory = (tracemalloc.get_traced_memory()[0] - before) // games
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {"games": manager.get_finished_count(), "updates": sum(updates),
+            "median_us": latencies[len(latencies) // 2] * 1e6, "p99_us": latencies[len(latencies) * 99 // 100] * 1e6,
+            "moves_per_second": len(latencies) / elapsed, "bytes_per_game": memory}
+
+
+# define main function
+def main():
+    """Runs the load test with 100, 1,000 and 10,000 games and prints the results."""
+    print("%7s %10s %10s %14s %14s" % ("games", "median us", "p99 us", "moves/s", "bytes/game"))
+
+    for games in (100, 1000, 10000):
+        stats = asyncio.run(load_test(games))
+        print("%7d %10.1f %10.1f %14.0f %14d" % (stats["games"], stats["median_us"], stats["p99_us"],
+                                                  stats["moves_per_second"], stats["bytes_per_game"]))
+
+
+# run main function if run as script
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+# Author: Christopher Felt
+# Date: 10/18/2026
+#
+# Description: Unit test program for testing the QuoridorServer program. Tests the SessionManager's turns, updates and
+# eviction, and runs a small load test.
+
+# import modules
+from QuoridorServer import SessionManager, RACE, load_test
+from Quoridor import QuoridorGame
+import asyncio
+import unittest
+
+
+class UnitTests(unittest.TestCase):
+    """Class for testing the QuoridorServer program. Inherits from Unit test."""
+
+    def test_SessionManager(self):
+        """Test turns, updates to subscribers, and eviction of won games."""
+
+        async def play():
+            manager = SessionManager()
+            game_id = manager.create_game("match")
+            self.assertIsNone(manager.create_game("match"))
+            queue = manager.subscribe(game_id)
+
+            # out of turn, unknown game, and illegal moves are rejected
+            self.assertEqual(await manager.make_move(game_id, 2, (None, (4, 7))), False)
+            self.assertEqual(await manager.make_move("other", 1, (None, (4, 1))), False)
+            self.assertEqual(await manager.make_move(game_id, 1, (None, (4, 2))), False)
+
+            # moves from both players at once are made one at a time, in turn
+            results = await asyncio.gather(*[manager.make_move(game_id, player, (None, coord))
+                                             for player, coord in RACE])
+            self.assertEqual(results, [True] * len(RACE))
+
+            updates = []
+            while not queue.empty():
+                updates.append(queue.get_nowait())
+            self.assertEqual(updates[0], ("match", 1, "e2", updates[0][3]))
+            self.assertEqual(updates[-1], None)
+            self.assertEqual(QuoridorGame.from_bytes(updates[-2][3]).is_winner(1), True)
+
+            # won game has been evicted
+            self.assertEqual(manager.get_game_count(), 0)
+            self.assertIsNone(manager.get_game(game_id))
+            self.assertEqual(await manager.make_move(game_id, 2, (None, (3, 1))), False)
+
+        asyncio.run(play())
+
+    def test_load_test(self):
+        """Test that every fake client's game is finished and every update is received."""
+        stats = asyncio.run(load_test(50))
+        self.assertEqual(stats["games"], 50)
+        self.assertEqual(stats["updates"], 50 * len(RACE))
+        self.assertGreater(stats["bytes_per_game"], 0)
@@ -0,0 +1,185 @@
+# Author: Christopher Felt
+# Date: 10/18/2026
+#
+# Description: Endgame tablebase for the Quoridor program. Once neither player has a fence left, the game is a race
+# between the two pawns on a fixed fence layout and can be solved exactly. The EndgameTable class solves every
+# position of one fence layout (both pawn cells and the player to move) by retrograde analysis: starting from the
+# positions where the last move won, it works backwards through the pawn moves, marking a position won as soon as one
+# move leads to a lost position, and lost once every move leads to a won position. Positions that are neither can be
+# played forever and are drawn.
+#
+# Each result is stored in an array with one 16-bit entry per position, so probing a position is a single index. The
+# Tablebase class builds and keeps the tables of the most recently used fence layouts, probes a QuoridorGame, and picks
+# the best move. AlphaBetaPlayer takes a Tablebase to score positions without fences exactly.
+
+# import modules
+from array import array
+from collections import OrderedDict
+from Quoridor import neighbor_table, pawn_targets, check_standard_game, ZOBRIST_PAWNS, ZOBRIST_STOCK, ZOBRIST_TURN, \
+    RIGHT, BOT
+
+STATES = 2 * 81 * 81  # positions of one fence layout: player to move, player 1's cell and player 2's cell
+
+
+def state_index(turn, p1, p2):
+    """Given the player to move and the cell numbers of player 1's and player 2's pawns, returns the position's index
+    in an EndgameTable."""
+    return (turn - 1) * 6561 + p1 * 81 + p2
+
+
+def layout_hash(game):
+    """Given a QuoridorGame object, returns a hash of its fences alone: the game's Zobrist hash without the keys of the
+    pawns, the fences left and the turn. Games with the same fences have the same layout hash. Raises ValueError unless
+    the game is a two-player 9x9 game."""
+    check_standard_game(game)
+    result = game.get_hash() ^ ZOBRIST_TURN[game.get_turn()]
+    for player in (1, 2):
+        loc = game.get_pawn_loc(player)
+        result ^= ZOBRIST_PAWNS[player][loc[0] + loc[1] * 9] ^ ZOBRIST_STOCK[player][game.get_fences(player)]
+
+    return result
+
+
+def layout_adjacency(fences):
+    """Given a list of (orientation, coordinates) tuples of placed fences, returns an adjacency list shaped like a
+    neighbor table with None for every border closed by a fence. The fences must be on a 9x9 board."""
+    adjacent = [list(row) for row in neighbor_table(9)]
+    for orient, coord in fences:
+        second = coord[0] + coord[1] * 9
+        first, direction = (second - 9, BOT) if orient == 'h' else (second - 1, RIGHT)
+        adjacent[first][direction] = None
+        adjacent[second][(direction + 2) % 4] = None
+
+    return adjacent
+
+
+class EndgameTable:
+    """Represents the solved pawn race of one fence layout, given as an adjacency list. Each position's entry is n > 0
+    if the player to move wins with their n-th move from now (counting both players' moves), -n - 1 if they lose to
+    the opponent's n-th move from now (so -1 means the last move already won), and 0 if the position is drawn or can't
+    be reached (pawns on the same cell, or the player to move already on their goal row)."""
+    # initialize data members
+    def __init__(self, adjacent):
+        self._values = array('h', bytes(2 * STATES))  # result of each position, indexed by state_index
+        self.__solve(adjacent)
+
+    def __solve(self, adjacent):
+        """Given the adjacency list of the layout, fills in the result of every position by retrograde analysis.
+        Returns nothing."""
+        remaining, parents, queue = self.__link_positions(adjacent)
+
+        for index in queue:  # queue grows while it is being read, in order of distance from the end
+            value = self._values[index]
+            for parent in parents[index]:
+                if self._values[parent] != 0:
+                    continue  # already solved at a shorter distance
+
+                if value < 0:  # a move to a lost position wins
+                    self._values[parent] = -value
+                    queue.append(parent)
+                else:  # a move to a won position; lost once every move is
+                    remaining[parent] -= 1
+                    if remaining[parent] == 0:
+                        self._values[parent] = -value - 2
+                        queue.append(parent)
+
+    def __link_positions(self, adjacent):
+        """Given the adjacency list of the layout, marks the positions where the last move won as lost and returns a
+        tuple of the number of moves from each position, the list of positions that lead to each position, and a list
+        of the lost positions."""
+        remaining = array('h', bytes(2 * STATES))
+        parents = [[] for n in range(STATES)]
+        queue = []
+
+        for turn in (1, 2):
+            for p1 in range(81):
+                for p2 in range(81):
+                    index = state_index(turn, p1, p2)
+                    if p1 == p2 or (turn == 1 and p1 >= 72) or (turn == 2 and p2 < 9):
+                        continue  # can't be reached
+                    if p1 >= 72 or p2 < 9:
+                        self._values[index] = -1  # opponent won with the last move
+                        queue.append(index)
+                        continue
+
+                    children = self.__children(adjacent, turn, p1, p2)
+                    remaining[index] = len(children)
+                    for child in children:
+                        parents[child].append(index)
+
+        return remaining, parents, queue
+
+    def __children(self, adjacent, turn, p1, p2):
+        """Given the adjacency list, the player to move and both pawn cells, returns a list of the indexes of the
+        positions after each pawn move of the player to move."""
+        if turn == 1:
+            return [state_index(2, cell, p2) for cell in pawn_targets(adjacent, p1, {p2})]
+
+        return [state_index(1, p1, cell) for cell in pawn_targets(adjacent, p2, {p1})]
+
+    def get_result(self, turn, p1, p2):
+        """Given the player to move and both pawn cells, returns a tuple of the outcome for the player to move (1 for a
+        win, -1 for a loss, 0 for a draw) and the number of moves until the winning move (0 for a draw)."""
+        value = self._values[state_index(turn, p1, p2)]
+        if value > 0:
+            return 1, value
+
+        return (-1, -value - 1) if value < 0 else (0, 0)
+
+
+class Tablebase:
+    """Represents a cache of EndgameTables for the fence layouts seen most recently, keyed by layout hash. A table is
+    built the first time its layout is probed, and the least recently used table is dropped when there are more than
+    max_layouts."""
+    # initialize data members
+    def __init__(self, max_layouts=64):
+        self._max_layouts = max_layouts  # tables kept
+        self._tables = OrderedDict()  # EndgameTable for each layout hash, least recently used first
+        self._built = 0  # tables built
+
+    def get_table(self, game):
+        """Given a QuoridorGame object, returns the EndgameTable for its fences, building it if it isn't cached."""
+        key = layout_hash(game)
+        table = self._tables.get(key)
+
+        if table is None:
+            table = EndgameTable(layout_adjacency(game.get_placed_fences()))
+            self._tables[key] = table
+            self._built += 1
+            if len(self._tables) > self._max_layouts:
+                self._tables.popitem(last=False)  # remove least recently used
+        else:
+            self._tables.move_to_end(key)
+
+        return table
+
+    def probe(self, game):
+        """Given a QuoridorGame object, returns a tuple of the outcome and number of moves for the player whose turn it
+        is, as for EndgameTable.get_result, or None if either player has fences left or the game has been won. Raises
+        ValueError unless the game is a two-player 9x9 game."""
+        check_standard_game(game)
+        if game.get_fences(1) or game.get_fences(2) or game.is_winner(game.get_turn()):
+            return None
+
+        p1, p2 = game.get_pawn_loc(1), game.get_pawn_loc(2)
+        return self.get_table(game).get_result(game.get_turn(), p1[0] + p1[1] * 9, p2[0] + p2[1] * 9)
+
+    def best_move(self, game):
+        """Given a QuoridorGame object, returns the pawn move with the best result for the player whose turn it is: the
+        fastest win, otherwise a draw, otherwise the slowest loss. Returns None if the position can't be probed or there
+        are no legal moves. Raises ValueError unless the game is a two-player 9x9 game."""
+        if self.probe(game) is None:
+            return None
+
+        player = game.get_turn()
+        table, moves = self.get_table(game), []
+        for coord in game.legal_pawn_moves(player):
+            cells = [coord if n == player else game.get_pawn_loc(n) for n in (1, 2)]
+            outcome, plies = table.get_result(3 - player, *[cell[0] + cell[1] * 9 for cell in cells])
+            moves.append(((outcome, plies if outcome < 0 else -plies), coord))  # opponent's result; lowest is best
+
+        return (None, min(moves)[1]) if moves else None
+
+    def get_built_count(self):
+        """Takes no parameters and returns the number of tables built."""
+        return self._built
@@ -0,0 +1,113 @@
+# Author: Christopher Felt
+# Date: 10/18/2026
+#
+# Description: Unit test program for testing the QuoridorTablebase program. Checks the tables against a brute force
+# search of QuoridorGame positions where neither player has fences left.
+
+# import modules
+from QuoridorTablebase import Tablebase, layout_hash
+from QuoridorSearch import AlphaBetaPlayer
+from Quoridor import QuoridorGame, FlatBoard, initial_state
+import random
+import unittest
+
+
+def solve(game, depth):
+    """Given a QuoridorGame object and a number of moves, searches every pawn move to that depth and returns the
+    outcome and number of moves for the player whose turn it is, as for Tablebase.probe, or None if the result isn't
+    decided within that many moves or the player can't move."""
+    player = game.get_turn()
+    results = []
+
+    for coord in game.legal_pawn_moves(player):
+        with game.trial(player, (None, coord)):
+            if game.is_winner(player):
+                return 1, 1
+            results.append(solve(game, depth - 1) if depth > 1 else None)
+
+    wins = [plies for result in results if result is not None and result[0] == -1 for plies in [result[1]]]
+    if wins:
+        return 1, min(wins) + 1
+    if results and all(result is not None and result[0] == 1 for result in results):
+        return -1, max(result[1] for result in results) + 1
+
+    return None
+
+
+def fenced_out_game(rand):
+    """Given a random.Random object, returns a QuoridorGame where both players have placed all their fences at random
+    and the pawns have been put on random cells off their goal rows."""
+    q = QuoridorGame(FlatBoard)
+    for n in range(20):
+        q.push_move(q.get_turn(), rand.choice(q.legal_fences(q.get_turn())))
+
+    p1 = (rand.randrange(9), rand.randrange(8))
+    p2 = (rand.randrange(9), rand.randrange(1, 9))
+    q.change_pawn_loc(p1, p2 if p2 != p1 else (p1[0], p1[1] + 1))
+    return q
+
+
+class UnitTests(unittest.TestCase):
+    """Class for testing the QuoridorTablebase program. Inherits from Unit test."""
+
+    def test_Tablebase_matches_search(self):
+        """Test that every result decided by a five move search agrees with the table."""
+        rand = random.Random(8)
+        tablebase = Tablebase(4)
+        checked = 0
+
+        for n in range(40):
+            q = fenced_out_game(rand)
+            expected = solve(q, 5)
+            if expected is not None:
+                self.assertEqual(tablebase.probe(q), expected)
+                checked += 1
+
+        self.assertGreater(checked, 10)
+        self.assertEqual(tablebase.get_built_count(), checked)  # one layout per game
+
+    def test_Tablebase(self):
+        """Test probes and best moves on an open board."""
+        tablebase = Tablebase()
+        q = QuoridorGame()
+        self.assertIsNone(tablebase.probe(q))  # fences left
+
+        # player 2 is one move from winning, player 1 two moves
+        for player in (1, 2):
+            for n in range(10):
+                q._players[player].use_fence()
+        q.change_pawn_loc((0, 6), (8, 1))
+        self.assertEqual(tablebase.probe(q), (-1, 2))
+        q.move_pawn(1, (0, 7))
+        self.assertEqual(tablebase.probe(q), (1, 1))
+        self.assertEqual(tablebase.best_move(q), (None, (8, 0)))
+
+        # layout hash ignores the pawns and the turn
+        key = layout_hash(q)
+        q.move_pawn(2, (7, 1))
+        self.assertEqual(layout_hash(q), key)
+        self.assertEqual(tablebase.get_built_count(), 1)
+
+    def test_unsupported_games(self):
+        """Test that games that aren't two-player 9x9 games are rejected instead of probed."""
+        tablebase = Tablebase()
+        small = QuoridorGame.from_state(initial_state(5)._replace(stock=(0, 0)), FlatBoard)  # no fences left
+        four = QuoridorGame.from_state(initial_state(9, 4)._replace(stock=(0, 0, 0, 0)), FlatBoard)
+
+        for game in (small, four):
+            self.assertRaises(ValueError, tablebase.probe, game)
+            self.assertRaises(ValueError, tablebase.best_move, game)
+            self.assertRaises(ValueError, layout_hash, game)
+        self.assertEqual(tablebase.get_built_count(), 0)
+
+    def test_AlphaBetaPlayer_tablebase(self):
+        """Test that the bot plays a long won race perfectly with the tablebase."""
+        q = QuoridorGame()
+        for player in (1, 2):
+            for n in range(10):
+                q._players[player].use_fence()
+        q.change_pawn_loc((0, 1), (8, 7))
+
+        bot = AlphaBetaPlayer(500, tablebase=Tablebase())
+        self.assertEqual(bot.choose_move(q), (None, (0, 2)))
+        self.assertEqual(bot.get_stats()["score"], 100000 - 13)
@@ -5,10 +5,55 @@
 # methods.
 
 # import modules
-from Quoridor import QuoridorGame
+from Quoridor import QuoridorGame, Board, CompactBoard, FlatBoard, DistanceMap, FENCE_SLOTS, STATE_SIZE, to_notation, \
+    from_notation, goal_cells, long_fence_slots, initial_state, legal_moves, apply_move, neighbor_table, TOP, RIGHT, \
+    BOT, LEFT
+import copy
+import pickle
+import random
 import unittest
 
 
+def border_fence(first, direction):
+    """Given the cell number of a cell on a 9x9 board and a direction (TOP, RIGHT, BOT or LEFT) from it to a neighboring
+    cell, returns a tuple of the horizontal and vertical fence bits of a GameState with a fence on the border between
+    them."""
+    second = neighbor_table(9)[first][direction]
+    cell = {TOP: first, BOT: second, LEFT: first, RIGHT: second}[direction]  # cell whose top or left border it is
+    return (1 << cell, 0) if direction in (TOP, BOT) else (0, 1 << cell)
+
+
+def reference_move_legal(pawn, enemy, closed, target):
+    """Given the cell numbers of the player's pawn and the opposing pawn on a 9x9 board, a set of (cell, direction)
+    tuples for each side of every fenced border, and the cell number of a target cell, returns True if the pawn may
+    move to the target under the rules, worked out step by step without the face-off table. An edge of the board behind
+    the opposing pawn allows neither a jump nor a diagonal move."""
+    neighbors = neighbor_table(9)
+    for direction in (TOP, RIGHT, BOT, LEFT):
+        step = neighbors[pawn][direction]
+        if step is None or (pawn, direction) in closed:
+            continue  # edge of board or fence in the way
+        if step != enemy:
+            if step == target:
+                return True  # standard orthogonal move
+            continue
+
+        behind = neighbors[enemy][direction]
+        if behind is None:
+            continue  # edge of board behind opposing pawn
+        if (enemy, direction) not in closed:
+            if behind == target:
+                return True  # jump over opposing pawn
+            continue
+
+        # fence behind opposing pawn: step to either side of it
+        for side in ((direction + 1) % 4, (direction + 3) % 4):
+            if neighbors[enemy][side] == target and (enemy, side) not in closed:
+                return True
+
+    return False
+
+
 class UnitTests(unittest.TestCase):
     """Class for testing the Quoridor program. Inherits from Unit test."""
 
@@ -303,8 +348,8 @@ class UnitTests(unittest.TestCase):
         """Test all edge cases for diagonal move."""
 
         # ----------------------------- illegal vertical test ------------------------------------
-        # start new game
-        q = QuoridorGame()
+        # start new game. the fence setup boxes in both pawns, so the fair-play rule is turned off
+        q = QuoridorGame(fair_play=False)
         q.change_pawn_loc((4, 1), (4, 2))
 
         # fence setup
@@ -386,8 +431,8 @@ class UnitTests(unittest.TestCase):
         # q.print_board()
 
         # ----------------------------- illegal horizontal test ------------------------------------
-        # start new game
-        q = QuoridorGame()
+        # start new game. the fence setup boxes in both pawns, so the fair-play rule is turned off
+        q = QuoridorGame(fair_play=False)
         q.change_pawn_loc((3, 2), (4, 2))
 
         # fence setup
@@ -886,3 +931,480 @@ class UnitTests(unittest.TestCase):
         self.assertTrue(q.move_pawn(2, (4, 8)))
         # check is_winner
         self.assertFalse(q.is_winner(2))
+
+    def test_FlatBoard_matches_Board(self):
+        """Test that a game played on a FlatBoard gives the same results as a game played on a Board."""
+
+        # create game objects
+        q = QuoridorGame(Board)
+        b = QuoridorGame(FlatBoard)
+        rand = random.Random(162)
+
+        # play the same random actions on both boards
+        for turn in range(2000):
+            player = rand.choice((1, 2))
+            coord = (rand.randrange(9), rand.randrange(9))
+            if rand.random() < 0.3:
+                orient = rand.choice('hv')
+                self.assertEqual(q.place_fence(player, orient, coord), b.place_fence(player, orient, coord))
+            else:
+                self.assertEqual(q.move_pawn(player, coord), b.move_pawn(player, coord))
+
+        # compare every side of every cell
+        for col in range(9):
+            for row in range(9):
+                for side in ("top", "right", "bot", "left"):
+                    self.assertEqual(q._board.get_fence((col, row), side), b._board.get_fence((col, row), side))
+                    self.assertEqual(q._board.get_cell((col, row)).get_fence(side),
+                                     b._board.get_cell((col, row)).get_fence(side))
+                self.assertEqual(q._board.get_pawn((col, row)), b._board.get_pawn((col, row)))
+
+    def test_CompactBoard(self):
+        """Test that CompactCell keeps the Cell interface and that a CompactBoard game matches a Board game."""
+        cell = CompactBoard().get_cell((0, 8))
+        self.assertEqual([cell.get_fence(side) for side in ("top", "right", "bot", "left")], [False, False, None, None])
+        cell.set_fence("top")
+        cell.set_pawn(True)
+        self.assertEqual((cell.get_fence("top"), cell.get_pawn()), (True, True))
+        cell.remove_fence("top")
+        cell.set_pawn(False)
+        self.assertEqual((cell.get_fence("top"), cell.get_pawn(), cell.get_fence("left")), (False, False, None))
+        self.assertFalse(hasattr(cell, "__dict__"))
+
+        # play the same random game on both boards
+        q = QuoridorGame(Board)
+        c = QuoridorGame(CompactBoard)
+        rand = random.Random(19)
+        for turn in range(60):
+            move = rand.choice(q.legal_moves(q.get_turn()))
+            self.assertEqual(c.legal_moves(c.get_turn()), q.legal_moves(q.get_turn()))
+            q.push_move(q.get_turn(), move)
+            c.push_move(c.get_turn(), move)
+
+        for col in range(9):
+            for row in range(9):
+                for side in ("top", "right", "bot", "left"):
+                    self.assertEqual(c._board.get_fence((col, row), side), q._board.get_fence((col, row), side))
+                self.assertEqual(c._board.get_pawn((col, row)), q._board.get_pawn((col, row)))
+        self.assertEqual(copy.deepcopy(c).get_hash(), q.get_hash())
+
+    def test_face_off_table(self):
+        """Test that the face-off table gives the same pawn moves as reference_move_legal for every pawn cell, side of
+        the opposing pawn, and fences between, behind and beside the opposing pawn."""
+        neighbors = neighbor_table(9)
+        checked = 0
+
+        for pawn in range(81):
+            for direction in (TOP, RIGHT, BOT, LEFT):
+                enemy = neighbors[pawn][direction]
+                if enemy is None:
+                    continue
+                borders = [(pawn, direction)] + [(enemy, side) for side in
+                                                 (direction, (direction + 1) % 4, (direction + 3) % 4)
+                                                 if neighbors[enemy][side] is not None]
+
+                for mask in range(1 << len(borders)):
+                    chosen = [border for bit, border in enumerate(borders) if mask >> bit & 1]
+                    fences = [border_fence(*border) for border in chosen]
+                    state = initial_state()._replace(pawns=(pawn, enemy), h_fences=sum(bits[0] for bits in fences),
+                                                     v_fences=sum(bits[1] for bits in fences))
+                    q = QuoridorGame.from_state(state, FlatBoard)
+                    closed = set(chosen) | {(neighbors[cell][side], (side + 2) % 4) for cell, side in chosen}
+                    legal = set()
+
+                    # every cell within two steps of the pawn
+                    for col in range(max(pawn % 9 - 2, 0), min(pawn % 9 + 3, 9)):
+                        for row in range(max(pawn // 9 - 2, 0), min(pawn // 9 + 3, 9)):
+                            if abs(col - pawn % 9) + abs(row - pawn // 9) > 2:
+                                continue
+                            expected = reference_move_legal(pawn, enemy, closed, col + row * 9)
+                            self.assertEqual(q._QuoridorGame__check_move_legality(1, (col, row)), expected)
+                            if expected:
+                                legal.add((col, row))
+                            checked += 1
+                    self.assertEqual(set(q.legal_pawn_moves(1)), legal)
+
+        self.assertGreater(checked, 30000)
+
+    def test_get_path_length(self):
+        """Test get_path_length and the fair-play rule."""
+
+        # create game object
+        q = QuoridorGame()
+        self.assertEqual(q.get_path_length(1), 8)
+        self.assertEqual(q.get_path_length(2), 8)
+
+        # player 1 blocks player 2's straight path
+        self.assertTrue(q.place_fence(1, 'h', (4, 8)))
+        self.assertEqual(q.get_path_length(2), 9)
+        self.assertEqual(q.get_path_length(1), 9)  # the fence is on player 1's path too
+
+        # player 2 and player 1 box in the corner at col 0 row 0
+        q.change_pawn_loc((0, 0), (4, 8))
+        self.assertTrue(q.place_fence(2, 'v', (1, 0)))
+        self.assertEqual(q.get_path_length(1), 8)
+
+        # player 1 attempts to close the box on their own pawn
+        self.assertEqual(q.place_fence(1, 'h', (0, 1)), "breaks the fair play rule")
+        self.assertEqual(q.get_path_length(1), 8)
+
+        # fence was not placed and it is still player 1's turn
+        self.assertTrue(q.move_pawn(1, (0, 1)))
+
+        # fair-play rule turned off
+        q = QuoridorGame(fair_play=False)
+        q.change_pawn_loc((0, 0), (4, 8))
+        self.assertTrue(q.place_fence(1, 'v', (1, 0)))
+        self.assertTrue(q.place_fence(2, 'h', (0, 1)))
+        self.assertIsNone(q.get_path_length(1))
+
+    def test_DistanceMap_incremental(self):
+        """Test that the distance maps updated by place_fence match maps built from scratch."""
+
+        for board_class in (Board, FlatBoard):
+            q = QuoridorGame(board_class)
+            rand = random.Random(8)
+
+            # place random fences until both players run out
+            while q._players[2].get_fences() > 0:
+                player = q._player_turn
+                q.place_fence(player, rand.choice('hv'), (rand.randrange(9), rand.randrange(9)))
+
+                # compare every cell with new maps
+                for player, distances in q._distances.items():
+                    fresh = DistanceMap(q._adjacent, goal_cells(9, player))
+                    for col in range(9):
+                        for row in range(9):
+                            self.assertEqual(distances.get_distance((col, row)), fresh.get_distance((col, row)))
+
+    def test_legal_moves(self):
+        """Test that legal_pawn_moves and legal_fences match move_pawn and place_fence."""
+
+        rand = random.Random(25)
+        for game in range(20):
+            # start new game with random fences and pawns close together
+            q = QuoridorGame(FlatBoard, fair_play=game % 2 == 0)
+            for fence in range(rand.randrange(20)):
+                q.place_fence(q._player_turn, rand.choice('hv'), (rand.randrange(9), rand.randrange(9)))
+            col, row = rand.randrange(1, 8), rand.randrange(1, 8)
+            q.change_pawn_loc((col, row), rand.choice(((col + 1, row), (col, row + 1), (col - 1, row - 1))))
+
+            # try every move on a copy of the game
+            for player in (1, 2):
+                q._player_turn = player
+                moves = [(c, r) for c in range(9) for r in range(9) if copy.deepcopy(q).move_pawn(player, (c, r))]
+                self.assertEqual(sorted(q.legal_pawn_moves(player)), moves)
+
+            # try every fence on a copy of the game
+            player = q._player_turn
+            fences = [slot for slot in FENCE_SLOTS if copy.deepcopy(q).place_fence(player, *slot) is True]
+            self.assertEqual(q.legal_fences(player), fences)
+
+    def test_push_pop_move(self):
+        """Test that pop_move puts the game back exactly as it was before each move."""
+
+        def snapshot(game):
+            """Returns a tuple of everything a move can change in the game."""
+            return ([(p.get_pawn_loc(), p.get_fences()) for p in game._players.values()],
+                    game._player_turn, game._winner, game.get_hash(), [row[:] for row in game._adjacent],
+                    [[d.get_distance((c, r)) for c in range(9) for r in range(9)] for d in game._distances.values()],
+                    [[game._board.get_fence((c, r), side) for side in ("top", "right", "bot", "left")] +
+                     [game._board.get_pawn((c, r))] for c in range(9) for r in range(9)])
+
+        for board_class in (Board, FlatBoard):
+            q = QuoridorGame(board_class)
+            rand = random.Random(4)
+            history = []
+
+            # play random legal moves until the game is won
+            while q._winner is None:
+                player = q._player_turn
+                moves = [(None, coord) for coord in q.legal_pawn_moves(player)] + q.legal_fences(player)
+                before = snapshot(q)
+                self.assertTrue(q.push_move(player, rand.choice(moves)))
+                history.append(before)
+
+                # trial move leaves the game unchanged
+                after = snapshot(q)
+                if q._winner is None:
+                    with q.trial(q._player_turn, (None, q.legal_pawn_moves(q._player_turn)[0])) as result:
+                        self.assertTrue(result)
+                self.assertEqual(snapshot(q), after)
+
+            # take back every move
+            while history:
+                q.pop_move()
+                self.assertEqual(snapshot(q), history.pop())
+
+        # illegal trial move is not undone
+        q = QuoridorGame()
+        with q.trial(2, (None, (4, 7))) as result:
+            self.assertFalse(result)
+        self.assertEqual(q._undo, [])
+
+    def test_get_hash(self):
+        """Test that the Zobrist hash depends on the position and not on the order of moves."""
+
+        # same position reached by two move orders
+        q = QuoridorGame()
+        r = QuoridorGame()
+        for move in ((1, 'h', (6, 5)), (2, None, (4, 7)), (1, None, (4, 1)), (2, 'v', (3, 3))):
+            self.assertTrue(q.push_move(move[0], move[1:]))
+        for move in ((1, None, (4, 1)), (2, 'v', (3, 3)), (1, 'h', (6, 5)), (2, None, (4, 7))):
+            self.assertTrue(r.push_move(move[0], move[1:]))
+        self.assertEqual(q.get_hash(), r.get_hash())
+
+        # incremental hash matches hash computed from scratch
+        self.assertEqual(q.get_hash(), q._QuoridorGame__full_hash())
+
+        # different turn, fence, fence count, or pawn changes the hash
+        hashes = {q.get_hash()}
+        q.place_fence(1, 'h', (2, 2))
+        hashes.add(q.get_hash())
+        q.pop_move()
+        q.move_pawn(1, (4, 2))
+        hashes.add(q.get_hash())
+        q.change_pawn_loc((4, 1), (4, 7))
+        hashes.add(q.get_hash())
+        self.assertEqual(len(hashes), 4)
+
+    def test_to_bytes(self):
+        """Test that games restored from bytes have the same position as the original game."""
+        rand = random.Random(11)
+
+        for n in range(10):
+            # play a random game part of the way, or until it is won
+            q = QuoridorGame()
+            for ply in range(rand.randrange(60)):
+                moves = q.legal_moves(q.get_turn())
+                if not moves:
+                    break
+                q.push_move(q.get_turn(), rand.choice(moves))
+
+            data = q.to_bytes()
+            self.assertEqual(len(data), STATE_SIZE)
+
+            for board_class in (Board, FlatBoard):
+                r = QuoridorGame.from_bytes(data, board_class)
+                self.assertEqual(r.to_bytes(), data)
+                self.assertEqual(r.get_hash(), q.get_hash())
+                self.assertEqual(r.get_placed_fences(), q.get_placed_fences())
+                self.assertEqual(r.get_path_length(2), q.get_path_length(2))
+                self.assertEqual(r.legal_moves(r.get_turn()), q.legal_moves(q.get_turn()))
+                self.assertEqual([r.is_winner(1), r.is_winner(2)], [q.is_winner(1), q.is_winner(2)])
+                self.assertEqual(r._board.get_pawn(q.get_pawn_loc(1)), True)
+
+        # won game
+        q = QuoridorGame()
+        q.change_pawn_loc((4, 7), (0, 4))
+        q.move_pawn(1, (4, 8))
+        r = QuoridorGame.from_bytes(q.to_bytes())
+        self.assertEqual(r.is_winner(1), True)
+        self.assertEqual(r.move_pawn(1, (4, 7)), False)
+
+        self.assertRaises(ValueError, QuoridorGame.from_bytes, b"\x00")
+
+        # bytes of the right length that aren't a position
+        data = QuoridorGame().to_bytes()
+        for header in (bytes(4), bytes([200] * 4), bytes([4, 4, 0xaa, 1]), bytes([81, 76, 0xaa, 1]),
+                       bytes([4, 76, 0xba, 1]), bytes([4, 76, 0xaa, 3]), bytes([4, 76, 0xaa, 13])):
+            self.assertRaises(ValueError, QuoridorGame.from_bytes, header + data[4:])
+        self.assertRaises(ValueError, QuoridorGame.from_bytes, bytes([200] * STATE_SIZE))
+
+    def test_GameState(self):
+        """Test that legal_moves and apply_move play random games the same way as QuoridorGame."""
+        rand = random.Random(22)
+
+        for size, players in ((9, 2), (5, 2), (7, 4), (9, 2)):
+            q = QuoridorGame(FlatBoard, size=size, players=players)
+            state = initial_state(size, players)
+            self.assertEqual(q.get_state(), state)
+
+            while not state.winner:
+                moves = legal_moves(state)
+                self.assertEqual(moves, q.legal_moves(q.get_turn()))
+                pawn_moves = [move for move in moves if move[0] is None]
+                move = rand.choice(moves) if rand.random() < 0.5 else \
+                    min(pawn_moves, key=lambda move: q.get_distance(q.get_turn(), move[1]))  # step towards the goal
+                state = apply_move(state, move)
+                q.push_move(q.get_turn(), move)
+                self.assertEqual(q.get_state(), state)
+
+            self.assertEqual(q.is_winner(state.winner), True)
+            self.assertEqual(legal_moves(state), [])
+            r = QuoridorGame.from_state(pickle.loads(pickle.dumps(state)), Board)
+            self.assertEqual((r.get_hash(), r.get_placed_fences()), (q.get_hash(), q.get_placed_fences()))
+
+        # fair-play rule: a fence under player 1 in the corner would close them in
+        state = initial_state()._replace(pawns=(0, 76), v_fences=1 << 1)
+        self.assertNotIn(('h', (0, 1)), legal_moves(state))
+        self.assertEqual(legal_moves(state), QuoridorGame.from_state(state).legal_moves(1))
+        self.assertRaises(ValueError, apply_move, state, ('h', (0, 1)))
+
+        # states are values that can be dictionary keys
+        state = apply_move(initial_state(), (None, (4, 1)))
+        self.assertEqual({state: 1}[apply_move(initial_state(), (None, (4, 1)))], 1)
+        self.assertRaises(ValueError, apply_move, state, (None, (4, 2)))  # not player 2's pawn move
+        self.assertRaises(ValueError, apply_move, state, ('h', (4, 0)))  # edge of board
+
+    def test_notation(self):
+        """Test that moves convert to and from move notation."""
+        self.assertEqual(to_notation((None, (4, 1))), "e2")
+        self.assertEqual(to_notation(('h', (4, 2))), "e3h")
+        self.assertEqual(from_notation("i9v"), ('v', (8, 8)))
+        self.assertEqual(from_notation("a1"), (None, (0, 0)))
+        for text in ("", "e", "j1", "e0", "e3x", "e10"):
+            self.assertIsNone(from_notation(text))
+
+        for orient, coord in FENCE_SLOTS:
+            self.assertEqual(from_notation(to_notation((orient, coord))), (orient, coord))
+
+    def test_board_size(self):
+        """Test games on smaller boards."""
+        for board_class in (Board, FlatBoard):
+            q = QuoridorGame(board_class, size=5)
+            self.assertEqual((q.get_pawn_loc(1), q.get_pawn_loc(2), q.get_fences(1)), ((2, 0), (2, 4), 5))
+            self.assertEqual(q.get_path_length(2), 4)
+            self.assertEqual(q.move_pawn(1, (2, 5)), False)  # off the board
+            self.assertEqual(q.place_fence(1, 'v', (5, 0)), False)
+            self.assertEqual(q.place_fence(1, 'h', (2, 4)), True)
+            self.assertEqual(q.get_path_length(2), 5)
+            self.assertEqual(len(q.legal_fences(2)), 2 * 4 * 5 - 1)
+
+            # race around the fence to the last row
+            for p2, p1 in (((1, 4), (2, 1)), ((1, 3), (2, 2)), ((1, 2), (2, 3)), ((1, 1), (3, 3))):
+                self.assertEqual(q.move_pawn(2, p2), True)
+                self.assertEqual(q.move_pawn(1, p1), True)
+            self.assertEqual(q.move_pawn(2, (0, 1)), True)
+            self.assertEqual(q.move_pawn(1, (3, 4)), True)
+            self.assertEqual(q.is_winner(1), True)
+            self.assertRaises(ValueError, q.to_bytes)
+
+        q = QuoridorGame(size=7)
+        self.assertEqual((q.get_pawn_loc(2), q.get_fences(2), len(q.legal_moves(1))), ((3, 6), 7, 3 + 2 * 6 * 7))
+        self.assertRaises(ValueError, QuoridorGame, size=8)
+        self.assertRaises(ValueError, QuoridorGame, players=3)
+
+    def test_four_players(self):
+        """Test turns, goals and jumps in a four player game."""
+        q = QuoridorGame(FlatBoard, players=4)
+        self.assertEqual([q.get_pawn_loc(player) for player in (3, 4)], [(0, 4), (8, 4)])
+        self.assertEqual([q.get_fences(player) for player in (1, 2, 3, 4)], [5, 5, 5, 5])
+        self.assertEqual(q.get_path_length(3), 8)
+        start = q.get_hash()
+
+        # turns go 1, 2, 3, 4 and back to 1
+        self.assertEqual(q.move_pawn(1, (4, 1)), True)
+        self.assertEqual(q.move_pawn(3, (1, 4)), False)  # not player 3's turn
+        self.assertEqual(q.move_pawn(2, (4, 7)), True)
+        self.assertEqual(q.place_fence(3, 'v', (1, 4)), True)
+        self.assertEqual(q.move_pawn(4, (7, 4)), True)
+        self.assertEqual(q.get_turn(), 1)
+        self.assertEqual(q.get_path_length(3), 9)
+        for n in range(4):
+            q.pop_move()
+        self.assertEqual(q.get_hash(), start)
+
+        # jumping over one pawn, and not over a second pawn behind it
+        q.change_pawn_loc((4, 3), (4, 5), (4, 4), (8, 4))
+        self.assertEqual(sorted(q.legal_pawn_moves(1)), [(3, 3), (4, 2), (5, 3)])
+        self.assertEqual(q.move_pawn(1, (4, 5)), False)
+        self.assertEqual(q.move_pawn(1, (4, 2)), True)
+        self.assertEqual(q.move_pawn(2, (4, 3)), True)  # jump over player 3
+
+        # player 4 wins on the left column
+        q.change_pawn_loc((4, 2), (4, 3), (4, 4), (1, 0))
+        self.assertEqual(q.move_pawn(3, (3, 4)), True)
+        self.assertEqual(q.move_pawn(4, (0, 0)), True)
+        self.assertEqual(q.is_winner(4), True)
+        self.assertEqual(q.get_turn(), 4)
+
+    def test_long_fences(self):
+        """Test two-cell fences: both halves block, and crossing and overlapping fences are rejected."""
+        for board_class in (Board, FlatBoard):
+            q = QuoridorGame(board_class, long_fences=True)
+            self.assertEqual(len(q.legal_fences(1)), 2 * 8 * 8)
+            self.assertEqual(q.place_fence(1, 'h', (8, 4)), False)  # second half off the board
+            self.assertEqual(q.place_fence(1, 'h', (3, 1)), True)
+            self.assertEqual(q._board.get_fence((4, 1), "top"), True)
+            self.assertEqual(q.move_pawn(2, (4, 7)), True)
+
+            # crossing at the center, overlapping on either side, and on top of the fence
+            for orient, coord in (('v', (4, 0)), ('h', (2, 1)), ('h', (4, 1)), ('h', (3, 1))):
+                self.assertEqual(q.place_fence(1, orient, coord), False)
+            self.assertEqual(q.place_fence(1, 'v', (4, 1)), True)  # touching the fence is allowed
+            self.assertEqual(q.place_fence(2, 'h', (5, 1)), True)
+            self.assertEqual(sorted(q.get_placed_fences()), [('h', (3, 1)), ('h', (5, 1)), ('v', (4, 1))])
+            self.assertEqual(len(q.legal_fences(1)), 128 - 4 - 3 - 3)
+            self.assertEqual(q.move_pawn(1, (4, 1)), False)
+
+            # taking a fence back opens every slot only it blocked
+            q.pop_move()
+            q.pop_move()
+            self.assertEqual(len(q.legal_fences(2)), 128 - 4)
+            self.assertEqual(q.place_fence(2, 'v', (4, 0)), False)
+            self.assertRaises(ValueError, q.to_bytes)
+
+        # fair play: player 2's row is fenced off except for the last column
+        q = QuoridorGame(long_fences=True)
+        for col in (0, 2, 4, 6):
+            q.push_move(q.get_turn(), ('h', (col, 8)))
+        self.assertNotIn(('v', (8, 7)), q.legal_fences(1))
+        self.assertEqual(q.place_fence(1, 'v', (8, 7)), "breaks the fair play rule")
+        self.assertEqual(q.place_fence(1, 'v', (8, 6)), True)
+        self.assertEqual(q.get_path_length(2), 12)
+
+    def test_long_fences_legal(self):
+        """Test that the open slots kept up to date by place_fence and pop_move match place_fence on every slot."""
+        rand = random.Random(16)
+        q = QuoridorGame(FlatBoard, long_fences=True)
+        for ply in range(24):
+            moves = q.legal_fences(q.get_turn())
+            q.push_move(q.get_turn(), rand.choice(moves))
+            if ply % 4 == 3:
+                q.pop_move()
+
+        player = q.get_turn()
+        expected = []
+        for orient, coord in long_fence_slots(9):
+            with q.trial(player, (orient, coord)) as result:
+                if result is True:
+                    expected.append((orient, coord))
+        self.assertEqual(q.legal_fences(player), expected)
+        self.assertEqual(q.get_hash(), q._QuoridorGame__full_hash())
+
+    def test_legality_cache(self):
+        """Test that repeated legality checks in one position are answered from the cache until the position
+        changes."""
+        q = QuoridorGame(FlatBoard)
+        q.change_pawn_loc((0, 0), (4, 8))
+        q.place_fence(1, 'v', (1, 0))
+        q.move_pawn(2, (4, 7))
+
+        # the same illegal pawn move and unfair fence, twice each
+        for n in range(2):
+            self.assertEqual(q.move_pawn(1, (1, 0)), False)
+            self.assertEqual(q.place_fence(1, 'h', (0, 1)), "breaks the fair play rule")
+        self.assertEqual(q.get_cache_stats()["hits"], 2)
+
+        # the fence list is reused, and copied so changing it doesn't change the cache
+        fences = q.legal_fences(1)
+        fences.clear()
+        self.assertEqual(len(q.legal_fences(2)), len(q.legal_fences(1)))
+        self.assertNotIn(('h', (0, 1)), q.legal_fences(1))
+        self.assertEqual(q.get_cache_stats()["hits"], 5)
+
+        # a move starts a new position
+        self.assertEqual(q.move_pawn(1, (0, 1)), True)
+        q.pop_move()
+        self.assertEqual(q.move_pawn(1, (1, 0)), False)
+        self.assertEqual(q.get_cache_stats()["hits"], 5)
+        self.assertEqual(q.get_cache_stats()["entries"], 1)
+
+        # the oldest entries are dropped once the cache is full
+        q._cache_size = 3
+        for col in range(2, 6):
+            q.move_pawn(1, (col, 0))
+        self.assertEqual(q.get_cache_stats()["entries"], 3)
+        self.assertEqual(q.move_pawn(1, (5, 0)), False)
+        self.assertEqual(q.get_cache_stats()["hits"], 6)
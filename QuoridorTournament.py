@@ -0,0 +1,289 @@
+# Author: Christopher Felt
+# Date: 10/18/2026
+#
+# Description: Tournament runner for matches between Quoridor bots. An engine is anything with a choose_move method
+# that takes a QuoridorGame and returns a move for push_move, like the bots in the QuoridorSearch and QuoridorMCTS
+# programs, and is named in ENGINES with a function that makes one from a per-move time limit in milliseconds and a
+# random.Random object. Add an entry to ENGINES to enter a new bot.
+#
+# round_robin and gauntlet schedule the games, with each pair of engines swapping colors from one game to the next.
+# run_tournament plays them across a process pool, one game per task. Every game makes new engines in its worker, so
+# games share nothing and the games per hour grow with the number of workers up to the number of cores. A move that
+# takes more than the time limit plus time_margin milliseconds loses the game on time, and a move that isn't legal
+# loses it too. The time is checked once the engine's choose_move returns: a slow move isn't cut short, so an engine
+# has to keep to its own time limit, and one that never returns holds up its worker. Each game is written to the
+# results file as one line of JSON as soon as it finishes, so the results so far survive a tournament that is stopped.
+# Games are seeded from the seed passed and the game number, so the same seed plays the same games whatever the number
+# of workers, apart from bots whose moves depend on the time they get.
+#
+# elo_ratings fits a rating to each engine from the results (a Bradley-Terry model, counting a draw as half a win for
+# each side) with the mean rating at 0, and gives a 95% confidence interval from the spread of each engine's scores.
+#
+# Run this file as a script to play a tournament, e.g.: python QuoridorTournament.py results.jsonl greedy alphabeta
+# alphabeta-pruned --games 20 --time-limit 200 --workers 4
+
+# import modules
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from Quoridor import QuoridorGame, FlatBoard, to_notation
+from QuoridorSearch import AlphaBetaPlayer
+from QuoridorMCTS import MCTSPlayer
+from QuoridorEval import Evaluator
+from QuoridorPolicy import RandomPlayer, GREEDY_CHANCE, MAX_PLIES, play_moves
+import argparse
+import json
+import math
+import os
+import random
+import time
+
+TIME_MARGIN = 100  # milliseconds a move may run over the time limit before it loses on time
+PRIOR_DRAWS = 1  # virtual draws added between each pair of engines that played, so that no rating is infinite
+Z_95 = 1.96  # standard normal quantile of a 95% confidence interval
+
+# function that makes each engine from a per-move time limit in milliseconds and a random.Random object
+ENGINES = {"random": lambda time_limit, rand: RandomPlayer(rand),
+           "greedy": lambda time_limit, rand: RandomPlayer(rand, GREEDY_CHANCE),
+           "alphabeta": lambda time_limit, rand: AlphaBetaPlayer(time_limit),
+           "alphabeta-pruned": lambda time_limit, rand: AlphaBetaPlayer(time_limit, prune_fences=True),
+           "alphabeta-eval": lambda time_limit, rand: AlphaBetaPlayer(time_limit, evaluate=Evaluator().evaluate),
+           "mcts": lambda time_limit, rand: MCTSPlayer(time_limit, seed=rand.getrandbits(32))}
+
+
+def round_robin(names, games_per_pair):
+    """Given a list of engine names and a number of games, returns a list of (player 1, player 2) name tuples with that
+    many games between every pair of engines. The engine listed first in a pair plays first in even games."""
+    return [(first, second) if n % 2 == 0 else (second, first)
+            for index, first in enumerate(names) for second in names[index + 1:] for n in range(games_per_pair)]
+
+
+def gauntlet(challenger, opponents, games_per_pair):
+    """Given an engine name, a list of opponent names, and a number of games, returns a list of (player 1, player 2)
+    name tuples with that many games between the challenger and each opponent, the challenger playing first in even
+    games. The opponents don't play each other."""
+    return [(challenger, opponent) if n % 2 == 0 else (opponent, challenger)
+            for opponent in opponents for n in range(games_per_pair)]
+
+
+class TimedPlayer:
+    """Represents an engine playing under a per-move time limit in milliseconds. Its choose_move times the engine's
+    and returns None instead of the move if it took longer than the limit, which ends the game with this player to
+    move. The time is only checked after the engine's choose_move returns."""
+    # initialize data members
+    def __init__(self, engine, limit):
+        self._engine = engine  # player being timed
+        self._limit = limit  # milliseconds a move may take
+        self._slowest = 0.0  # milliseconds taken by the slowest move
+        self._timed_out = False  # whether a move took longer than the limit
+
+    def choose_move(self, game):
+        """Given a QuoridorGame object, returns the engine's move, or None if it took longer than the time limit."""
+        start = time.perf_counter()
+        move = self._engine.choose_move(game)
+        elapsed = (time.perf_counter() - start) * 1000
+        self._slowest = max(self._slowest, elapsed)
+
+        if elapsed > self._limit:
+            self._timed_out = True
+            return None
+
+        return move
+
+    def get_slowest(self):
+        """Takes no parameters and returns the milliseconds taken by the engine's slowest move."""
+        return self._slowest
+
+    def is_timed_out(self):
+        """Takes no parameters and returns True if a move took longer than the time limit. Otherwise returns False."""
+        return self._timed_out
+
+    def close(self):
+        """Takes no parameters. Closes the engine, if it has a close method (e.g., to stop a process pool). Returns
+        nothing."""
+        if hasattr(self._engine, "close"):
+            self._engine.close()
+
+
+def game_ending(game, players, plies):
+    """Given a finished QuoridorGame object, a list of the TimedPlayer of player 1 and player 2, and the number of moves
+    made, returns a tuple of the winner (0 for a draw) and how the game ended: "goal" if a pawn reached its goal row,
+    "draw" after MAX_PLIES moves, and otherwise "time" or "illegal" for a loss of the player to move, who didn't make a
+    move in time or made one that isn't legal."""
+    for player in (1, 2):
+        if game.is_winner(player):
+            return player, "goal"
+    if plies == MAX_PLIES:
+        return 0, "draw"
+
+    loser = game.get_turn()
+    return 3 - loser, "time" if players[loser - 1].is_timed_out() else "illegal"
+
+
+def play_match(number, names, time_limit, time_margin, seed):
+    """Given a game number, a tuple of the engine names of player 1 and player 2, a per-move time limit and time margin
+    in milliseconds, and a seed, makes the engines and plays a game between them. Returns a dictionary of the game
+    number, the names, the winner (0 for a draw), how the game ended (see game_ending), the moves in move notation
+    separated by spaces, and the slowest move of each player in milliseconds."""
+    rand = random.Random("%d:%d" % (seed, number))  # same games for the same seed, in any process
+    players = [TimedPlayer(ENGINES[name](time_limit, rand), time_limit + time_margin) for name in names]
+    game = QuoridorGame(FlatBoard)
+    moves = [to_notation(move) for player, move in play_moves(game, players)]
+
+    for player in players:
+        player.close()
+
+    winner, ending = game_ending(game, players, len(moves))
+    return {"game": number, "players": list(names), "winner": winner, "ending": ending, "moves": " ".join(moves),
+            "slowest_ms": [round(player.get_slowest(), 1) for player in players]}
+
+
+def run_tournament(pairings, path, time_limit=100, workers=1, seed=0, time_margin=TIME_MARGIN):
+    """Given a list of (player 1, player 2) engine name tuples, the path of a results file, and optionally the per-move
+    time limit in milliseconds, the number of worker processes, a seed, and the time margin in milliseconds, plays a
+    game for each pairing and writes each game's result to the file as a line of JSON as soon as it finishes, in the
+    order the games finish. Returns a list of the results in game order, as returned by play_match. Raises ValueError
+    if an engine name isn't in ENGINES."""
+    for name in {name for pairing in pairings for name in pairing}:
+        if name not in ENGINES:
+            raise ValueError("unknown engine: %s" % name)
+
+    tasks = [(number, tuple(names), time_limit, time_margin, seed) for number, names in enumerate(pairings, 1)]
+    results = []
+
+    with open(path, "w") as file:
+        if workers == 1:
+            finished = (play_match(*task) for task in tasks)
+        else:
+            pool = ProcessPoolExecutor(workers)
+            finished = (future.result() for future in as_completed([pool.submit(play_match, *task) for task in tasks]))
+
+        try:
+            for result in finished:
+                file.write(json.dumps(result) + "\n")
+                file.flush()
+                results.append(result)
+        finally:
+            if workers != 1:
+                pool.shutdown(cancel_futures=True)
+
+    return sorted(results, key=lambda result: result["game"])
+
+
+def read_results(path):
+    """Given the path of a results file written by run_tournament, returns a list of the results in it, in game
+    order."""
+    with open(path) as file:
+        return sorted((json.loads(line) for line in file if line.strip()), key=lambda result: result["game"])
+
+
+def elo_difference(score):
+    """Given the expected score of one player against another (0 to 1, a draw counting as half), returns the
+    difference of their Elo ratings. Returns infinity or minus infinity for a score of 1 or 0."""
+    if score <= 0 or score >= 1:
+        return math.copysign(math.inf, score - 0.5)
+
+    return -400 * math.log10(1 / score - 1)
+
+
+def score_table(results):
+    """Given a list of game results, returns a dictionary with an entry for each engine: a dictionary of the points it
+    scored against each opponent and a dictionary of the games it played against each opponent."""
+    table = {}
+    for result in results:
+        for player, (name, opponent) in enumerate((result["players"], result["players"][::-1]), 1):
+            points, games = table.setdefault(name, ({}, {}))
+            points[opponent] = points.get(opponent, 0) + (0.5 if result["winner"] == 0 else result["winner"] == player)
+            games[opponent] = games.get(opponent, 0) + 1
+
+    return table
+
+
+def fit_strengths(table, iterations=1000, tolerance=1e-10):
+    """Given a score table as returned by score_table, returns a dictionary of the Bradley-Terry strength of each
+    engine, the strength of a player divided by the sum of the strengths of both players being its expected score.
+    PRIOR_DRAWS virtual draws are added between every pair that played. Fitted with minorization-maximization
+    updates until no strength changes by more than the tolerance."""
+    strengths = {name: 1.0 for name in table}
+    for iteration in range(iterations):
+        updated = {}
+        for name, (points, games) in table.items():
+            wins = sum(points.values()) + PRIOR_DRAWS * len(games) / 2
+            updated[name] = wins / sum((games[opponent] + PRIOR_DRAWS) / (strengths[name] + strengths[opponent])
+                                       for opponent in games)
+
+        # scale so the mean rating is 0
+        scale = math.exp(sum(math.log(strength) for strength in updated.values()) / len(updated))
+        updated = {name: strength / scale for name, strength in updated.items()}
+        change = max(abs(updated[name] - strengths[name]) for name in table)
+        strengths = updated
+        if change < tolerance:
+            break
+
+    return strengths
+
+
+def elo_ratings(results):
+    """Given a list of game results, returns a dictionary with a dictionary for each engine of its games, wins, draws,
+    losses, Elo rating, and the low and high ends of the 95% confidence interval of the rating. The interval is the
+    rating plus the Elo difference of the engine's score (with the prior draws) moved by Z_95 standard errors either
+    way, less the Elo difference of the score itself."""
+    table = score_table(results)
+    strengths = fit_strengths(table)
+    ratings = {}
+
+    for name, (points, games) in table.items():
+        count = sum(games.values())
+        outcomes = [0.5 if result["winner"] == 0 else float(result["players"][result["winner"] - 1] == name)
+                    for result in results if name in result["players"]]
+        outcomes += [0.5] * (PRIOR_DRAWS * len(games))
+        score = sum(outcomes) / len(outcomes)
+        error = math.sqrt(sum((outcome - score) ** 2 for outcome in outcomes) / len(outcomes) / len(outcomes))
+        rating = 400 * math.log10(strengths[name])
+
+        low, high = (rating + elo_difference(score + sign * Z_95 * error) - elo_difference(score) for sign in (-1, 1))
+        wins = sum(outcome == 1 for outcome in outcomes[:count])
+        draws = sum(outcome == 0.5 for outcome in outcomes[:count])
+        ratings[name] = {"games": count, "wins": wins, "draws": draws, "losses": count - wins - draws,
+                         "elo": rating, "low": low, "high": high}
+
+    return ratings
+
+
+def print_ratings(ratings):
+    """Given a dictionary of ratings as returned by elo_ratings, prints a table of the engines from highest rated to
+    lowest. Returns nothing."""
+    print("%-18s %6s %5s %5s %5s %7s %17s" % ("engine", "games", "wins", "draws", "loss", "elo", "95% interval"))
+    for name in sorted(ratings, key=lambda name: -ratings[name]["elo"]):
+        entry = ratings[name]
+        print("%-18s %6d %5d %5d %5d %+7.0f [%+7.0f, %+7.0f]" % (name, entry["games"], entry["wins"], entry["draws"],
+                                                               entry["losses"], entry["elo"], entry["low"],
+                                                               entry["high"]))
+
+
+# define main function
+def main():
+    """Plays a round robin, or a gauntlet of the first engine against the others, with the options given on the command
+    line, and prints the games per hour and the ratings."""
+    parser = argparse.ArgumentParser(description="Play a Quoridor tournament between bots.")
+    parser.add_argument("path", help="results file, one line of JSON per game")
+    parser.add_argument("engines", nargs="+", choices=sorted(ENGINES), help="engines to enter")
+    parser.add_argument("--games", type=int, default=10, help="games between each pair of engines (default 10)")
+    parser.add_argument("--gauntlet", action="store_true", help="play only the first engine against each other one")
+    parser.add_argument("--time-limit", type=int, default=100, help="milliseconds per move (default 100)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="worker processes (default: all CPUs)")
+    parser.add_argument("--seed", type=int, default=0, help="random seed (default 0)")
+    args = parser.parse_args()
+
+    if args.gauntlet:
+        pairings = gauntlet(args.engines[0], args.engines[1:], args.games)
+    else:
+        pairings = round_robin(args.engines, args.games)
+
+    start = time.perf_counter()
+    results = run_tournament(pairings, args.path, args.time_limit, args.workers, args.seed)
+    print("%d games, %.0f games/hour" % (len(results), len(results) * 3600 / (time.perf_counter() - start)))
+    print_ratings(elo_ratings(results))
+
+
+# run main function if run as script
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+# Author: Christopher Felt
+# Date: 10/18/2026
+#
+# Description: Unit test program for testing the QuoridorTournament program. Checks the schedules, that the results
+# file holds every game as a legal game, that slow moves lose on time, and the Elo ratings.
+
+# import modules
+from QuoridorTournament import ENGINES, round_robin, gauntlet, run_tournament, read_results, elo_difference, \
+    elo_ratings
+from QuoridorPolicy import RandomPlayer, GREEDY_CHANCE
+from QuoridorReplay import replay_moves
+from Quoridor import QuoridorGame
+from unittest import mock
+import os
+import tempfile
+import time
+import unittest
+
+
+def without_times(results):
+    """Given a list of game results, returns them without the slowest move times, which differ from run to run."""
+    return [dict(result, slowest_ms=None) for result in results]
+
+
+SLOW_MS = 100  # milliseconds the slow player takes over a move, well over the time limit and margin of test_time_limit
+
+
+class SlowPlayer(RandomPlayer):
+    """Represents a greedy policy that takes SLOW_MS milliseconds over every move."""
+
+    def choose_move(self, game):
+        """Given a QuoridorGame object, waits SLOW_MS milliseconds and returns a greedy policy move."""
+        time.sleep(SLOW_MS / 1000)
+        return super().choose_move(game)
+
+
+class UnitTests(unittest.TestCase):
+    """Class for testing the QuoridorTournament program. Inherits from Unit test."""
+
+    def test_schedules(self):
+        """Test that every pair plays the number of games asked for, with colors alternating."""
+        pairings = round_robin(["a", "b", "c"], 2)
+        self.assertEqual(pairings, [("a", "b"), ("b", "a"), ("a", "c"), ("c", "a"), ("b", "c"), ("c", "b")])
+        self.assertEqual(gauntlet("a", ["b", "c"], 3), [("a", "b"), ("b", "a"), ("a", "b"), ("a", "c"), ("c", "a"),
+                                                        ("a", "c")])
+
+    def test_run_tournament(self):
+        """Test that every game is written to the results file and replays to its result, and that the same seed plays
+        the same games with one worker and with a process pool."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "results.jsonl")
+            results = run_tournament(round_robin(["random", "greedy"], 4), path, seed=3)
+            self.assertEqual(read_results(path), results)
+            pooled = run_tournament(round_robin(["random", "greedy"], 4), path, workers=2, seed=3)
+
+            with self.assertRaises(ValueError):
+                run_tournament([("greedy", "minimax")], path)
+
+        self.assertEqual(without_times(pooled), without_times(results))
+        self.assertEqual([result["game"] for result in results], [1, 2, 3, 4])
+        for result in results:
+            game = QuoridorGame()
+            self.assertTrue(all(event[3] is True for event in replay_moves(game, result["moves"].split())))
+            if result["ending"] == "goal":
+                self.assertEqual(game.is_winner(result["winner"]), True)
+
+    def test_time_limit(self):
+        """Test that a move over the time limit and margin loses the game on time, and that moves within them don't."""
+        with tempfile.TemporaryDirectory() as directory, \
+                mock.patch.dict(ENGINES, {"slow": lambda time_limit, rand: SlowPlayer(rand, GREEDY_CHANCE)}):
+            path = os.path.join(directory, "results.jsonl")
+            slow = run_tournament([("greedy", "slow")], path, time_limit=20, time_margin=30)[0]
+            fast = run_tournament([("greedy", "greedy")], path, time_limit=20, time_margin=30)[0]
+
+        self.assertEqual((slow["winner"], slow["ending"], len(slow["moves"].split())), (1, "time", 1))
+        self.assertGreater(slow["slowest_ms"][1], 50)
+        self.assertEqual(fast["ending"], "goal")
+        self.assertLess(max(fast["slowest_ms"]), 50)
+
+    def test_elo_ratings(self):
+        """Test the Elo difference of known scores and the ratings of a short match."""
+        self.assertEqual(elo_difference(0.5), 0)
+        self.assertAlmostEqual(elo_difference(10 / 11), 400)
+        self.assertEqual(elo_difference(1.0), float("inf"))
+
+        # a wins 3 of 4 games against b, and draws 1
+        results = [{"players": ["a", "b"], "winner": 1}, {"players": ["b", "a"], "winner": 2},
+                   {"players": ["a", "b"], "winner": 1}, {"players": ["b", "a"], "winner": 0}]
+        ratings = elo_ratings(results)
+        self.assertEqual((ratings["a"]["wins"], ratings["a"]["draws"], ratings["b"]["losses"]), (3, 1, 3))
+        self.assertAlmostEqual(ratings["a"]["elo"], -ratings["b"]["elo"])
+        self.assertAlmostEqual(ratings["a"]["elo"] - ratings["b"]["elo"], elo_difference(4 / 5))  # with 1 prior draw
+        self.assertLess(ratings["a"]["low"], ratings["a"]["elo"])
+        self.assertGreater(ratings["a"]["high"], ratings["a"]["elo"])